@@ -0,0 +1,386 @@
+"""Serialization throughput benchmarks
+
+Run from the root of the repository:
+
+    python -m benchmarks.run --sizes 1000 10000 --output results.json
+    python -m benchmarks.run --compare results.json
+
+Every scenario runs on a fresh in-memory SQLite database filled with the
+models of `tests/models.py`. Each measure is made twice: once for the
+timing and the query count, once under `tracemalloc` for the peak memory
+(tracing slows everything down).
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Awaitable, Callable
+
+from tortoise import Tortoise, connections
+
+from tests.models import Book, BookShelf, Node, Person
+from tortoise_serializer import ModelSerializer, Serializer, resolver
+from tortoise_serializer.testing import capture_queries
+from tortoise_serializer.types import ContextType
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+BULK_BATCH_SIZE = 1_000
+BOOKS_PER_SHELF = 100
+BORROWS_PER_PERSON = 10
+NODE_CHILDREN = 10
+
+
+class FlatBookSerializer(ModelSerializer[Book]):
+    id: int
+    title: str
+    page_count: int | None
+    price: float | None
+
+
+class ShelfNameSerializer(ModelSerializer[BookShelf]):
+    id: int | None
+    name: str
+
+
+class BookSerializer(ModelSerializer[Book]):
+    id: int | None
+    title: str
+    price: float | None
+    shelf: ShelfNameSerializer | None
+
+
+class BookTitleSerializer(ModelSerializer[Book]):
+    id: int
+    title: str
+
+
+class ShelfSerializer(ModelSerializer[BookShelf]):
+    id: int
+    name: str
+    books: list[BookTitleSerializer]
+
+
+class PersonSerializer(ModelSerializer[Person]):
+    id: int
+    name: str
+    borrows: list[BookTitleSerializer]
+
+
+class NodeSerializer(ModelSerializer[Node]):
+    id: int
+    name: str
+    children: list["NodeSerializer"]
+
+
+class BookWithResolverSerializer(ModelSerializer[Book]):
+    id: int
+    title: str
+    label: str
+
+    @resolver("label")
+    def resolve_label(cls, instance: Book, context: ContextType) -> str:
+        return instance.title.upper()
+
+
+@dataclass
+class Result:
+    scenario: str
+    variant: str
+    size: int
+    # serialized (or created) objects, nested ones included
+    rows: int
+    seconds: float
+    rows_per_second: float
+    queries: int
+    peak_memory_bytes: int
+
+
+async def populate(size: int) -> None:
+    """Fill the database with `size` books, nodes and borrows"""
+    shelves = [
+        BookShelf(id=index + 1, name=f"shelf {index}")
+        for index in range(max(size // BOOKS_PER_SHELF, 1))
+    ]
+    await BookShelf.bulk_create(shelves, batch_size=BULK_BATCH_SIZE)
+    await Book.bulk_create(
+        [
+            Book(
+                id=index + 1,
+                title=f"book {index}",
+                shelf_id=shelves[index % len(shelves)].id,
+                page_count=index % 500,
+                price=index / 100,
+            )
+            for index in range(size)
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+    persons_count = max(size // BORROWS_PER_PERSON, 1)
+    await Person.bulk_create(
+        [
+            Person(id=index + 1, name=f"person {index}")
+            for index in range(persons_count)
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
+    through = Person._meta.fields_map["borrows"]
+    await connections.get("default").execute_many(
+        f'INSERT INTO "{through.through}" '
+        f'("{through.backward_key}", "{through.forward_key}") VALUES (?, ?)',
+        [
+            [index % persons_count + 1, index + 1]
+            for index in range(min(size, persons_count * BORROWS_PER_PERSON))
+        ],
+    )
+
+    # a tree of `size` nodes, each one having NODE_CHILDREN children
+    await Node.bulk_create(
+        [
+            Node(
+                id=index + 1,
+                name=f"node {index}",
+                parent_id=(index - 1) // NODE_CHILDREN + 1 if index else None,
+            )
+            for index in range(size)
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+
+async def clear() -> None:
+    for model in Tortoise.apps["models"].values():
+        await model.all().delete()
+
+
+async def measure(
+    scenario: str,
+    variant: str,
+    size: int,
+    run: Callable[[], Awaitable[Any]],
+) -> Result:
+    """Run `run` twice: for the timing and the queries, then for the peak
+    memory. It returns the serializers it built or how many objects it
+    created."""
+    with capture_queries() as queries:
+        start = time.perf_counter()
+        output = await run()
+        seconds = time.perf_counter() - start
+    rows = output if isinstance(output, int) else count_objects(output)
+    del output
+
+    tracemalloc.start()
+    try:
+        await run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        scenario=scenario,
+        variant=variant,
+        size=size,
+        rows=rows,
+        seconds=seconds,
+        rows_per_second=rows / seconds if seconds else 0.0,
+        queries=len(queries),
+        peak_memory_bytes=peak,
+    )
+
+
+def count_objects(value: Any) -> int:
+    """Count the serializers in `value`, nested ones included"""
+    if isinstance(value, list):
+        return sum(count_objects(item) for item in value)
+    if not isinstance(value, Serializer):
+        return 0
+    return 1 + sum(
+        count_objects(getattr(value, field_name))
+        for field_name in type(value).model_fields
+    )
+
+
+def serialize_queryset(
+    serializer: type[ModelSerializer], queryset_factory, **kwargs: Any
+) -> Callable[[], Awaitable[list[Serializer]]]:
+    async def run() -> list[Serializer]:
+        return await serializer.from_queryset(queryset_factory(), **kwargs)
+
+    return run
+
+
+QUERYSET_VARIANTS: dict[str, dict[str, bool]] = {
+    "plain": {},
+    "select_only": {"select_only": True},
+    "prefetch": {"prefetch": True},
+    "prefetch+select_only": {"prefetch": True, "select_only": True},
+}
+
+
+async def run_size(size: int) -> list[Result]:
+    await populate(size)
+    results = []
+    scenarios: list[tuple[str, type[ModelSerializer], Callable[[], Any]]] = [
+        ("flat_books", FlatBookSerializer, Book.all),
+        ("books_with_resolver", BookWithResolverSerializer, Book.all),
+        ("books_with_shelf", BookSerializer, Book.all),
+        ("shelves_with_books", ShelfSerializer, BookShelf.all),
+        ("persons_with_borrows", PersonSerializer, Person.all),
+        (
+            "node_tree",
+            NodeSerializer,
+            lambda: Node.filter(parent_id=None),
+        ),
+    ]
+    for scenario, serializer, queryset_factory in scenarios:
+        for variant, options in QUERYSET_VARIANTS.items():
+            results.append(
+                await measure(
+                    scenario,
+                    variant,
+                    size,
+                    serialize_queryset(
+                        serializer, queryset_factory, **options
+                    ),
+                )
+            )
+            print(format_result(results[-1]), flush=True)
+
+    # the books created by the first run are deleted before the second one
+    creations = max(size // 10, 1)
+
+    async def create() -> int:
+        await Book.filter(title__startswith="created").delete()
+        await BookShelf.filter(name__startswith="created").delete()
+        for index in range(creations):
+            await BookSerializer(
+                id=size + index + 1,
+                title=f"created {index}",
+                price=None,
+                shelf=ShelfNameSerializer(
+                    id=size + index + 1, name=f"created {index}"
+                ),
+            ).create_tortoise_instance()
+        return creations
+
+    results.append(
+        await measure("create_tortoise_instance", "nested", size, create)
+    )
+    print(format_result(results[-1]), flush=True)
+
+    async def bulk_create() -> int:
+        await Book.filter(title__startswith="created").delete()
+        await BookShelf.filter(name__startswith="created").delete()
+        await BookSerializer.create_tortoise_instances(
+            [
+                BookSerializer(
+                    id=None,
+                    title=f"created {index}",
+                    price=None,
+                    shelf=ShelfNameSerializer(
+                        id=None, name=f"created {index}"
+                    ),
+                )
+                for index in range(creations)
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+        return creations
+
+    results.append(
+        await measure("create_tortoise_instances", "nested", size, bulk_create)
+    )
+    print(format_result(results[-1]), flush=True)
+    await clear()
+    return results
+
+
+def format_result(result: Result) -> str:
+    return (
+        f"{result.scenario:<26} {result.variant:<22} {result.size:>8} "
+        f"{result.rows_per_second:>12.0f} rows/s {result.queries:>6} queries "
+        f"{result.peak_memory_bytes / 2**20:>9.1f} MiB"
+    )
+
+
+def get_version(package: str) -> str:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+async def run(sizes: list[int]) -> dict[str, Any]:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": ["tests.models"]}
+    )
+    try:
+        await Tortoise.generate_schemas()
+        results = []
+        for size in sizes:
+            results.extend(await run_size(size))
+    finally:
+        await Tortoise.close_connections()
+    return {
+        "versions": {
+            "tortoise-serializer": get_version("tortoise-serializer"),
+            "tortoise-orm": get_version("tortoise-orm"),
+            "pydantic": get_version("pydantic"),
+            "python": platform.python_version(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> None:
+    """Print the throughput ratio and query count changes of `current`
+    against `baseline`"""
+    previous = {
+        (result["scenario"], result["variant"], result["size"]): result
+        for result in baseline["results"]
+    }
+    for result in current["results"]:
+        key = (result["scenario"], result["variant"], result["size"])
+        if key not in previous:
+            continue
+        old = previous[key]
+        ratio = (
+            result["rows_per_second"] / old["rows_per_second"]
+            if old["rows_per_second"]
+            else 0.0
+        )
+        print(
+            f"{key[0]:<26} {key[1]:<22} {key[2]:>8} "
+            f"x{ratio:>6.2f} throughput, "
+            f"queries {old['queries']} -> {result['queries']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES)
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--compare", help="JSON file of a previous run to compare with"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.sizes))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(json.load(baseline), results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
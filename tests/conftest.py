@@ -1,6 +1,20 @@
+from typing import Generator
+
 import pytest
+from pytest_asyncio import is_async_test
 from tortoise import Tortoise
 
+from tortoise_serializer.testing import QueryCapture, capture_queries
+
+
+def pytest_collection_modifyitems(items):
+    # the tortoise connection is shared by the whole session: its lock must
+    # not see the tests running in different event loops
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
 
 @pytest.fixture(scope="session")
 def tortoise_config():
@@ -39,3 +53,10 @@ async def cleanup_db():
     """
     for model in Tortoise.apps.get("models").values():
         await model.all().delete()
+
+
+@pytest.fixture
+def queries() -> Generator[QueryCapture, None, None]:
+    """Record the SQL queries run through the default connection"""
+    with capture_queries() as capture:
+        yield capture
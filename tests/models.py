@@ -20,6 +20,10 @@ class BookShelf(Model):
     name = fields.CharField(unique=True, max_length=200)
     books: BackwardFKRelation[Book]
 
+    @property
+    def upper_name(self) -> str:
+        return self.name.upper()
+
 
 class Location(Model):
     id = fields.IntField(primary_key=True)
@@ -7,9 +7,14 @@ from tests.models import Book, BookShelf, Person
 from tortoise_serializer import (
     ContextType,
     Serializer,
+    batch_resolver,
+    memoize,
     require_condition_or_unset,
     resolver,
 )
+from tortoise_serializer.exceptions import TortoiseSerializerException
+from tortoise_serializer.session import BatchLoader, serialization_session
+from tortoise_serializer.testing import QueryCapture
 
 
 async def test_book_serialization():
@@ -100,6 +105,62 @@ async def test_instance_update():
     assert book.shelf_id == shelf.id
 
 
+async def test_instance_update_changed_fields():
+    class UpdateSerializer(Serializer):
+        title: str | None = None
+        price: float | None = None
+        shelf: Any = None
+
+    shelf = await BookShelf.create(name="Testing")
+    book = await Book.create(title="test title", price=10)
+    serializer = UpdateSerializer(title="test title", price=12, shelf=shelf)
+    assert serializer.partial_update_tortoise_instance(book) == {
+        "price",
+        "shelf_id",
+    }
+    await book.save(update_fields=["price", "shelf_id"])
+    book = await Book.get(id=book.id)
+    assert book.price == 12
+    assert book.shelf_id == shelf.id
+    assert (
+        UpdateSerializer(price=12).partial_update_tortoise_instance(book)
+        == set()
+    )
+
+
+async def test_bulk_partial_update(queries: QueryCapture):
+    class UpdateSerializer(Serializer):
+        title: str | None = None
+        price: float | None = None
+
+    books = [
+        await Book.create(title=f"book {index}", price=index)
+        for index in range(6)
+    ]
+    updates = [
+        (UpdateSerializer(price=100), books[0]),
+        (UpdateSerializer(price=101), books[1]),
+        (UpdateSerializer(title="new title", price=2), books[2]),
+        (UpdateSerializer(title="book 3", price=3), books[3]),
+        (UpdateSerializer(title="other title"), books[4]),
+    ]
+    queries.clear()
+    changes = await Serializer.bulk_partial_update_tortoise_instances(updates)
+    assert changes == [{"price"}, {"price"}, {"title"}, set(), {"title"}]
+    # a single query per set of changed fields
+    assert len(queries) == 2
+    assert [
+        (book.title, book.price) for book in await Book.all().order_by("id")
+    ] == [
+        ("book 0", 100),
+        ("book 1", 101),
+        ("new title", 2),
+        ("book 3", 3),
+        ("other title", 4),
+        ("book 5", 5),
+    ]
+
+
 async def test_instance_creation():
     class BookCreationSerializer(Serializer):
         title: str
@@ -324,3 +385,401 @@ async def test_resolver_decorator():
     assert serializer.discount == 0.15
     assert serializer.title == "Testing With Title"
     assert serializer.margin is None
+
+
+async def test_from_queryset_batch_fetch_relations(queries: QueryCapture):
+    class ShelfSerializer(Serializer):
+        name: str
+
+    class BookSerializer(Serializer):
+        title: str
+        shelf: ShelfSerializer | None
+
+    class PersonSerializer(Serializer):
+        name: str
+        borrows: list[BookSerializer]
+
+    shelves = [
+        await BookShelf.create(name="Fantasy"),
+        await BookShelf.create(name="Horror"),
+    ]
+    persons = [await Person.create(name=f"Person {i}") for i in range(5)]
+    for index, person in enumerate(persons):
+        await person.borrows.add(
+            await Book.create(title=f"Book {index}", shelf=shelves[index % 2]),
+            await Book.create(title=f"Orphan {index}"),
+        )
+
+    queries.clear()
+    serializers = await PersonSerializer.from_queryset(Person.all())
+    # persons + borrows + shelves, whatever the number of rows
+    assert len(queries) == 3
+    assert len(serializers) == len(persons)
+    for index, serializer in enumerate(serializers):
+        assert {book.title for book in serializer.borrows} == {
+            f"Book {index}",
+            f"Orphan {index}",
+        }
+        for book in serializer.borrows:
+            if book.title.startswith("Book"):
+                assert book.shelf.name == shelves[index % 2].name
+            else:
+                assert book.shelf is None
+
+
+async def test_from_tortoise_instances_batch_fetch_reverse_relations(
+    queries: QueryCapture,
+):
+    class BookSerializer(Serializer):
+        title: str
+
+    class ShelfSerializer(Serializer):
+        name: str
+        books: list[BookSerializer]
+
+    for name in ("A", "B", "C"):
+        shelf = await BookShelf.create(name=name)
+        await Book.create(title=f"{name}1", shelf=shelf)
+        await Book.create(title=f"{name}2", shelf=shelf)
+
+    shelves = await BookShelf.all().order_by("name")
+    queries.clear()
+    serializers = await ShelfSerializer.from_tortoise_instances(shelves)
+    assert len(queries) == 1
+    assert [len(shelf.books) for shelf in serializers] == [2, 2, 2]
+
+
+async def test_batch_resolver():
+    calls: list[list[str]] = []
+
+    class BookSerializer(Serializer):
+        title: str
+        upper_title: str
+        title_length: int
+
+        @batch_resolver("upper_title")
+        async def _upper_titles(
+            cls, instances: list[Book], context: ContextType
+        ) -> list[str]:
+            calls.append([book.title for book in instances])
+            return [book.title.upper() for book in instances]
+
+        @batch_resolver("title_length")
+        def _title_lengths(
+            cls, instances: list[Book], context: ContextType
+        ) -> dict[int, int]:
+            return {book.id: len(book.title) for book in instances}
+
+    await Book.bulk_create([Book(title=title) for title in ("a", "bb", "cc")])
+    serializers = await BookSerializer.from_queryset(Book.all())
+    assert calls == [["a", "bb", "cc"]]
+    assert [serializer.upper_title for serializer in serializers] == [
+        "A",
+        "BB",
+        "CC",
+    ]
+    assert [serializer.title_length for serializer in serializers] == [
+        1,
+        2,
+        2,
+    ]
+
+
+async def test_batch_loader_with_wrong_number_of_values():
+    async def load_titles(instances: list[Book]) -> list[str]:
+        return ["too", "many", "titles"]
+
+    loader = BatchLoader(load_titles)
+    with pytest.raises(TortoiseSerializerException):
+        await asyncio.wait_for(loader.load(Book(title="a")), timeout=1)
+
+
+async def test_batch_loader_cancelled():
+    started = asyncio.Event()
+
+    async def load_titles(instances: list[Book]) -> list[str]:
+        started.set()
+        await asyncio.sleep(10)
+        return [instance.title for instance in instances]
+
+    loader = BatchLoader(load_titles)
+    future = loader.load(Book(title="a"))
+    await started.wait()
+    for task in loader._tasks:
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(future, timeout=1)
+
+
+async def test_batch_resolver_coalesce_nested_serializers():
+    calls: list[int] = []
+
+    class BookSerializer(Serializer):
+        title: str
+        borrowed: bool
+
+        @batch_resolver("borrowed")
+        async def _borrowed(
+            cls, instances: list[Book], context: ContextType
+        ) -> dict[int, bool]:
+            calls.append(len(instances))
+            borrowed_ids = set(
+                await Person.filter(
+                    borrows__id__in=[book.id for book in instances]
+                ).values_list("borrows__id", flat=True)
+            )
+            return {book.id: book.id in borrowed_ids for book in instances}
+
+    class ShelfSerializer(Serializer):
+        name: str
+        books: list[BookSerializer]
+
+    person = await Person.create(name="Alice")
+    for name in ("A", "B", "C"):
+        shelf = await BookShelf.create(name=name)
+        await person.borrows.add(
+            await Book.create(title=f"{name}1", shelf=shelf)
+        )
+        await Book.create(title=f"{name}2", shelf=shelf)
+
+    serializers = await ShelfSerializer.from_queryset(
+        BookShelf.all().order_by("name")
+    )
+    # one call for the books of all the shelves
+    assert calls == [6]
+    for shelf in serializers:
+        assert {book.title: book.borrowed for book in shelf.books} == {
+            f"{shelf.name}1": True,
+            f"{shelf.name}2": False,
+        }
+
+
+async def test_batch_resolver_with_condition():
+    received: list[str] = []
+
+    class BookSerializer(Serializer):
+        title: str
+        secret: str | None = None
+
+        @batch_resolver("secret")
+        @require_condition_or_unset(
+            lambda instance, context: instance.title != "hidden"
+        )
+        def _secret(
+            cls, instances: list[Book], context: ContextType
+        ) -> list[str]:
+            received.extend(book.title for book in instances)
+            return [f"secret of {book.title}" for book in instances]
+
+    await Book.bulk_create([Book(title="visible"), Book(title="hidden")])
+    serializers = await BookSerializer.from_queryset(Book.all())
+    assert received == ["visible"]
+    assert serializers[0].secret == "secret of visible"
+    assert serializers[1].secret is None
+    assert "secret" not in serializers[1].model_fields_set
+
+
+async def test_stream_queryset(queries: QueryCapture):
+    class BookSerializer(Serializer):
+        id: int
+        title: str
+
+    await Book.bulk_create([Book(title=f"Book {i}") for i in range(5)])
+    queries.clear()
+    titles = [
+        serializer.title
+        async for serializer in BookSerializer.stream_queryset(
+            Book.all().order_by("-title"), chunk_size=2
+        )
+    ]
+    assert titles == [f"Book {i}" for i in range(5)]
+    # 2 + 2 + 1 rows: the last chunk is not full so no extra query
+    assert len(queries) == 3
+
+    dumps = [
+        item
+        async for item in BookSerializer.stream_queryset(
+            Book.filter(title="Book 3"), as_dict=True
+        )
+    ]
+    assert dumps == [{"id": dumps[0]["id"], "title": "Book 3"}]
+
+
+async def test_stream_queryset_with_limit():
+    class BookSerializer(Serializer):
+        title: str
+
+    with pytest.raises(ValueError):
+        async for _ in BookSerializer.stream_queryset(Book.all().limit(2)):
+            pass
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, "pool"])
+async def test_max_concurrency(max_concurrency: int | str):
+    in_flight = 0
+    peak = 0
+
+    class ShelfSerializer(Serializer):
+        name: str
+        tag: str
+
+        @classmethod
+        async def resolve_tag(cls, instance: BookShelf, context: ContextType):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return instance.name.lower()
+
+    class SimilarBookSerializer(Serializer):
+        title: str
+        shelf: ShelfSerializer
+
+    class BookSerializer(Serializer):
+        title: str
+        shelf: ShelfSerializer
+        similar: list[SimilarBookSerializer] = []
+
+        @classmethod
+        async def resolve_similar(cls, instance: Book, context: ContextType):
+            # nested serialization inside a resolver holding the only permit
+            # must not wait for another one
+            return await SimilarBookSerializer.from_queryset(
+                Book.filter(shelf_id=instance.shelf_id, id__not=instance.id)
+                .limit(1)
+                .prefetch_related("shelf"),
+            )
+
+    shelf = await BookShelf.create(name="Fantasy")
+    await Book.bulk_create([Book(title=f"{i}", shelf=shelf) for i in range(6)])
+    serializers = await BookSerializer.from_queryset(
+        Book.all(), max_concurrency=max_concurrency
+    )
+    assert len(serializers) == 6
+    assert all(serializer.shelf.tag == "fantasy" for serializer in serializers)
+    assert all(len(serializer.similar) == 1 for serializer in serializers)
+    # sqlite has a single connection
+    assert peak <= (1 if max_concurrency == "pool" else max_concurrency)
+
+
+async def test_max_concurrency_class_default():
+    class BookSerializer(Serializer):
+        title: str
+
+    class LimitedBookSerializer(BookSerializer):
+        max_concurrency = 2
+
+    await Book.bulk_create([Book(title=f"{i}") for i in range(3)])
+    serializers = await LimitedBookSerializer.from_tortoise_instances(
+        await Book.all()
+    )
+    assert [serializer.title for serializer in serializers] == ["0", "1", "2"]
+    with pytest.raises(ValueError):
+        await BookSerializer.from_queryset(Book.all(), max_concurrency=0)
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 10, "pool"])
+async def test_max_concurrency_keeps_batches(max_concurrency: int | str):
+    calls: list[int] = []
+
+    class BookSerializer(Serializer):
+        title: str
+        upper_title: str
+
+        @batch_resolver("upper_title")
+        async def _upper_titles(
+            cls, instances: list[Book], context: ContextType
+        ) -> list[str]:
+            calls.append(len(instances))
+            return [book.title.upper() for book in instances]
+
+    await Book.bulk_create([Book(title=f"book {i}") for i in range(100)])
+    serializers = await BookSerializer.from_queryset(
+        Book.all(), max_concurrency=max_concurrency
+    )
+    assert calls == [100]
+    assert serializers[0].upper_title == "BOOK 0"
+
+
+async def test_memoize_resolvers():
+    calls: list[str] = []
+
+    class ShelfSerializer(Serializer):
+        name: str
+        rate: float
+        label: str
+
+        @resolver("rate")
+        @memoize(scope="context")
+        async def resolve_rate(cls, instance: BookShelf, context) -> float:
+            calls.append("rate")
+            await asyncio.sleep(0)
+            return context["rate"]
+
+        @classmethod
+        @memoize(scope="instance")
+        def resolve_label(cls, instance: BookShelf, context) -> str:
+            calls.append("label")
+            return instance.name.upper()
+
+    class BookSerializer(Serializer):
+        title: str
+        rate: float
+        shelf: ShelfSerializer
+
+        @resolver("rate")
+        @memoize(scope="context+instance")
+        async def resolve_rate(cls, instance: Book, context) -> float:
+            calls.append("book rate")
+            return context["rate"] * 2
+
+    shelf = await BookShelf.create(name="Fantasy")
+    for title in ("LOTR", "The Hobbit", "Silmarillion"):
+        await Book.create(title=title, shelf=shelf)
+
+    books = await BookSerializer.from_queryset(
+        Book.all().prefetch_related("shelf"), context={"rate": 1.5}
+    )
+    assert {book.shelf.rate for book in books} == {1.5}
+    assert {book.shelf.label for book in books} == {"FANTASY"}
+    assert {book.rate for book in books} == {3.0}
+    # the async calls ran concurrently and still awaited the same future
+    assert sorted(calls) == ["book rate"] * 3 + ["label", "rate"]
+
+    # nothing is kept between serializations
+    await BookSerializer.from_queryset(Book.all(), context={"rate": 1.5})
+    assert calls.count("rate") == 2
+
+    # outside of a serialization the resolver is just called
+    assert await ShelfSerializer.resolve_rate(shelf, {"rate": 2}) == 2
+
+
+async def test_memoize_does_not_keep_errors():
+    attempts: list[int] = []
+
+    class ShelfSerializer(Serializer):
+        name: str
+        flag: bool
+
+        @resolver("flag")
+        @memoize()
+        async def resolve_flag(cls, instance: BookShelf, context) -> bool:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("boom")
+            return True
+
+    shelf = await BookShelf.create(name="Fantasy")
+    # both calls share the memo of the same session
+    with serialization_session():
+        with pytest.raises(ValueError):
+            await ShelfSerializer.from_tortoise_orm(shelf)
+        serializer = await ShelfSerializer.from_tortoise_orm(shelf)
+    assert len(attempts) == 2
+    assert serializer.flag is True
+
+
+def test_memoize_invalid_scope():
+    with pytest.raises(ValueError):
+        memoize(scope="request")
@@ -0,0 +1,248 @@
+import pytest
+
+from tests.models import Book, BookShelf, Person
+from tortoise_serializer import (
+    ContextType,
+    ModelSerializer,
+    Serializer,
+    resolver,
+)
+from tortoise_serializer.bulk import insert_links
+from tortoise_serializer.cache import InMemoryCache, invalidate_cache
+
+
+async def test_in_memory_cache_eviction():
+    cache = InMemoryCache(max_size=2)
+    await cache.set("a", {"value": 1})
+    await cache.set("b", {"value": 2})
+    # "a" becomes the most recently used
+    assert await cache.get("a") == {"value": 1}
+    await cache.set("c", {"value": 3})
+
+    assert await cache.get_many(["a", "b", "c"]) == {
+        "a": {"value": 1},
+        "c": {"value": 3},
+    }
+    assert len(cache) == 2
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+    assert cache.stats.evictions == 1
+
+    await cache.delete_many(["a", "unknown"])
+    assert await cache.get("a") is None
+    await cache.clear()
+    assert len(cache) == 0
+
+
+async def test_in_memory_cache_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    cache = InMemoryCache(ttl=10)
+    await cache.set("a", {"value": 1})
+    now = 109.0
+    assert await cache.get("a") == {"value": 1}
+    now = 110.0
+    assert await cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        InMemoryCache(max_size=0)
+
+
+async def test_serializer_output_cache():
+    calls: list[str] = []
+
+    class ShelfSerializer(Serializer):
+        id: int
+        name: str
+
+    class BookSerializer(Serializer):
+        cache_backend = InMemoryCache()
+        cache_version_field = "price"
+
+        id: int
+        title: str
+        shelf: ShelfSerializer
+        label: str
+
+        @resolver("label")
+        def resolve_label(cls, instance: Book, context: ContextType) -> str:
+            calls.append(instance.title)
+            return f"{instance.title} {context.get('suffix', '')}"
+
+    shelf = await BookShelf.create(name="Fantasy")
+    lotr = await Book.create(title="LOTR", shelf=shelf, price=10.0)
+    await Book.create(title="The Hobbit", shelf=shelf)
+
+    first = await BookSerializer.from_tortoise_orm(lotr)
+    second = await BookSerializer.from_tortoise_orm(lotr)
+    assert first == second
+    assert second.shelf.name == "Fantasy"
+    assert calls == ["LOTR"]
+
+    # the context is part of the key
+    other = await BookSerializer.from_tortoise_orm(
+        lotr, context={"suffix": "!"}
+    )
+    assert other.label == "LOTR !"
+    assert calls == ["LOTR", "LOTR"]
+
+    # so is the version column
+    lotr.price = 12.0
+    await lotr.save()
+    await BookSerializer.from_tortoise_orm(lotr)
+    assert calls == ["LOTR", "LOTR", "LOTR"]
+
+    # lists look up the cache at once and only serialize the misses
+    cache = BookSerializer.cache_backend
+    hits, misses = cache.stats.hits, cache.stats.misses
+    books = await BookSerializer.from_queryset(Book.all().order_by("id"))
+    assert [book.title for book in books] == ["LOTR", "The Hobbit"]
+    assert books[0] == await BookSerializer.from_tortoise_orm(lotr)
+    assert calls == ["LOTR", "LOTR", "LOTR", "The Hobbit"]
+    assert cache.stats.hits == hits + 2
+    assert cache.stats.misses == misses + 1
+
+    # unsaved instances are not cached
+    assert (
+        BookSerializer.get_cache_key(Book(title="new"), ContextType()) is None
+    )
+
+
+async def test_cache_invalidation_on_writes():
+    class BookTitleSerializer(ModelSerializer[Book]):
+        title: str
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        cache_backend = InMemoryCache()
+
+        name: str
+        books: list[BookTitleSerializer]
+
+    class ShelfNameSerializer(ModelSerializer[BookShelf]):
+        name: str
+
+    class BookSerializer(ModelSerializer[Book]):
+        cache_backend = InMemoryCache()
+
+        title: str
+        shelf: ShelfNameSerializer
+
+    shelf = await BookShelf.create(name="Fantasy")
+    lotr = await Book.create(title="LOTR", shelf=shelf)
+    shelves_cache = ShelfSerializer.cache_backend
+    books_cache = BookSerializer.cache_backend
+
+    await ShelfSerializer.from_queryset(BookShelf.all())
+    await BookSerializer.from_queryset(Book.all())
+    assert len(shelves_cache) == 1
+    assert len(books_cache) == 1
+
+    # a new book changes the books of its shelf
+    hobbit = await Book.create(title="The Hobbit", shelf=shelf)
+    assert len(shelves_cache) == 0
+    assert len(books_cache) == 1
+    (serialized_shelf,) = await ShelfSerializer.from_queryset(BookShelf.all())
+    assert len(serialized_shelf.books) == 2
+
+    # so does an update of an embedded book
+    hobbit.title = "The Hobbit, or There and Back Again"
+    await hobbit.save()
+    assert len(shelves_cache) == 0
+    await ShelfSerializer.from_queryset(BookShelf.all())
+
+    # and a deletion
+    await hobbit.delete()
+    assert len(shelves_cache) == 0
+
+    # a shelf update evicts the books embedding it
+    shelf.name = "Fiction"
+    await shelf.save()
+    assert len(books_cache) == 0
+    (serialized_book,) = await BookSerializer.from_queryset(Book.all())
+    assert serialized_book.shelf.name == "Fiction"
+    assert lotr.pk is not None
+
+
+async def test_cache_invalidation_of_many_to_many():
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        cache_backend = InMemoryCache()
+
+        name: str
+        borrows: list[BookSerializer]
+
+    shelf = await BookShelf.create(name="Fantasy")
+    lotr = await Book.create(title="LOTR", shelf=shelf)
+    person = await Person.create(name="John")
+    await PersonSerializer.from_queryset(Person.all())
+    assert len(PersonSerializer.cache_backend) == 1
+
+    # tortoise does not signal ManyToMany changes
+    await person.borrows.add(lotr)
+    assert len(PersonSerializer.cache_backend) == 1
+    await invalidate_cache(person, relations=["borrows"])
+    assert len(PersonSerializer.cache_backend) == 0
+
+
+async def test_cache_invalidation_of_bulk_updates():
+    class BookSerializer(ModelSerializer[Book]):
+        cache_backend = InMemoryCache()
+
+        title: str
+
+    class BookTitleSerializer(Serializer):
+        title: str
+
+    book = await Book.create(title="LOTR")
+    await BookSerializer.from_tortoise_orm(book)
+    assert len(BookSerializer.cache_backend) == 1
+
+    # `bulk_update` sends no signal
+    await Serializer.bulk_partial_update_tortoise_instances(
+        [(BookTitleSerializer(title="The Hobbit"), book)]
+    )
+    assert len(BookSerializer.cache_backend) == 0
+    serializer = await BookSerializer.from_tortoise_orm(
+        await Book.get(id=book.id)
+    )
+    assert serializer.title == "The Hobbit"
+
+
+async def test_cache_invalidation_of_bulk_creations():
+    class BookTitleSerializer(ModelSerializer[Book]):
+        title: str
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        cache_backend = InMemoryCache()
+
+        name: str
+        books: list[BookTitleSerializer] = []
+
+    class PersonSerializer(ModelSerializer[Person]):
+        cache_backend = InMemoryCache()
+
+        name: str
+        borrows: list[BookTitleSerializer] = []
+
+    shelf = await BookShelf.create(name="Fantasy")
+    person = await Person.create(name="John")
+    assert (await ShelfSerializer.from_tortoise_orm(shelf)).books == []
+    await PersonSerializer.from_tortoise_orm(person)
+    assert len(PersonSerializer.cache_backend) == 1
+
+    # bulk inserts send no signal
+    (book,) = await BookTitleSerializer.create_tortoise_instances(
+        [BookTitleSerializer(title="LOTR")], shelf_id=shelf.id
+    )
+    assert len(ShelfSerializer.cache_backend) == 0
+    serializer = await ShelfSerializer.from_tortoise_orm(
+        await BookShelf.get(id=shelf.id)
+    )
+    assert [book.title for book in serializer.books] == ["LOTR"]
+
+    await insert_links(Person._meta.fields_map["borrows"], [(person, book)])
+    assert len(PersonSerializer.cache_backend) == 0
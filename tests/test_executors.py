@@ -0,0 +1,155 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from tests.models import Book, BookShelf
+from tortoise_serializer import (
+    ContextType,
+    ModelSerializer,
+    resolver,
+    set_resolver_executor,
+    shutdown_resolver_executors,
+)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.jobs: list[int] = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        # args: resolver, chunk, context
+        self.jobs.append(len(args[1]))
+        return super().submit(fn, *args, **kwargs)
+
+
+class BookSerializer(ModelSerializer[Book]):
+    title: str
+    slug: str
+    thread: str
+    loop_thread: str
+
+    executor_chunk_size = 2
+
+    @resolver("slug", executor="thread")
+    def resolve_slug(cls, instance: Book, context: ContextType) -> str:
+        return f"{context.get('prefix', '')}{instance.title.lower()}"
+
+    @resolver("thread", executor="thread")
+    def resolve_thread(cls, instance: Book, context: ContextType) -> str:
+        return threading.current_thread().name
+
+    @resolver("loop_thread")
+    def resolve_loop_thread(cls, instance: Book, context: ContextType) -> str:
+        return threading.current_thread().name
+
+
+class ShelfSerializer(ModelSerializer[BookShelf]):
+    name: str
+    books: list[BookSerializer]
+
+
+class ThreadedBookSerializer(ModelSerializer[Book]):
+    title: str
+    thread: str
+    loop_thread: str
+
+    resolver_executor = "thread"
+
+    @resolver("thread")
+    def resolve_thread(cls, instance: Book, context: ContextType) -> str:
+        return threading.current_thread().name
+
+    @resolver("loop_thread", executor="inline")
+    def resolve_loop_thread(cls, instance: Book, context: ContextType) -> str:
+        return threading.current_thread().name
+
+
+class ProcessBookSerializer(ModelSerializer[Book]):
+    title: str
+    pid: int
+
+    @resolver("pid", executor="process")
+    def resolve_pid(cls, instance: Book, context: ContextType) -> int:
+        return os.getpid()
+
+
+@pytest.fixture
+def executor():
+    executor = CountingExecutor()
+    set_resolver_executor("thread", executor)
+    yield executor
+    shutdown_resolver_executors()
+
+
+@pytest.fixture
+async def shelves() -> list[BookShelf]:
+    shelves = [await BookShelf.create(name=f"shelf {i}") for i in range(2)]
+    for index in range(5):
+        await Book.create(title=f"Book {index}", shelf=shelves[index % 2])
+    return shelves
+
+
+@pytest.mark.usefixtures("shelves")
+async def test_thread_executor(executor: CountingExecutor):
+    serializers = await ShelfSerializer.from_queryset(
+        BookShelf.all().order_by("id"), context={"prefix": "/"}
+    )
+    books = [book for shelf in serializers for book in shelf.books]
+    assert [book.slug for book in books] == [
+        "/book 0",
+        "/book 2",
+        "/book 4",
+        "/book 1",
+        "/book 3",
+    ]
+    main_thread = threading.current_thread().name
+    assert all(book.thread != main_thread for book in books)
+    assert all(book.loop_thread == main_thread for book in books)
+    # the books of both shelves are chunked together, for each resolver
+    assert sorted(executor.jobs) == [1, 1, 2, 2, 2, 2]
+
+    # a single instance is a job of its own
+    executor.jobs.clear()
+    book = await BookSerializer.from_tortoise_orm(await Book.first())
+    assert book.thread != main_thread
+    assert executor.jobs == [1, 1]
+
+
+@pytest.mark.usefixtures("shelves")
+async def test_class_executor(executor: CountingExecutor):
+    books = await ThreadedBookSerializer.from_queryset(Book.all())
+    main_thread = threading.current_thread().name
+    assert all(book.thread != main_thread for book in books)
+    assert all(book.loop_thread == main_thread for book in books)
+    assert ThreadedBookSerializer._get_plan().flat is False
+
+
+@pytest.mark.usefixtures("shelves")
+async def test_process_executor():
+    set_resolver_executor(
+        "process",
+        ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ),
+    )
+    try:
+        books = await ProcessBookSerializer.from_queryset(Book.all())
+    finally:
+        shutdown_resolver_executors()
+    assert len(books) == 5
+    assert {book.pid for book in books} != {os.getpid()}
+
+
+def test_invalid_executor():
+    with pytest.raises(ValueError):
+        resolver("field", executor="fiber")
+
+    with pytest.raises(ValueError):
+
+        class InvalidSerializer(ModelSerializer[Book]):
+            title: str
+            executor_chunk_size = 0
@@ -0,0 +1,126 @@
+import pytest
+
+from tests.models import Book, BookShelf
+from tortoise_serializer import (
+    ContextType,
+    InMemoryMetrics,
+    MetricEvent,
+    ModelSerializer,
+    Serializer,
+    batch_resolver,
+    resolver,
+)
+from tortoise_serializer.metrics import Histogram
+
+
+async def test_in_memory_metrics():
+    class ShelfSerializer(Serializer):
+        name: str
+
+    class BookSerializer(Serializer):
+        metrics = InMemoryMetrics()
+
+        title: str
+        shelf: ShelfSerializer
+        label: str
+        upper_title: str
+        sibling_count: int
+
+        @resolver("label")
+        def resolve_label(cls, instance: Book, context: ContextType) -> str:
+            return instance.title.lower()
+
+        @resolver("upper_title")
+        async def resolve_upper_title(
+            cls, instance: Book, context: ContextType
+        ) -> str:
+            return instance.title.upper()
+
+        @batch_resolver("sibling_count")
+        async def resolve_sibling_count(
+            cls, instances: list[Book], context: ContextType
+        ) -> list[int]:
+            return [len(instances)] * len(instances)
+
+    shelf = await BookShelf.create(name="Fantasy")
+    for title in ("LOTR", "The Hobbit", "Silmarillion"):
+        await Book.create(title=title, shelf=shelf)
+
+    await BookSerializer.from_queryset(Book.filter(shelf=shelf))
+    metrics = BookSerializer.metrics
+    serialization = metrics.get(BookSerializer, MetricEvent.FROM_TORTOISE_ORM)
+    assert serialization.calls == 3
+    assert serialization.min <= serialization.max <= serialization.total
+    for field_name in ("label", "upper_title"):
+        assert (
+            metrics.get(BookSerializer, MetricEvent.RESOLVER, field_name).calls
+            == 3
+        )
+    batch = metrics.get(
+        BookSerializer, MetricEvent.BATCH_RESOLVER, "sibling_count"
+    )
+    assert (batch.calls, batch.count) == (1, 3)
+    assert metrics.get(BookSerializer, MetricEvent.MODEL_VALIDATE).calls == 3
+    # the shelves were loaded at once for the whole list
+    fetch = metrics.get(BookSerializer, MetricEvent.FETCH_RELATED, "shelf")
+    assert (fetch.calls, fetch.count) == (1, 3)
+    # the nested serializer has no metrics
+    assert metrics.get(ShelfSerializer, MetricEvent.MODEL_VALIDATE) is None
+
+    snapshot = metrics.snapshot()
+    key = (
+        f"{__name__}.test_in_memory_metrics.<locals>.BookSerializer"
+        ".resolver:upper_title"
+    )
+    assert snapshot[key]["calls"] == 3
+    assert sum(snapshot[key]["buckets"].values()) == 3
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+async def test_metrics_of_flat_serializers():
+    class BookSerializer(ModelSerializer[Book]):
+        metrics = InMemoryMetrics()
+
+        title: str
+        label: str
+
+        @resolver("label", row_only=True)
+        def resolve_label(cls, instance: Book, context: ContextType) -> str:
+            return instance.title.lower()
+
+    await Book.create(title="LOTR")
+    books = await BookSerializer.from_queryset(Book.all())
+    metrics = BookSerializer.metrics
+    for event, target in (
+        (MetricEvent.FROM_TORTOISE_ORM, None),
+        (MetricEvent.MODEL_VALIDATE, None),
+        (MetricEvent.RESOLVER, "label"),
+    ):
+        assert metrics.get(BookSerializer, event, target).calls == len(books)
+
+
+def test_histogram_percentiles():
+    histogram = Histogram((0.1, 1.0))
+    for duration in (0.05, 0.05, 0.5, 2.0):
+        histogram.observe(duration)
+    assert histogram.buckets == [2, 1, 1]
+    assert histogram.percentile(50) == 0.1
+    assert histogram.percentile(75) == 1.0
+    assert histogram.percentile(100) == 2.0
+    assert histogram.as_dict()["mean"] == pytest.approx(0.65)
+    assert Histogram((0.1,)).percentile(50) == 0.0
+
+
+def test_in_memory_metrics_key_by_module():
+    metrics = InMemoryMetrics()
+    first = type("BookSerializer", (), {"__module__": "app.books"})
+    second = type("BookSerializer", (), {"__module__": "app.library"})
+    metrics.record(first, MetricEvent.MODEL_VALIDATE, 0.1)
+    metrics.record(second, MetricEvent.MODEL_VALIDATE, 0.2, count=2)
+    assert metrics.get(first, MetricEvent.MODEL_VALIDATE).calls == 1
+    assert metrics.get(second, MetricEvent.MODEL_VALIDATE).count == 2
+    assert list(metrics.snapshot()) == [
+        "app.library.BookSerializer.model_validate",
+        "app.books.BookSerializer.model_validate",
+    ]
@@ -1,12 +1,15 @@
-from typing import override
+from typing import Any, override
 
 import pytest
-from pydantic import Field
-from tortoise.exceptions import DoesNotExist
+from pydantic import Field, ValidationError
+from tortoise.exceptions import DoesNotExist, IntegrityError
+from tortoise.signals import Signals
 from tortoise.transactions import in_transaction
 
-from tests.models import Book, BookShelf, Location, Person, User
-from tortoise_serializer import ContextType, ModelSerializer
+from tests.models import Book, BookShelf, Location, Node, Person, User
+from tortoise_serializer import ContextType, ModelSerializer, resolver
+from tortoise_serializer.exceptions import TortoiseSerializerException
+from tortoise_serializer.testing import QueryCapture
 
 
 async def test_model_creation():
@@ -97,6 +100,368 @@ async def test_model_backward_fk_creation():
     assert Book.filter(title="LOTR", shelf__name="fantastic").exists()
 
 
+async def test_model_creation_batches_children(queries: QueryCapture):
+    class LocationSerializer(ModelSerializer[Location]):
+        name: str
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        name: str
+        location: LocationSerializer | None = None
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer]
+
+    class ReaderSerializer(ModelSerializer[Person]):
+        name: str
+        borrows: list[BookSerializer]
+
+    queries.clear()
+    async with in_transaction():
+        shelf = await ShelfSerializer(
+            name="Fantasy",
+            books=[BookSerializer(title=f"book {i}") for i in range(5)],
+        ).create_tortoise_instance()
+        # the shelf, then all the books at once
+        assert len(queries) == 2
+
+        queries.clear()
+        reader = await ReaderSerializer(
+            name="Louise",
+            borrows=[BookSerializer(title=f"read {i}") for i in range(5)],
+        ).create_tortoise_instance()
+        # the books, the person, the links
+        assert len(queries) == 3
+
+    assert await shelf.books.all().count() == 5
+    assert await reader.borrows.all().count() == 5
+
+    class BorrowedBookSerializer(ModelSerializer[Book]):
+        title: str
+        borrowers: list[PersonSerializer] = []
+
+    class ShelfOfBorrowedSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BorrowedBookSerializer]
+
+    # children with relations of their own are still created one by one
+    queries.clear()
+    async with in_transaction():
+        shelf = await ShelfOfBorrowedSerializer(
+            name="SF",
+            books=[
+                BorrowedBookSerializer(title="Dune"),
+                BorrowedBookSerializer(
+                    title="Foundation",
+                    borrowers=[
+                        PersonSerializer(
+                            name="John",
+                            location=LocationSerializer(name="Paris"),
+                        )
+                    ],
+                ),
+            ],
+        ).create_tortoise_instance()
+    # shelf, Foundation: location, person, book, link; Dune
+    assert len(queries) == 6
+    book = await Book.get(title="Foundation").prefetch_related(
+        "borrowers__location"
+    )
+    assert book.shelf_id == shelf.id
+    assert book.borrowers[0].location.name == "Paris"
+    assert (await Book.get(title="Dune")).shelf_id == shelf.id
+
+
+async def test_model_creation_keeps_save_signals(queries: QueryCapture):
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer]
+
+    saved: list[str] = []
+
+    async def on_save(sender, instance: Book, *args) -> None:
+        saved.append(instance.title)
+
+    Book.register_listener(Signals.post_save, on_save)
+    try:
+        queries.clear()
+        await ShelfSerializer(
+            name="SF",
+            books=[BookSerializer(title="Dune"), BookSerializer(title="Ubik")],
+        ).create_tortoise_instance()
+    finally:
+        Book._listeners[Signals.post_save].pop(Book)
+    # the books are created one by one to send their signals
+    assert len(queries) == 3
+    assert saved == ["Dune", "Ubik"]
+
+
+async def test_bulk_creation(queries: QueryCapture):
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer]
+
+    class LocationSerializer(ModelSerializer[Location]):
+        name: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        name: str
+        borrows: list[BookSerializer]
+        location: LocationSerializer | None = None
+
+    queries.clear()
+    async with in_transaction():
+        shelves = await ShelfSerializer.create_tortoise_instances(
+            [
+                ShelfSerializer(
+                    name=f"shelf {index}",
+                    books=[
+                        BookSerializer(title=f"book {index}.{book_index}")
+                        for book_index in range(3)
+                    ],
+                )
+                for index in range(5)
+            ],
+            batch_size=10,
+        )
+    # shelves, then 2 batches of books
+    assert len(queries) == 3
+    assert [shelf.name for shelf in shelves] == [
+        f"shelf {index}" for index in range(5)
+    ]
+    assert all(shelf.id for shelf in shelves)
+    for shelf in shelves:
+        assert await shelf.books.all().count() == 3
+    assert await Book.filter(title="book 3.1", shelf_id=shelves[3].id).exists()
+
+    queries.clear()
+    async with in_transaction():
+        persons = await PersonSerializer.create_tortoise_instances(
+            [
+                PersonSerializer(
+                    name="Louise",
+                    borrows=[
+                        BookSerializer(title="1984"),
+                        BookSerializer(title="Dune"),
+                    ],
+                    location=LocationSerializer(name="Paris"),
+                ),
+                PersonSerializer(
+                    name="John", borrows=[BookSerializer(title="Emma")]
+                ),
+            ]
+        )
+    # locations and books, persons, borrows
+    assert len(queries) == 4
+    louise, john = persons
+    assert louise.location.name == "Paris"
+    assert louise.location_id == louise.location.id
+    assert john.location_id is None
+    assert sorted(
+        await louise.borrows.all().values_list("title", flat=True)
+    ) == ["1984", "Dune"]
+    assert await john.borrows.all().values_list("title", flat=True) == ["Emma"]
+
+
+async def test_bulk_creation_of_trees(queries: QueryCapture):
+    class NodeSerializer(ModelSerializer[Node]):
+        id: int | None = None
+        name: str
+        children: list["NodeSerializer"] = []
+
+    def make_tree(name: str, depth: int) -> NodeSerializer:
+        return NodeSerializer(
+            name=name,
+            children=[
+                make_tree(f"{name}.{index}", depth - 1)
+                for index in range(2 if depth else 0)
+            ],
+        )
+
+    queries.clear()
+    roots = await NodeSerializer.create_tortoise_instances(
+        [make_tree("a", 2), make_tree("b", 2)]
+    )
+    # one insert per level
+    assert len(queries) == 3
+    assert await Node.all().count() == 14
+    node = await Node.get(name="b.1.0").prefetch_related("parent__parent")
+    assert node.parent.name == "b.1"
+    assert node.parent.parent_id == roots[1].id
+
+    # known primary keys go through `bulk_create`
+    await NodeSerializer.create_tortoise_instances(
+        [NodeSerializer(id=1000, name="c")], parent_id=roots[0].id
+    )
+    assert (await Node.get(id=1000)).parent_id == roots[0].id
+
+
+async def test_update_instance(queries: QueryCapture):
+    class BookSerializer(ModelSerializer[Book]):
+        id: int | None = None
+        title: str
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer] = []
+
+    shelf = await BookShelf.create(name="SF")
+    dune, foundation, hyperion = [
+        await Book.create(title=title, shelf=shelf)
+        for title in ("Dune", "Foundation", "Hyperion")
+    ]
+
+    queries.clear()
+    async with in_transaction():
+        await ShelfSerializer(
+            name="Science fiction",
+            books=[
+                BookSerializer(id=dune.id, title="Dune Messiah"),
+                BookSerializer(id=foundation.id, title="Foundation"),
+                BookSerializer(title="Solaris"),
+            ],
+        ).update_tortoise_instance(shelf)
+    # shelf, current books, delete, bulk update, insert
+    assert len(queries) == 5
+    assert queries.sql[2].startswith('DELETE FROM "book"')
+    assert (await BookShelf.get(id=shelf.id)).name == "Science fiction"
+    assert sorted(await shelf.books.all().values_list("title", flat=True)) == [
+        "Dune Messiah",
+        "Foundation",
+        "Solaris",
+    ]
+    assert not await Book.filter(id=hyperion.id).exists()
+
+    # unset relations are left alone
+    queries.clear()
+    await ShelfSerializer(name="SF").update_tortoise_instance(shelf)
+    assert len(queries) == 1
+    assert await shelf.books.all().count() == 3
+
+    with pytest.raises(TortoiseSerializerException):
+        await ShelfSerializer(
+            name="SF", books=[BookSerializer(id=hyperion.id, title="?")]
+        ).update_tortoise_instance(shelf)
+
+
+async def test_update_instance_foreign_key():
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        id: int | None = None
+        name: str | None = None
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfSerializer | None = None
+
+    shelf = await BookShelf.create(name="SF")
+    book = await Book.create(title="Dune", shelf=shelf)
+
+    await BookSerializer(
+        title="Dune", shelf=ShelfSerializer(name="Classics")
+    ).update_tortoise_instance(book)
+    book = await Book.get(id=book.id).prefetch_related("shelf")
+    assert book.shelf.name == "Classics"
+
+    await BookSerializer(
+        title="Dune", shelf=ShelfSerializer(id=shelf.id, name="Sci-fi")
+    ).update_tortoise_instance(book)
+    book = await Book.get(id=book.id).prefetch_related("shelf")
+    assert (book.shelf.id, book.shelf.name) == (shelf.id, "Sci-fi")
+
+    await BookSerializer(title="Dune", shelf=None).update_tortoise_instance(
+        book
+    )
+    assert (await Book.get(id=book.id)).shelf_id is None
+
+
+async def test_update_instance_many_to_many(queries: QueryCapture):
+    class BookSerializer(ModelSerializer[Book]):
+        id: int | None = None
+        title: str | None = None
+
+    class PersonSerializer(ModelSerializer[Person]):
+        name: str
+        borrows: list[BookSerializer]
+
+    dune, foundation, hyperion = [
+        await Book.create(title=title)
+        for title in ("Dune", "Foundation", "Hyperion")
+    ]
+    person = await Person.create(name="John")
+    await person.borrows.add(dune, foundation)
+
+    queries.clear()
+    async with in_transaction():
+        await PersonSerializer(
+            name="John",
+            borrows=[
+                BookSerializer(id=foundation.id),
+                BookSerializer(id=hyperion.id),
+                BookSerializer(title="Solaris"),
+            ],
+        ).update_tortoise_instance(person)
+    # current books, new linked book, unlink, insert, link
+    assert len(queries) == 5
+    assert sorted(
+        await person.borrows.all().values_list("title", flat=True)
+    ) == ["Foundation", "Hyperion", "Solaris"]
+    # unlinked rows are kept
+    assert await Book.filter(id=dune.id).exists()
+
+    with pytest.raises(TortoiseSerializerException):
+        await PersonSerializer(
+            name="John", borrows=[BookSerializer(id=-1)]
+        ).update_tortoise_instance(person)
+
+
+async def test_ingest(queries: QueryCapture):
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer] = []
+
+    async def read_records():
+        for index in range(7):
+            yield {
+                "name": f"shelf {index}",
+                "books": [{"title": f"book {index}"}],
+            }
+        yield {"name": "shelf 0"}  # already created
+        yield {"books": []}  # no name
+
+    queries.clear()
+    report = await ShelfSerializer.ingest(read_records(), batch_size=3)
+    # shelves and books of the first 2 batches, the last one is invalid
+    assert len(queries) == 4
+    assert report.created == 6
+    assert report.failed == 3
+    assert [
+        (error.batch, error.offset, error.size) for error in report.errors
+    ] == [(2, 6, 3)]
+    assert isinstance(report.errors[0].error, ValidationError)
+    # the invalid batch is skipped as a whole
+    assert await BookShelf.all().count() == 6
+    assert await Book.filter(shelf__name="shelf 4").exists()
+
+    report = await ShelfSerializer.ingest(
+        [{"name": "shelf 0"}, {"name": "shelf 9"}], batch_size=1
+    )
+    assert report.created == 1
+    assert isinstance(report.errors[0].error, IntegrityError)
+    assert await BookShelf.filter(name="shelf 9").exists()
+
+
 async def test_get_model_fields():
     class ShelfSerializer(ModelSerializer[BookShelf]):
         id: int
@@ -225,14 +590,40 @@ async def test_from_queryset_with_select_only():
     assert john_serialized.name == john.name
 
 
-async def test_from_queryset_with_both_prefetch_and_select_only():
-    class PersonSerializer(ModelSerializer[Person]):
-        id: int
+async def test_from_queryset_with_both_prefetch_and_select_only(
+    queries: QueryCapture,
+):
+    class ShelfNameSerializer(ModelSerializer[BookShelf]):
+        name: str
 
-    with pytest.raises(AssertionError):
-        await PersonSerializer.from_queryset(
-            Person.all(), prefetch=True, select_only=True
-        )
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfNameSerializer
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer]
+
+    shelf = await BookShelf.create(name="Fantasy")
+    await Book.create(title="LOTR", shelf=shelf, price=10.0)
+
+    queries.clear()
+    (serialized_shelf,) = await ShelfSerializer.from_queryset(
+        BookShelf.all(), prefetch=True, select_only=True
+    )
+    assert serialized_shelf.model_dump() == {
+        "name": "Fantasy",
+        "books": [{"title": "LOTR", "shelf": {"name": "Fantasy"}}],
+    }
+    assert len(queries) == 2
+    assert queries.sql[0].startswith('SELECT "name" "name","id" "id" FROM')
+    # the books only load their title, the join key and their shelf name
+    assert queries.sql[1].startswith(
+        'SELECT "book"."title" "title","book"."id" "id",'
+        '"book"."shelf_id" "shelf_id",'
+        '"book__shelf"."name" "book__shelf.name",'
+        '"book__shelf"."id" "book__shelf.id" FROM "book"'
+    )
 
 
 async def test_from_queryset_with_prefetch():
@@ -331,3 +722,508 @@ async def test_from_single_queryset_exception():
 
     with pytest.raises(DoesNotExist):
         await UserSerializer.from_single_queryset(User.get(id=1))
+
+
+async def test_stream_queryset_with_select_only(queries: QueryCapture):
+    class LocationSerializer(ModelSerializer[Location]):
+        name: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        name: str
+        location: LocationSerializer | None
+
+    for index in range(3):
+        await Person.create(
+            name=f"Person {index}",
+            location=await Location.create(name=f"Location {index}"),
+        )
+
+    queries.clear()
+    persons = [
+        person
+        async for person in PersonSerializer.stream_queryset(
+            Person.all(), chunk_size=2, select_only=True
+        )
+    ]
+    assert len(queries) == 2
+    assert [(person.name, person.location.name) for person in persons] == [
+        (f"Person {index}", f"Location {index}") for index in range(3)
+    ]
+
+
+async def test_trusted_construction():
+    class LocationSerializer(ModelSerializer[Location]):
+        id: int
+        name: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        verify_trusted = True
+
+        id: int
+        name: str
+        location: LocationSerializer | None
+        name_length: int
+
+        @classmethod
+        def resolve_name_length(cls, instance: Person, context: ContextType):
+            # resolvers outputs are still validated
+            return str(len(instance.name))
+
+    assert PersonSerializer._get_trusted_fields(Person) == {"id", "name"}
+
+    await Person.create(
+        name="John", location=await Location.create(name="Somewhere")
+    )
+    await Person.create(name="Jane")
+    persons = await PersonSerializer.from_queryset(
+        Person.all().order_by("name"), trusted=True, prefetch=True
+    )
+    assert [person.name for person in persons] == ["Jane", "John"]
+    assert persons[0].location is None
+    assert persons[1].location.name == "Somewhere"
+    assert persons[1].name_length == 4
+    assert persons[1].model_fields_set == {
+        "id",
+        "name",
+        "location",
+        "name_length",
+    }
+
+
+async def test_trusted_construction_validates_mismatching_types():
+    class BookSerializer(ModelSerializer[Book]):
+        trusted = True
+        verify_trusted = True
+
+        title: str = Field(max_length=3)
+        price: int | None
+        page_count: int | None
+
+    # constraints and mismatching annotations are validated
+    assert BookSerializer._get_trusted_fields(Book) == {"page_count"}
+
+    book = await Book.create(title="LOTR", price=10.0)
+    with pytest.raises(ValidationError):
+        await BookSerializer.from_tortoise_orm(book)
+
+    book = await Book.create(title="It", price=10.0)
+    serializer = await BookSerializer.from_tortoise_orm(book)
+    assert serializer.price == 10
+    assert serializer.page_count is None
+
+
+async def test_trusted_construction_missing_field():
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        unknown: str
+
+    book = await Book.create(title="LOTR")
+    with pytest.raises(ValidationError):
+        await BookSerializer.from_tortoise_orm(book, trusted=True)
+
+
+async def test_trusted_construction_runs_post_init():
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+        def model_post_init(self, context: Any) -> None:
+            self.title += "!"
+
+    book = await Book.create(title="a")
+    assert (await BookSerializer.from_tortoise_orm(book)).title == "a!"
+    serializer = await BookSerializer.from_tortoise_orm(book, trusted=True)
+    assert serializer.title == "a!"
+
+
+async def test_from_queryset_flat_serializer(queries: QueryCapture):
+    class BookSerializer(ModelSerializer[Book]):
+        id: int
+        title: str
+        price: float | None
+        label: str
+
+        @resolver("label", row_only=True)
+        def resolve_label(cls, instance: Book, context: ContextType) -> str:
+            assert not isinstance(instance, Book)
+            return f"{instance.pk}: {instance.title} {context['suffix']}"
+
+    assert BookSerializer._get_plan().flat
+    shelf = await BookShelf.create(name="Fantasy")
+    lotr = await Book.create(title="LOTR", price=10.0, shelf=shelf)
+    hobbit = await Book.create(title="The Hobbit", shelf=shelf)
+
+    queries.clear()
+    books = await BookSerializer.from_queryset(
+        Book.all().order_by("id"), context={"suffix": "!"}, select_only=True
+    )
+    assert len(queries) == 1
+    assert queries.sql[0].startswith(
+        'SELECT "id" "id","title" "title","price" "price" FROM "book"'
+    )
+    assert [book.model_dump() for book in books] == [
+        {
+            "id": lotr.id,
+            "title": "LOTR",
+            "price": 10.0,
+            "label": f"{lotr.id}: LOTR !",
+        },
+        {
+            "id": hobbit.id,
+            "title": "The Hobbit",
+            "price": None,
+            "label": f"{hobbit.id}: The Hobbit !",
+        },
+    ]
+
+
+async def test_from_queryset_not_flat_serializer():
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        label: str
+
+        @resolver("label")
+        def resolve_label(cls, instance: Book, context: ContextType) -> str:
+            return type(instance).__name__
+
+    assert not BookSerializer._get_plan().flat
+    shelf = await BookShelf.create(name="Fantasy")
+    await Book.create(title="LOTR", shelf=shelf)
+    (book,) = await BookSerializer.from_queryset(Book.all())
+    assert book.label == "Book"
+
+
+async def test_from_queryset_keeps_overridden_hooks():
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+
+        @classmethod
+        @override
+        async def from_tortoise_orm(cls, instance: Book, *args, **kwargs):
+            serializer = await super().from_tortoise_orm(
+                instance, *args, **kwargs
+            )
+            serializer.title = serializer.title.upper()
+            return serializer
+
+    assert not BookSerializer._get_plan().flat
+    await Book.create(title="a")
+    (book,) = await BookSerializer.from_queryset(Book.all())
+    assert book.title == "A"
+
+
+async def test_prefetch_joins_foreign_key_chains(queries: QueryCapture):
+    class GrandGrandParentSerializer(ModelSerializer[Node]):
+        name: str
+
+    class GrandParentSerializer(ModelSerializer[Node]):
+        name: str
+        parent: GrandGrandParentSerializer | None
+
+    class ParentSerializer(ModelSerializer[Node]):
+        name: str
+        parent: GrandParentSerializer | None
+
+    class NodeSerializer(ModelSerializer[Node]):
+        id: int
+        name: str
+        parent: ParentSerializer | None
+
+    assert NodeSerializer.get_select_related_fields() == [
+        "parent",
+        "parent__parent",
+        "parent__parent__parent",
+    ]
+    node = None
+    for name in "abcd":
+        node = await Node.create(name=name, parent=node)
+
+    queries.clear()
+    nodes = await NodeSerializer.from_queryset(
+        Node.filter(id=node.id), prefetch=True
+    )
+    assert len(queries) == 1
+    assert '"node__parent.name"' in queries.sql[0]
+    assert nodes[0].model_dump() == {
+        "id": node.id,
+        "name": "d",
+        "parent": {
+            "name": "c",
+            "parent": {"name": "b", "parent": {"name": "a"}},
+        },
+    }
+
+    queries.clear()
+    serializer = await NodeSerializer.from_single_queryset(Node.get(name="b"))
+    assert len(queries) == 1
+    assert serializer.parent.name == "a"
+    assert serializer.parent.parent is None
+
+
+async def test_prefetch_keeps_columns_read_by_resolvers():
+    class ShelfIdSerializer(ModelSerializer[BookShelf]):
+        id: int
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfIdSerializer
+        shelf_name: str
+
+        @resolver("shelf_name")
+        def resolve_shelf_name(
+            cls, instance: Book, context: ContextType
+        ) -> str:
+            return instance.shelf.name
+
+    shelf = await BookShelf.create(name="s1")
+    book = await Book.create(title="Dune", shelf=shelf)
+
+    books = await BookSerializer.from_queryset(Book.all(), prefetch=True)
+    assert books[0].shelf_name == "s1"
+    serializer = await BookSerializer.from_single_queryset(
+        Book.get(id=book.id)
+    )
+    assert serializer.shelf_name == "s1"
+
+
+async def test_prefetch_keeps_columns_read_by_properties():
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        upper_name: str
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfSerializer
+
+    shelf = await BookShelf.create(name="s1")
+    await Book.create(title="Dune", shelf=shelf)
+
+    books = await BookSerializer.from_queryset(Book.all(), prefetch=True)
+    assert books[0].shelf.upper_name == "S1"
+
+
+async def test_prefetch_to_many_relations(queries: QueryCapture):
+    class ShelfNameSerializer(ModelSerializer[BookShelf]):
+        name: str
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfNameSerializer
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        books: list[BookSerializer]
+
+    class LocationSerializer(ModelSerializer[Location]):
+        name: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        name: str
+        location: LocationSerializer | None
+        borrows: list[BookSerializer]
+
+    shelf = await BookShelf.create(name="Fantasy")
+    lotr = await Book.create(title="LOTR", shelf=shelf)
+    hobbit = await Book.create(title="The Hobbit", shelf=shelf)
+    person = await Person.create(
+        name="John", location=await Location.create(name="Somewhere")
+    )
+    await person.borrows.add(lotr, hobbit)
+
+    queries.clear()
+    (serialized_shelf,) = await ShelfSerializer.from_queryset(
+        BookShelf.all(), prefetch=True
+    )
+    # the books are fetched with their shelf joined
+    assert len(queries) == 2
+    assert {book.shelf.name for book in serialized_shelf.books} == {"Fantasy"}
+
+    queries.clear()
+    (serialized_person,) = await PersonSerializer.from_queryset(
+        Person.all(), prefetch=True
+    )
+    # person JOIN location, borrows, borrows__shelf
+    assert len(queries) == 3
+    assert serialized_person.location.name == "Somewhere"
+    assert sorted(book.title for book in serialized_person.borrows) == [
+        "LOTR",
+        "The Hobbit",
+    ]
+
+
+async def test_related_rows_are_serialized_once():
+    calls: list[int] = []
+
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+        label: str
+
+        @resolver("label")
+        def resolve_label(cls, instance: BookShelf, context: ContextType):
+            calls.append(instance.id)
+            return instance.name.upper()
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfSerializer
+
+    fantasy = await BookShelf.create(name="Fantasy")
+    scifi = await BookShelf.create(name="Sci-Fi")
+    for index in range(6):
+        await Book.create(
+            title=f"book {index}", shelf=fantasy if index % 2 else scifi
+        )
+
+    books = await BookSerializer.from_queryset(
+        Book.filter(shelf__id__in=[fantasy.id, scifi.id]).order_by("id")
+    )
+    assert sorted(calls) == [fantasy.id, scifi.id]
+    assert books[0].shelf is books[2].shelf
+    assert books[1].shelf is books[3].shelf
+    assert books[0].shelf is not books[1].shelf
+    assert books[1].shelf.label == "FANTASY"
+
+    # every call has its own identity map
+    await BookSerializer.from_queryset(Book.filter(shelf=fantasy))
+    assert len(calls) == 3
+
+
+async def test_from_queryset_normalized():
+    class ShelfSerializer(ModelSerializer[BookShelf]):
+        name: str
+
+    class BookSerializer(ModelSerializer[Book]):
+        title: str
+        shelf: ShelfSerializer | None
+
+    class LocationSerializer(ModelSerializer[Location]):
+        name: str
+
+    class PersonSerializer(ModelSerializer[Person]):
+        name: str
+        location: LocationSerializer | None = Field(
+            serialization_alias="place"
+        )
+        borrows: list[BookSerializer]
+
+    shelf = await BookShelf.create(name="Fantasy")
+    lotr = await Book.create(title="LOTR", shelf=shelf)
+    hobbit = await Book.create(title="The Hobbit", shelf=shelf)
+    orphan = await Book.create(title="Orphan")
+
+    output = await BookSerializer.from_queryset_normalized(
+        Book.filter(id__in=[lotr.id, hobbit.id, orphan.id]).order_by("id"),
+        prefetch=True,
+        select_only=True,
+    )
+    assert output == {
+        "data": [
+            {"title": "LOTR", "shelf": shelf.id},
+            {"title": "The Hobbit", "shelf": shelf.id},
+            {"title": "Orphan", "shelf": None},
+        ],
+        "included": {"BookShelf": {shelf.id: {"name": "Fantasy"}}},
+    }
+
+    location = await Location.create(name="Somewhere")
+    person = await Person.create(name="John", location=location)
+    await person.borrows.add(lotr)
+    instances = await Person.filter(id=person.id).prefetch_related(
+        "location", "borrows__shelf"
+    )
+    serializers = await PersonSerializer.from_tortoise_instances(instances)
+    # to-many relations stay inline, their to-one relations are included
+    assert PersonSerializer.normalize(
+        serializers, instances, by_alias=True
+    ) == {
+        "data": [
+            {
+                "name": "John",
+                "place": location.id,
+                "borrows": [{"title": "LOTR", "shelf": shelf.id}],
+            }
+        ],
+        "included": {
+            "Location": {location.id: {"name": "Somewhere"}},
+            "BookShelf": {shelf.id: {"name": "Fantasy"}},
+        },
+    }
+
+
+class TreeSerializer(ModelSerializer[Node]):
+    name: str
+    children: list["TreeSerializer"]
+
+
+class ShallowTreeSerializer(ModelSerializer[Node]):
+    max_depth = 2
+
+    name: str
+    children: list["ShallowTreeSerializer"]
+
+
+class AncestorsSerializer(ModelSerializer[Node]):
+    name: str
+    parent: "AncestorsSerializer | None"
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_recursive_relations_are_loaded_level_by_level(
+    queries: QueryCapture, prefetch: bool
+):
+    root = await Node.create(name="root")
+    level = [root]
+    for depth in range(3):
+        level = [
+            await Node.create(name=f"{depth}-{index}", parent=parent)
+            for parent in level
+            for index in range(3)
+        ]
+
+    queries.clear()
+    (tree,) = await TreeSerializer.from_queryset(
+        Node.filter(id=root.id), prefetch=prefetch, select_only=prefetch
+    )
+    # the root then one query per level, the last one being empty
+    assert len(queries) == 5
+    assert queries.sql[-1].count("?") == 27
+    assert [child.name for child in tree.children[2].children] == [
+        "1-0",
+        "1-1",
+        "1-2",
+    ]
+    assert len(tree.children[0].children[0].children) == 3
+
+    queries.clear()
+    (tree,) = await ShallowTreeSerializer.from_queryset(
+        Node.filter(id=root.id), prefetch=prefetch
+    )
+    assert len(queries) == 3
+    assert len(tree.children[0].children) == 3
+    assert tree.children[0].children[0].children == []
+
+    with pytest.raises(ValueError):
+
+        class InvalidSerializer(ModelSerializer[Node]):
+            max_depth = 0
+
+            name: str
+
+
+async def test_recursive_relations_cycles(queries: QueryCapture):
+    a = await Node.create(name="a")
+    b = await Node.create(name="b", parent=a)
+    a.parent = b
+    await a.save()
+
+    (serializer,) = await AncestorsSerializer.from_queryset(
+        Node.filter(id=a.id)
+    )
+    # `a` is its own grand parent: the chain stops there
+    assert serializer.parent.name == "b"
+    assert serializer.parent.parent.name == "a"
+    assert serializer.parent.parent.parent is None
+
+    (tree,) = await TreeSerializer.from_queryset(Node.filter(id=a.id))
+    (child,) = tree.children
+    assert child.name == "b"
+    assert [node.name for node in child.children] == ["a"]
+    assert child.children[0].children == []
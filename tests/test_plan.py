@@ -0,0 +1,91 @@
+from tests.models import Book, BookShelf
+from tortoise_serializer import (
+    ContextType,
+    ModelSerializer,
+    Serializer,
+    resolver,
+)
+
+
+def test_plan_is_compiled_at_class_definition():
+    class ShelfSerializer(Serializer):
+        name: str
+
+    class BookSerializer(Serializer):
+        id: int
+        title: str
+        shelf: ShelfSerializer | None = None
+        discount: float
+        slug: str
+
+        @resolver("discount")
+        def _discount(cls, instance: Book, context: ContextType) -> float:
+            return 0.15
+
+        @classmethod
+        async def resolve_slug(cls, instance: Book, context: ContextType):
+            return instance.title.lower()
+
+    plan = BookSerializer.__dict__["__serialization_plan__"]
+    assert plan is BookSerializer._get_plan()
+    assert set(plan.resolvers) == {"discount", "slug"}
+    assert [r.field_name for r in plan.sync_resolvers] == ["discount"]
+    assert [r.field_name for r in plan.async_resolvers] == ["slug"]
+    assert plan.model_fields == ("id", "title")
+    assert [n.field_name for n in plan.foreign_keys] == ["shelf"]
+    assert plan.enum_fields is None
+
+
+def test_model_serializer_plan_enum_fields():
+    class BookSerializer(ModelSerializer[Book]):
+        id: int
+        title: str
+        not_a_column: str | None = None
+
+    # only fields that tortoise does not know about may hold an enum here
+    assert BookSerializer._get_plan().enum_fields == {"not_a_column"}
+
+
+async def test_plan_with_forward_reference():
+    class ShelfSerializer(Serializer):
+        name: str
+        books: list["BookSerializer"]
+
+    class BookSerializer(Serializer):
+        title: str
+
+    ShelfSerializer.model_rebuild()
+
+    shelf = await BookShelf.create(name="Fantasy")
+    await Book.create(title="LOTR", shelf=shelf)
+    serializer = await ShelfSerializer.from_tortoise_orm(shelf)
+    assert [book.title for book in serializer.books] == ["LOTR"]
+    assert [
+        nested.field_name
+        for nested in ShelfSerializer._get_plan().nested_serializers
+    ] == ["books"]
+
+
+# declared at import time, before `Tortoise.init` like most applications do
+class BookShelfIdSerializer(ModelSerializer[Book]):
+    id: int
+    title: str
+    shelf_id: int | None
+    price: float | None
+
+
+async def test_plan_declared_before_init():
+    plan = BookShelfIdSerializer._get_plan()
+    assert plan.flat
+    assert plan.enum_fields == frozenset()
+    assert BookShelfIdSerializer._get_trusted_fields(Book) == {
+        "id",
+        "title",
+        "shelf_id",
+        "price",
+    }
+
+    shelf = await BookShelf.create(name="Fantasy")
+    await Book.create(title="LOTR", shelf=shelf)
+    serializers = await BookShelfIdSerializer.from_queryset(Book.all())
+    assert [serializer.shelf_id for serializer in serializers] == [shelf.id]
@@ -0,0 +1,117 @@
+import warnings
+
+import pytest
+
+from tests.models import Book, BookShelf, Node
+from tortoise_serializer import (
+    ContextType,
+    LazyFetchWarning,
+    ModelSerializer,
+    Serializer,
+    TortoiseSerializerLazyFetchException,
+    ensure_fetched_fields,
+    get_lazy_fetch_report,
+    resolver,
+    strict_mode,
+)
+
+
+class ShelfNameSerializer(ModelSerializer[BookShelf]):
+    name: str
+
+
+class BookSerializer(ModelSerializer[Book]):
+    title: str
+    shelf: ShelfNameSerializer | None
+
+
+class ShelfSerializer(ModelSerializer[BookShelf]):
+    name: str
+    books: list[BookSerializer]
+
+
+@pytest.fixture
+async def shelf() -> BookShelf:
+    shelf = await BookShelf.create(name="Fantasy")
+    await Book.create(title="LOTR", shelf=shelf)
+    await Book.create(title="The Hobbit", shelf=shelf)
+    return shelf
+
+
+async def test_strict_mode_raise(shelf: BookShelf):
+    with strict_mode("raise"):
+        with pytest.raises(TortoiseSerializerLazyFetchException) as error:
+            await ShelfSerializer.from_queryset(BookShelf.filter(id=shelf.id))
+        assert error.value.fetch.prefetch_paths == ("books",)
+        assert "prefetch_related('books')" in str(error.value)
+
+        # nothing to fetch lazily
+        await ShelfSerializer.from_queryset(
+            BookShelf.filter(id=shelf.id), prefetch=True
+        )
+        # a single instance is not a N+1
+        await ShelfSerializer.from_tortoise_orm(shelf)
+
+
+async def test_strict_mode_record(shelf: BookShelf):
+    with strict_mode("record") as report:
+        await ShelfSerializer.from_queryset(BookShelf.filter(id=shelf.id))
+    assert report.prefetch_paths == ["books", "books__shelf"]
+    books_fetch, shelf_fetch = report.fetches
+    assert books_fetch.serializer is ShelfSerializer
+    assert shelf_fetch.serializer is BookSerializer
+    assert shelf_fetch.relations == ("shelf",)
+    assert shelf_fetch.instances_count == 2
+
+    with pytest.raises(ValueError):
+        with strict_mode("ignore"):
+            pass
+
+
+async def test_strict_mode_warns_once(shelf: BookShelf):
+    with strict_mode("warn"):
+        with pytest.warns(LazyFetchWarning) as record:
+            for _ in range(3):
+                await BookSerializer.from_queryset(Book.filter(shelf=shelf))
+    assert len(record) == 1
+    assert "prefetch_related('shelf')" in str(record[0].message)
+
+
+async def test_strict_mode_environment_and_class_flag(
+    shelf: BookShelf, monkeypatch
+):
+    monkeypatch.setenv("TORTOISE_SERIALIZER_STRICT", "record")
+    report = get_lazy_fetch_report()
+    report.fetches.clear()
+    await BookSerializer.from_queryset(Book.filter(shelf=shelf))
+    assert report.prefetch_paths == ["shelf"]
+    report.fetches.clear()
+    monkeypatch.delenv("TORTOISE_SERIALIZER_STRICT")
+
+    class StrictBookSerializer(BookSerializer):
+        strict = "raise"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        await BookSerializer.from_queryset(Book.filter(shelf=shelf))
+    with pytest.raises(TortoiseSerializerLazyFetchException):
+        await StrictBookSerializer.from_queryset(Book.filter(shelf=shelf))
+
+
+async def test_strict_mode_ensure_fetched_fields():
+    class NodeSerializer(Serializer):
+        name: str
+        children_count: int
+
+        @resolver("children_count")
+        @ensure_fetched_fields(["children"])
+        async def resolve_children_count(
+            cls, instance: Node, context: ContextType
+        ) -> int:
+            return len(instance.children)
+
+    root = await Node.create(name="root")
+    await Node.create(name="child", parent=root)
+    with strict_mode("record") as report:
+        await NodeSerializer.from_queryset(Node.filter(id=root.id))
+    assert report.prefetch_paths == ["children"]
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from tortoise.backends.sqlite.client import SqliteClient
+from tortoise.transactions import in_transaction
+
+from tests.models import Book, BookShelf
+from tortoise_serializer import ContextType, ModelSerializer, resolver
+from tortoise_serializer.testing import (
+    assert_max_queries,
+    assert_num_queries,
+    capture_queries,
+)
+
+
+class BookSerializer(ModelSerializer[Book]):
+    title: str
+
+
+class ShelfSerializer(ModelSerializer[BookShelf]):
+    name: str
+    books: list[BookSerializer]
+
+
+class ShelfWithCountSerializer(ModelSerializer[BookShelf]):
+    name: str
+    books_count: int
+
+    @resolver("books_count")
+    async def resolve_books_count(
+        cls, instance: BookShelf, context: ContextType
+    ) -> int:
+        # one query per shelf
+        return await Book.filter(shelf_id=instance.id).count()
+
+
+@pytest.fixture
+async def shelves() -> list[BookShelf]:
+    shelves = [await BookShelf.create(name=f"shelf {i}") for i in range(3)]
+    for shelf in shelves:
+        await Book.create(title=f"book of {shelf.name}", shelf=shelf)
+    return shelves
+
+
+async def test_assert_num_queries(shelves: list[BookShelf]):
+    with assert_num_queries(2) as capture:
+        serializers = await ShelfSerializer.from_queryset(
+            BookShelf.all(), prefetch=True
+        )
+    assert len(serializers) == 3
+    assert capture.sql[0].startswith("SELECT")
+    assert capture[1].method == "execute_query"
+
+    with pytest.raises(AssertionError, match="2 queries executed, 1 expected"):
+        with assert_num_queries(1):
+            await ShelfSerializer.from_queryset(BookShelf.all(), prefetch=True)
+
+
+async def test_assert_max_queries(shelves: list[BookShelf]):
+    with assert_max_queries(2):
+        await ShelfSerializer.from_queryset(BookShelf.all(), prefetch=True)
+
+    with pytest.raises(AssertionError) as error:
+        with assert_max_queries(2):
+            await ShelfWithCountSerializer.from_queryset(BookShelf.all())
+    message = str(error.value)
+    assert message.startswith("4 queries executed, 2 expected at most:\n1. ")
+    assert "\n4. SELECT COUNT(*)" in message
+
+    # the exceptions of the block are not hidden by the assertion
+    with pytest.raises(ValueError):
+        with assert_max_queries(0):
+            await BookShelf.all()
+            raise ValueError()
+
+
+async def test_capture_queries_in_transaction():
+    execute_query = SqliteClient.execute_query
+    with capture_queries() as capture:
+        async with in_transaction():
+            await BookShelf.create(name="Fantasy")
+        await BookShelf.all()
+    assert [query.method for query in capture] == [
+        "execute_insert",
+        "execute_query",
+    ]
+    assert capture[0].values == ["Fantasy"]
+
+    # the client methods are restored once every block is over
+    assert SqliteClient.execute_query is execute_query
+
+
+async def test_capture_queries_ignore_other_tasks():
+    started = asyncio.Event()
+
+    async def background() -> None:
+        await started.wait()
+        await BookShelf.all()
+
+    task = asyncio.create_task(background())
+    with capture_queries() as outer:
+        with capture_queries() as inner:
+            started.set()
+            await task
+            await BookShelf.all()
+        await Book.all()
+    assert len(inner) == 1
+    assert len(outer) == 2
@@ -1,22 +1,56 @@
-from .resolver import resolver
+from .bulk import IngestError, IngestReport
+from .cache import CacheBackend, InMemoryCache, invalidate_cache
+from .exceptions import TortoiseSerializerLazyFetchException
+from .executors import (
+    get_resolver_executor,
+    set_resolver_executor,
+    shutdown_resolver_executors,
+)
+from .metrics import InMemoryMetrics, MetricEvent, MetricsRecorder
+from .resolver import batch_resolver, memoize, resolver
 from .serializers import (
     ModelSerializer,
     Serializer,
     require_condition_or_unset,
     require_permission_or_unset,
 )
+from .strict import (
+    LazyFetch,
+    LazyFetchReport,
+    LazyFetchWarning,
+    get_lazy_fetch_report,
+    strict_mode,
+)
 from .types import ContextType, Unset, UnsetType
 from .utils import ensure_fetched_fields
 
 __all__ = [
+    "batch_resolver",
+    "CacheBackend",
     "ContextType",
     "ensure_fetched_fields",
-    "ModelSerializer",
+    "get_lazy_fetch_report",
+    "get_resolver_executor",
+    "IngestError",
+    "IngestReport",
+    "InMemoryCache",
+    "InMemoryMetrics",
+    "invalidate_cache",
+    "LazyFetch",
+    "LazyFetchReport",
+    "LazyFetchWarning",
+    "memoize",
+    "MetricEvent",
+    "MetricsRecorder",
     "ModelSerializer",
     "require_condition_or_unset",
     "require_permission_or_unset",
     "resolver",
     "Serializer",
+    "set_resolver_executor",
+    "shutdown_resolver_executors",
+    "strict_mode",
+    "TortoiseSerializerLazyFetchException",
     "Unset",
     "UnsetType",
 ]
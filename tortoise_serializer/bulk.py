@@ -0,0 +1,754 @@
+import sqlite3
+from collections.abc import AsyncGenerator, AsyncIterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, Type
+
+from pydantic import BaseModel, ValidationError
+from pypika_tortoise import Table
+from structlog import get_logger
+from tortoise import Model
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import BaseORMException
+from tortoise.fields.relational import (
+    BackwardFKRelation,
+    ForeignKeyFieldInstance,
+    ManyToManyFieldInstance,
+    RelationalField,
+    ReverseRelation,
+)
+from tortoise.signals import Signals
+from tortoise.transactions import in_transaction
+
+from tortoise_serializer.cache import _on_write, invalidate_cache
+from tortoise_serializer.exceptions import TortoiseSerializerException
+from tortoise_serializer.types import ContextType, Unset
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise_serializer.serializers import ModelSerializer, Serializer
+
+logger = get_logger()
+
+
+def _supports_returning(db: BaseDBAsyncClient) -> bool:
+    """Whether `db` can return the generated columns of a multi rows
+    INSERT, in the order of the rows"""
+    dialect = db.capabilities.dialect
+    if dialect == "postgres":
+        return True
+    return dialect == "sqlite" and sqlite3.sqlite_version_info >= (3, 35)
+
+
+def _get_max_parameters(db: BaseDBAsyncClient) -> int:
+    """Upper bound of the parameters of a single query on `db`"""
+    if db.capabilities.dialect == "sqlite":
+        return 32766 if sqlite3.sqlite_version_info >= (3, 32) else 999
+    return 32767
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for index in range(0, len(items), size):
+        yield items[index : index + size]
+
+
+async def iter_batches(
+    items: AsyncIterable[Any] | Iterable[Any], size: int
+) -> AsyncGenerator[list[Any], None]:
+    """Group the items of a sync or async iterable in lists of `size`"""
+    batch: list[Any] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            batch.append(item)
+            if len(batch) == size:
+                yield batch
+                batch = []
+    else:
+        for item in items:
+            batch.append(item)
+            if len(batch) == size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _get_insert_returning_sql(
+    db: BaseDBAsyncClient, table: Table, columns: Sequence[str], rows: int
+) -> str:
+    """Return a multi rows INSERT for PostgreSQL or SQLite, rendered by hand:
+    pypika takes longer than the query itself for large batches"""
+    if db.capabilities.dialect == "postgres":
+        parameters = (f"${index + 1}" for index in range(rows * len(columns)))
+    else:
+        parameters = ("?" for _ in range(rows * len(columns)))
+    row = f"({', '.join(['{}'] * len(columns))})"
+    values = ", ".join([row] * rows).format(*parameters)
+    quoted_columns = ", ".join(f'"{column}"' for column in columns)
+    table_sql = table.get_sql(db.query_class.SQL_CONTEXT)
+    return f"INSERT INTO {table_sql} ({quoted_columns}) VALUES {values}"
+
+
+async def _insert_returning(
+    model_class: Type[Model],
+    instances: Sequence[Model],
+    batch_size: int | None,
+    db: BaseDBAsyncClient,
+) -> None:
+    """Insert `instances` with multi rows `INSERT ... RETURNING` queries
+    and set the generated columns on them.
+
+    Neither database promises to return the rows in the order of the
+    VALUES (SQLite documents it as arbitrary), but both generate the
+    primary keys in that order: the returned rows are matched to the
+    instances by sorting them on their generated primary key.
+    """
+    meta = model_class._meta
+    field_names = [
+        field_name
+        for field_name, field_object in meta.fields_map.items()
+        if field_name in meta.fields_db_projection
+        and not field_object.generated
+    ]
+    columns = [meta.fields_db_projection[name] for name in field_names]
+    pk_column = meta.fields_db_projection[meta.pk_attr]
+    generated_columns = [pk_column] + [
+        column for column in meta.generated_db_fields if column != pk_column
+    ]
+    generated = [
+        meta.fields_db_projection_reverse[column]
+        for column in generated_columns
+    ]
+    returning = ", ".join(f'"{column}"' for column in generated_columns)
+    size = _get_max_parameters(db) // max(len(columns), 1)
+    if batch_size:
+        size = min(size, batch_size)
+    for chunk in _chunks(instances, size):
+        values = [
+            meta.fields_map[field_name].to_db_value(
+                getattr(instance, field_name), instance
+            )
+            for instance in chunk
+            for field_name in field_names
+        ]
+        _, rows = await db.execute_query(
+            _get_insert_returning_sql(db, meta.basetable, columns, len(chunk))
+            + f" RETURNING {returning}",
+            values,
+        )
+        rows = sorted(rows, key=lambda row: row[0])
+        for instance, row in zip(chunk, rows, strict=True):
+            for index, field_name in enumerate(generated):
+                setattr(
+                    instance,
+                    field_name,
+                    meta.fields_map[field_name].to_python_value(row[index]),
+                )
+
+
+async def insert_instances(
+    model_class: Type[Model],
+    instances: Sequence[Model],
+    batch_size: int | None = None,
+) -> None:
+    """Insert the (unsaved) `instances` of `model_class` with as few queries
+    as the database allows, their primary keys are set afterward.
+
+    The instances having their primary key already go through
+    `bulk_create`. The other ones get theirs from `INSERT ... RETURNING` on
+    PostgreSQL and SQLite, and are saved one by one on the other databases.
+    No `pre_save` / `post_save` signal is sent, the output cache entries
+    embedding the new instances (their parents) are evicted here.
+    """
+    if not instances:
+        return
+    db = model_class._choose_db(True)
+    with_pk = [instance for instance in instances if instance.pk is not None]
+    without_pk = [instance for instance in instances if instance.pk is None]
+    if with_pk:
+        await model_class.bulk_create(
+            with_pk, batch_size=batch_size, using_db=db
+        )
+    if without_pk:
+        meta = model_class._meta
+        if (
+            _supports_returning(db)
+            and meta.pk.generated
+            and len(meta.fields_db_projection) > 1
+        ):
+            await _insert_returning(model_class, without_pk, batch_size, db)
+        else:
+            for instance in without_pk:
+                await instance.save(using_db=db, force_create=True)
+    for instance in instances:
+        instance._saved_in_db = True
+        # no `post_save` signal was sent
+        await invalidate_cache(instance)
+
+
+async def insert_links(
+    relation: ManyToManyFieldInstance,
+    links: Iterable[tuple[Model, Model]],
+    batch_size: int | None = None,
+) -> None:
+    """Insert the (instance, related instance) pairs of the many to many
+    `relation` into its through table, without checking for the existing
+    ones, and evict the output cache entries embedding the relation"""
+    model_class: Type[Model] = relation.model
+    db = model_class._choose_db(True)
+    pk_to_db = model_class._meta.pk.to_db_value
+    related_pk_to_db = relation.related_model._meta.pk.to_db_value
+    links = list(links)
+    rows = list(
+        dict.fromkeys(
+            (
+                related_pk_to_db(related.pk, related),
+                pk_to_db(instance.pk, instance),
+            )
+            for instance, related in links
+        )
+    )
+    through_table = Table(relation.through)
+    size = _get_max_parameters(db) // 2
+    if batch_size:
+        size = min(size, batch_size)
+    for chunk in _chunks(rows, size):
+        query = (
+            db.query_class.into(through_table)
+            .columns(
+                through_table[relation.forward_key],
+                through_table[relation.backward_key],
+            )
+            .insert(*chunk)
+        )
+        await db.execute_query(*query.get_parameterized_sql())
+    for instance in {id(instance): instance for instance, _ in links}.values():
+        await invalidate_cache(instance, [relation.model_field_name])
+    if relation.related_name:
+        for related in {id(related): related for _, related in links}.values():
+            await invalidate_cache(related, [relation.related_name])
+
+
+def has_save_listeners(model_class: Type[Model]) -> bool:
+    """Whether `pre_save` / `post_save` listeners are registered on
+    `model_class`: the bulk inserts would skip them. The output cache
+    invalidation doesn't count, `insert_instances` does it itself."""
+    return any(
+        listener is not _on_write
+        for signal in (Signals.pre_save, Signals.post_save)
+        for listener in Model._listeners[signal].get(model_class, ())
+    )
+
+
+def get_auto_now_fields(model_class: Type[Model]) -> set[str]:
+    """Return the fields of `model_class` set on every write"""
+    return {
+        field_name
+        for field_name, field_object in model_class._meta.fields_map.items()
+        if getattr(field_object, "auto_now", False)
+    }
+
+
+def get_forward_field_name(relation: BackwardFKRelation) -> str:
+    """Return the name of the foreign key (or one to one) field a backward
+    relation comes from, on the related model"""
+    related_meta = relation.related_model._meta
+    for field_name in related_meta.fk_fields | related_meta.o2o_fields:
+        if (
+            related_meta.fields_map[field_name].source_field
+            == relation.relation_field
+        ):
+            return field_name
+    raise ValueError(f"No foreign key for {relation.relation_field}")
+
+
+@dataclass(slots=True, eq=False)
+class PendingInstance:
+    """An instance waiting for its insertion by a `BulkCreation`
+
+    Attributes:
+        instance: the unsaved instance
+        parents: (foreign key field name, instance it points to) to assign
+            once the instances pointed to have their primary key
+        inserted: whether the instance has been inserted already
+    """
+
+    instance: Model
+    parents: list[tuple[str, "PendingInstance"]] = field(default_factory=list)
+    inserted: bool = False
+
+    def get_waited_models(self) -> set[Type[Model]] | None:
+        """Return the models of the parents not inserted yet, None when
+        there is none"""
+        models = {
+            type(parent.instance)
+            for _, parent in self.parents
+            if not parent.inserted
+        }
+        return models or None
+
+
+class BulkCreation:
+    """Instances to create together, grouped by model: a model is inserted
+    with `bulk_create` once every instance it points to is, the models
+    pointing to themselves (trees) being inserted level by level. The many
+    to many links come last with one insert per relation.
+    """
+
+    def __init__(self) -> None:
+        self.pendings: list[PendingInstance] = []
+        self.links: dict[
+            ManyToManyFieldInstance,
+            list[tuple[PendingInstance, PendingInstance]],
+        ] = {}
+
+    def add(
+        self,
+        instance: Model,
+        parents: list[tuple[str, PendingInstance]] | None = None,
+    ) -> PendingInstance:
+        """Schedule the insertion of `instance` after the instances its
+        foreign keys point to"""
+        pending = PendingInstance(instance, parents or [])
+        self.pendings.append(pending)
+        return pending
+
+    def link(
+        self,
+        relation: ManyToManyFieldInstance,
+        instance: PendingInstance,
+        related: PendingInstance,
+    ) -> None:
+        """Schedule the insertion of a many to many link"""
+        self.links.setdefault(relation, []).append((instance, related))
+
+    def _get_next_groups(self) -> dict[Type[Model], list[PendingInstance]]:
+        """Return the instances to insert now, by model"""
+        ready: dict[Type[Model], list[PendingInstance]] = {}
+        # models waiting for the insertion of another model
+        blocked: set[Type[Model]] = set()
+        for pending in self.pendings:
+            model_class = type(pending.instance)
+            waited_models = pending.get_waited_models()
+            if waited_models is None:
+                ready.setdefault(model_class, []).append(pending)
+            elif waited_models != {model_class}:
+                blocked.add(model_class)
+        # instances pointing to each other across models (cycles) are
+        # inserted as soon as possible instead
+        groups = {
+            model_class: pendings
+            for model_class, pendings in ready.items()
+            if model_class not in blocked
+        }
+        return groups or ready
+
+    async def execute(self, batch_size: int | None = None) -> None:
+        while self.pendings:
+            for model_class, pendings in self._get_next_groups().items():
+                for pending in pendings:
+                    for field_name, parent in pending.parents:
+                        setattr(pending.instance, field_name, parent.instance)
+                await insert_instances(
+                    model_class,
+                    [pending.instance for pending in pendings],
+                    batch_size,
+                )
+                for pending in pendings:
+                    pending.inserted = True
+            self.pendings = [
+                pending for pending in self.pendings if not pending.inserted
+            ]
+        for relation, links in self.links.items():
+            await insert_links(
+                relation,
+                (
+                    (instance.instance, related.instance)
+                    for instance, related in links
+                ),
+                batch_size,
+            )
+
+
+@dataclass(slots=True)
+class IngestError:
+    """A batch `ModelSerializer.ingest` failed to create
+
+    Attributes:
+        batch: index of the batch, from 0
+        offset: index of the first record of the batch in the input
+        size: number of records in the batch
+        error: the validation or database error
+    """
+
+    batch: int
+    offset: int
+    size: int
+    error: Exception
+
+
+@dataclass(slots=True)
+class IngestReport:
+    """Outcome of `ModelSerializer.ingest`
+
+    Attributes:
+        created: number of records created
+        errors: the failed batches, their records are not created when each
+            batch has its own transaction
+    """
+
+    created: int = 0
+    errors: list[IngestError] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        """Number of records in the failed batches"""
+        return sum(error.size for error in self.errors)
+
+
+def get_creation_data(
+    serializer: "ModelSerializer", kwargs: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Return the arguments of the model to create the instance of
+    `serializer`, without the nested relations"""
+    model_class = serializer.get_model_class()
+    data = serializer.model_dump(
+        exclude=set(serializer._get_nested_serializers())
+    )
+    # let the database generate the primary key
+    if data.get(model_class._meta.pk_attr, Unset) is None:
+        del data[model_class._meta.pk_attr]
+    return data | (kwargs or {})
+
+
+def add_to_bulk_creation(
+    serializer: "ModelSerializer",
+    creation: BulkCreation,
+    kwargs: dict[str, Any] | None = None,
+    parent: tuple[str, PendingInstance] | None = None,
+) -> PendingInstance:
+    """Schedule the creation of the instance of `serializer` and its nested
+    relations in `creation`"""
+    model_class = serializer.get_model_class()
+    parents = [parent] if parent is not None else []
+    relations: list[tuple[RelationalField, list[ModelSerializer]]] = []
+    for (
+        field_name,
+        serializers,
+    ) in serializer._get_nested_serializers().items():
+        serialized_value = getattr(serializer, field_name)
+        if serialized_value is None:
+            continue
+        serializer_class = serializer._get_nested_model_serializer(
+            field_name, serializers
+        )
+        items = [
+            item
+            if isinstance(item, BaseModel)
+            else serializer_class.model_validate(item)
+            for item in (
+                serialized_value
+                if isinstance(serialized_value, list)
+                else [serialized_value]
+            )
+        ]
+        relation = model_class._meta.fields_map[field_name]
+        if isinstance(relation, ForeignKeyFieldInstance):
+            parents.append(
+                (field_name, add_to_bulk_creation(items[0], creation))
+            )
+        else:
+            relations.append((relation, items))
+
+    instance = model_class(**get_creation_data(serializer, kwargs))
+    pending = creation.add(instance, parents)
+    for relation, items in relations:
+        if isinstance(relation, ManyToManyFieldInstance):
+            for item in items:
+                creation.link(
+                    relation, pending, add_to_bulk_creation(item, creation)
+                )
+        elif isinstance(relation, BackwardFKRelation):
+            forward_field_name = get_forward_field_name(relation)
+            for item in items:
+                add_to_bulk_creation(
+                    item, creation, parent=(forward_field_name, pending)
+                )
+    return pending
+
+
+async def create_related(
+    serializers: Sequence["ModelSerializer"],
+    context: ContextType | None,
+    kwargs: dict[str, Any],
+) -> list[Model]:
+    """Create the instances of `serializers` (of the same relation) with
+    `kwargs`: the ones `_can_bulk_create` accepts in a single bulk insert,
+    the others one by one with `create_tortoise_instance`. The bulk insert
+    sends no save signal, a model with listeners is always created one by
+    one.
+    """
+    instances: list[Model] = []
+    flat_instances: list[Model] = []
+    for serializer in serializers:
+        if serializer._can_bulk_create():
+            instance = serializer.get_model_class()(
+                **get_creation_data(serializer, kwargs)
+            )
+            flat_instances.append(instance)
+        else:
+            instance = await serializer.create_tortoise_instance(
+                _context=context, **kwargs
+            )
+        instances.append(instance)
+    if flat_instances:
+        await insert_instances(type(flat_instances[0]), flat_instances)
+    return instances
+
+
+async def partial_update_instances(
+    updates: Iterable[tuple["Serializer", Model]],
+    *,
+    batch_size: int | None = None,
+    **kwargs,
+) -> list[set[str]]:
+    """Apply `partial_update_tortoise_instance` to each (serializer,
+    instance) pair and write the changes with `bulk_update`, see
+    `Serializer.bulk_partial_update_tortoise_instances`"""
+    changes: list[set[str]] = []
+    groups: dict[tuple[Type[Model], frozenset[str]], list[Model]] = {}
+    for serializer, instance in updates:
+        changed_fields = serializer.partial_update_tortoise_instance(
+            instance, **kwargs
+        )
+        changes.append(changed_fields)
+        if changed_fields:
+            groups.setdefault(
+                (type(instance), frozenset(changed_fields)), []
+            ).append(instance)
+
+    for (model_class, changed_fields), instances in groups.items():
+        await model_class.bulk_update(
+            instances,
+            fields=sorted(changed_fields | get_auto_now_fields(model_class)),
+            batch_size=batch_size,
+        )
+        # `bulk_update` sends no signal
+        for instance in instances:
+            await invalidate_cache(instance)
+    return changes
+
+
+async def update_forward_relation(
+    instance: Model,
+    relation: ForeignKeyFieldInstance,
+    serializer: "ModelSerializer | None",
+    context: ContextType | None,
+) -> bool:
+    """Point the foreign key `relation` of `instance` to the row of
+    `serializer`: creates it when it has no primary key, updates it when it
+    has other fields set. Returns whether the column changed.
+    """
+    field_name = relation.model_field_name
+    current_pk = getattr(instance, relation.source_field)
+    if serializer is None:
+        setattr(instance, field_name, None)
+        return current_pk is not None
+    pk = serializer._get_primary_key()
+    if pk is None:
+        (related,) = await create_related([serializer], context, {})
+        setattr(instance, field_name, related)
+        return True
+    if serializer.model_fields_set - {
+        serializer.get_model_class()._meta.pk_attr
+    }:
+        related = await relation.related_model.get(pk=pk)
+        await serializer.update_tortoise_instance(related, _context=context)
+        setattr(instance, field_name, related)
+    else:
+        setattr(instance, relation.source_field, pk)
+    return pk != current_pk
+
+
+async def update_backward_fk(
+    instance: Model,
+    relation: BackwardFKRelation,
+    serializers: list["ModelSerializer"],
+    context: ContextType | None,
+    batch_size: int | None,
+) -> None:
+    """Make the children of the backward foreign key `relation` of
+    `instance` match `serializers`: the new ones are inserted in bulk, the
+    changed ones written with `bulk_update` and the missing ones removed
+    with a single `DELETE`.
+
+    Raises:
+        TortoiseSerializerException: a primary key of `serializers` is not
+            one of a child of `instance`
+    """
+    related_model = relation.related_model
+    children: dict[Any, Model] = {
+        child.pk: child
+        for child in await get_current_related(instance, relation)
+    }
+    kept: set[Any] = set()
+    new: list[ModelSerializer] = []
+    updates: list[tuple[ModelSerializer, Model]] = []
+    for serializer in serializers:
+        pk = serializer._get_primary_key()
+        if pk is None:
+            new.append(serializer)
+            continue
+        if pk not in children:
+            raise TortoiseSerializerException(
+                f"{related_model.__name__} {pk} is not related to"
+                f" {type(instance).__name__} {instance.pk}"
+            )
+        kept.add(pk)
+        updates.append((serializer, children[pk]))
+
+    removed = [child for pk, child in children.items() if pk not in kept]
+    if removed:
+        await related_model.filter(
+            pk__in=[child.pk for child in removed]
+        ).delete()
+        for child in removed:
+            await invalidate_cache(child)
+    await update_related(updates, context, batch_size)
+    await create_related(new, context, {relation.relation_field: instance.pk})
+
+
+async def update_many_to_many(
+    instance: Model,
+    relation: ManyToManyFieldInstance,
+    serializers: list["ModelSerializer"],
+    context: ContextType | None,
+    batch_size: int | None,
+) -> None:
+    """Make the links of the many to many `relation` of `instance` match
+    `serializers`, the related rows are kept.
+
+    Raises:
+        TortoiseSerializerException: a primary key of `serializers` doesn't
+            exist
+    """
+    related_model = relation.related_model
+    linked: dict[Any, Model] = {
+        related.pk: related
+        for related in await get_current_related(instance, relation)
+    }
+    missing_pks = {
+        pk
+        for serializer in serializers
+        if (pk := serializer._get_primary_key()) is not None
+        and pk not in linked
+    }
+    added: dict[Any, Model] = {}
+    if missing_pks:
+        added = {
+            related.pk: related
+            for related in await related_model.filter(pk__in=missing_pks)
+        }
+        if unknown_pks := missing_pks - added.keys():
+            raise TortoiseSerializerException(
+                f"Unknown {related_model.__name__}: {sorted(unknown_pks)}"
+            )
+
+    new: list[ModelSerializer] = []
+    updates: list[tuple[ModelSerializer, Model]] = []
+    for serializer in serializers:
+        pk = serializer._get_primary_key()
+        if pk is None:
+            new.append(serializer)
+        else:
+            updates.append((serializer, linked.get(pk) or added[pk]))
+
+    kept = {related.pk for _, related in updates}
+    removed = [related for pk, related in linked.items() if pk not in kept]
+    if removed:
+        await getattr(instance, relation.model_field_name).remove(*removed)
+    await update_related(updates, context, batch_size)
+    created = await create_related(new, context, {})
+    links = list(added.values()) + created
+    if links:
+        await insert_links(
+            relation, [(instance, related) for related in links], batch_size
+        )
+
+
+async def get_current_related(
+    instance: Model, relation: RelationalField
+) -> list[Model]:
+    """Return the rows of the to many `relation` of `instance`, from the
+    prefetched ones if any"""
+    container = getattr(instance, relation.model_field_name)
+    if isinstance(container, ReverseRelation):
+        if container._fetched:
+            return list(container.related_objects)
+        return await container.all()
+    # backward one to one
+    return await relation.related_model.filter(
+        **{relation.relation_field: instance.pk}
+    )
+
+
+async def update_related(
+    updates: Sequence[tuple["ModelSerializer", Model]],
+    context: ContextType | None,
+    batch_size: int | None,
+) -> None:
+    """Update the (serializer, instance) pairs of a relation: the ones
+    `_can_bulk_update` accepts with `bulk_update`, the others one by one
+    with `update_tortoise_instance`"""
+    flat_updates = []
+    for serializer, related in updates:
+        if serializer._can_bulk_update():
+            flat_updates.append((serializer, related))
+        else:
+            await serializer.update_tortoise_instance(
+                related, _context=context, batch_size=batch_size
+            )
+    await partial_update_instances(flat_updates, batch_size=batch_size)
+
+
+async def ingest_records(
+    serializer_class: type["ModelSerializer"],
+    records: AsyncIterable[Any] | Iterable[Any],
+    batch_size: int,
+    transaction_per_batch: bool,
+    kwargs: dict[str, Any],
+) -> IngestReport:
+    """Create the instances of `records` `batch_size` at a time, see
+    `ModelSerializer.ingest`"""
+    report = IngestReport()
+    offset = 0
+    batch_index = 0
+    async for batch in iter_batches(records, batch_size):
+        try:
+            serializers = serializer_class._get_list_adapter().validate_python(
+                batch
+            )
+            if transaction_per_batch:
+                async with in_transaction(
+                    serializer_class.get_model_class()._meta.default_connection
+                ):
+                    await serializer_class.create_tortoise_instances(
+                        serializers, **kwargs
+                    )
+            else:
+                await serializer_class.create_tortoise_instances(
+                    serializers, **kwargs
+                )
+        except (ValidationError, BaseORMException) as error:
+            logger.warning(
+                "Ingest batch failed",
+                serializer=serializer_class.__name__,
+                offset=offset,
+                error=str(error),
+            )
+            report.errors.append(
+                IngestError(batch_index, offset, len(batch), error)
+            )
+        else:
+            report.created += len(batch)
+        offset += len(batch)
+        batch_index += 1
+    return report
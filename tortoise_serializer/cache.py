@@ -0,0 +1,249 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Collection, Iterable, Mapping, Type
+
+from tortoise import Model
+from tortoise.fields.relational import ForeignKeyFieldInstance
+from tortoise.signals import Signals
+
+CachedFields = dict[str, Any]
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters of a `CacheBackend`
+
+    Attributes:
+        hits: lookups that found an entry
+        misses: lookups that did not (expired entries included)
+        evictions: entries dropped to make room for new ones
+        expirations: entries dropped because they outlived their ttl
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class CacheBackend(ABC):
+    """Storage of the serialized output of the serializers having a
+    `cache_backend`, see `Serializer.get_cache_key`.
+
+    The values are the `model_dump(exclude_unset=True)` of the serializers,
+    the implementations must count the lookups in `stats`.
+
+    Each entry is stored with tags naming the rows and the relations it
+    embeds (see `get_instance_tag` and `get_relation_tag`), writes evict the
+    entries by tag with `delete_tagged`.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get_many(self, keys: Iterable[str]) -> dict[str, CachedFields]:
+        """Return the entries found for `keys`, missing ones are omitted"""
+
+    @abstractmethod
+    async def set_many(
+        self,
+        entries: Mapping[str, CachedFields],
+        tags: Mapping[str, Collection[str]] | None = None,
+    ) -> None:
+        """Store all the `entries`, `tags` maps their keys to their tags"""
+
+    @abstractmethod
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Remove the given keys, unknown ones are ignored"""
+
+    @abstractmethod
+    async def delete_tagged(self, tags: Iterable[str]) -> None:
+        """Remove the entries having any of the given tags"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry"""
+
+    async def get(self, key: str) -> CachedFields | None:
+        return (await self.get_many((key,))).get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: CachedFields,
+        tags: Collection[str] = (),
+    ) -> None:
+        await self.set_many({key: value}, {key: tags})
+
+
+class InMemoryCache(CacheBackend):
+    """Least recently used cache living in the current process
+
+    Args:
+        max_size: how many entries to keep, the least recently used ones
+            are evicted first
+        ttl: how many seconds an entry stays valid, forever if None
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float | None = None):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (expiration time, value)
+        self._entries: OrderedDict[str, tuple[float | None, CachedFields]] = (
+            OrderedDict()
+        )
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._tags_by_key: dict[str, Collection[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, CachedFields]:
+        now = time.monotonic()
+        found = {}
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= now:
+                self._delete(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                continue
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            found[key] = entry[1]
+        return found
+
+    async def set_many(
+        self,
+        entries: Mapping[str, CachedFields],
+        tags: Mapping[str, Collection[str]] | None = None,
+    ) -> None:
+        expiration = (
+            time.monotonic() + self.ttl if self.ttl is not None else None
+        )
+        for key, value in entries.items():
+            self._delete(key)
+            self._entries[key] = (expiration, value)
+            key_tags = tags.get(key, ()) if tags else ()
+            if key_tags:
+                self._tags_by_key[key] = key_tags
+                for tag in key_tags:
+                    self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._delete(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._delete(key)
+
+    async def delete_tagged(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._keys_by_tag.get(tag, set()).copy():
+                self._delete(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self._tags_by_key.clear()
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+        for tag in self._tags_by_key.pop(key, ()):
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
+
+
+def get_instance_tag(model_class: Type[Model], pk: Any) -> str:
+    """Tag of the cache entries embedding the given row"""
+    return f"{model_class._meta.full_name}:{pk}"
+
+
+def get_relation_tag(
+    model_class: Type[Model], pk: Any, field_name: str
+) -> str:
+    """Tag of the cache entries embedding the to-many relation `field_name`
+    of the given row"""
+    return f"{model_class._meta.full_name}:{pk}:{field_name}"
+
+
+# model -> backends holding entries embedding instances of this model
+_backends_by_model: dict[Type[Model], list[CacheBackend]] = {}
+
+
+def register_cache_invalidation(
+    model_class: Type[Model], backend: CacheBackend
+) -> None:
+    """Evict the entries of `backend` embedding an instance of
+    `model_class` whenever one is saved or deleted, using tortoise's
+    `post_save` and `post_delete` signals."""
+    backends = _backends_by_model.get(model_class)
+    if backends is None:
+        backends = _backends_by_model[model_class] = []
+        model_class.register_listener(Signals.post_save, _on_write)
+        model_class.register_listener(Signals.post_delete, _on_write)
+    if all(registered is not backend for registered in backends):
+        backends.append(backend)
+
+
+def get_invalidation_tags(instance: Model) -> set[str]:
+    """Return the tags of the entries to evict when `instance` is written:
+    the ones embedding it and the ones embedding the reverse side of its
+    ForeignKey / OneToOne relations (a new child changes its parent)."""
+    model_class = type(instance)
+    tags = {get_instance_tag(model_class, instance.pk)}
+    fields_map = model_class._meta.fields_map
+    for field_name in (
+        model_class._meta.fk_fields | model_class._meta.o2o_fields
+    ):
+        field = fields_map[field_name]
+        if not isinstance(field, ForeignKeyFieldInstance):
+            continue
+        related_pk = getattr(instance, field.source_field, None)
+        if related_pk is not None and field.related_name:
+            tags.add(
+                get_relation_tag(
+                    field.related_model, related_pk, field.related_name
+                )
+            )
+    return tags
+
+
+async def invalidate_cache(
+    instance: Model, relations: Iterable[str] = ()
+) -> None:
+    """Evict the cache entries embedding `instance`: signals already do it
+    on `save` and `delete`, call it for the writes tortoise doesn't signal
+    (`QuerySet.update`, ManyToMany changes...).
+
+    Args:
+        instance: the written instance
+        relations: to-many relations of `instance` that changed
+    """
+    model_class = type(instance)
+    backends = _backends_by_model.get(model_class)
+    if not backends:
+        return
+    tags = get_invalidation_tags(instance)
+    tags.update(
+        get_relation_tag(model_class, instance.pk, field_name)
+        for field_name in relations
+    )
+    for backend in backends:
+        await backend.delete_tagged(tags)
+
+
+async def _on_write(
+    sender: Type[Model], instance: Model, *args: Any, **kwargs: Any
+) -> None:
+    await invalidate_cache(instance)
@@ -12,3 +12,13 @@ class TortoiseSerializerClassMethodException(TortoiseSerializerException):
             f"{self._faulty_class.__name__}.{self._field_name}"
             "Reason: You have to declare that resolver as a @classmethod"
         )
+
+
+class TortoiseSerializerLazyFetchException(TortoiseSerializerException):
+    """A relation was fetched lazily while `strict_mode` is "raise" """
+
+    def __init__(self, fetch) -> None:
+        self.fetch = fetch
+
+    def __str__(self) -> str:
+        return self.fetch.describe()
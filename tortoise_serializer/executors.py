@@ -0,0 +1,65 @@
+import os
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Callable, Literal, Sequence, get_args
+
+from tortoise_serializer.types import ContextType
+
+# where a sync resolver runs: on the event loop or in a pool, see
+# `resolver(..., executor=...)` and `Serializer.resolver_executor`
+ExecutorKind = Literal["inline", "thread", "process"]
+
+_executors: dict[str, Executor] = {}
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in get_args(ExecutorKind) or kind == "inline":
+        raise ValueError(f"Invalid resolver executor: {kind}")
+
+
+def set_resolver_executor(
+    kind: Literal["thread", "process"], executor: Executor
+) -> None:
+    """Run the resolvers offloaded to `kind` in `executor` instead of the
+    default pool, the previous executor is not shut down"""
+    _check_kind(kind)
+    _executors[kind] = executor
+
+
+def get_resolver_executor(kind: Literal["thread", "process"]) -> Executor:
+    """Return the executor of `kind`, creates the default one if needed:
+    as many workers as CPUs for the processes, the `ThreadPoolExecutor`
+    default for the threads"""
+    _check_kind(kind)
+    executor = _executors.get(kind)
+    if executor is None:
+        if kind == "thread":
+            executor = ThreadPoolExecutor(
+                thread_name_prefix="tortoise_serializer"
+            )
+        else:
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        _executors[kind] = executor
+    return executor
+
+
+def shutdown_resolver_executors(wait: bool = True) -> None:
+    """Shut down the executors, the next offloaded resolver creates new
+    ones"""
+    executors = list(_executors.values())
+    _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+def call_resolver_chunk(
+    resolver: Callable[[Any, ContextType], Any],
+    instances: Sequence[Any],
+    context: ContextType,
+) -> list[Any]:
+    """Call a sync resolver for a chunk of instances: one job of the
+    executor. Module level so a process pool can pickle it."""
+    return [resolver(instance, context) for instance in instances]
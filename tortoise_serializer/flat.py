@@ -0,0 +1,85 @@
+from enum import Enum
+from time import perf_counter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from tortoise.queryset import QuerySet
+
+from tortoise_serializer.metrics import MetricEvent
+from tortoise_serializer.types import ContextType
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise_serializer.serializers import ModelSerializer
+
+
+async def serialize_values(
+    serializer_class: type["ModelSerializer"],
+    queryset: QuerySet,
+    context: ContextType,
+    by_alias: bool | None,
+    by_name: bool | None,
+    trusted: bool,
+) -> list["ModelSerializer"]:
+    """Serialize the rows of `queryset` for a flat serializer (see
+    `SerializationPlan.flat`): they are fetched with `queryset.values()`
+    and no model instance is built"""
+    model_class = serializer_class.get_model_class()
+    pk_attr = model_class._meta.pk_attr
+    only_fields = serializer_class.get_only_fetch_fields()
+    if pk_attr not in only_fields:
+        only_fields.append(pk_attr)
+    rows = await queryset.values(*only_fields)
+    metrics = serializer_class.metrics
+    if metrics is None:
+        return [
+            serialize_row(
+                serializer_class, row, context, by_alias, by_name, trusted
+            )
+            for row in rows
+        ]
+    serializers = []
+    for row in rows:
+        start = perf_counter()
+        serializers.append(
+            serialize_row(
+                serializer_class, row, context, by_alias, by_name, trusted
+            )
+        )
+        metrics.record(
+            serializer_class,
+            MetricEvent.FROM_TORTOISE_ORM,
+            perf_counter() - start,
+        )
+    return serializers
+
+
+def serialize_row(
+    serializer_class: type["ModelSerializer"],
+    row: dict[str, Any],
+    context: ContextType,
+    by_alias: bool | None,
+    by_name: bool | None,
+    trusted: bool,
+) -> "ModelSerializer":
+    """Same as `from_tortoise_orm` for a row of a flat serializer"""
+    model_class = serializer_class.get_model_class()
+    plan = serializer_class._get_plan()
+    enum_fields = plan.enum_fields
+    fields_values = {}
+    for field_name in plan.model_fields:
+        field_value = row[field_name]
+        if field_name in enum_fields and isinstance(field_value, Enum):
+            field_value = field_value.value
+        fields_values[field_name] = field_value
+
+    if plan.sync_resolvers:
+        # `row_only` resolvers get the columns as attributes
+        instance = SimpleNamespace(pk=row[model_class._meta.pk_attr], **row)
+        serializer_class._call_sync_resolvers(
+            plan.sync_resolvers, instance, context, fields_values
+        )
+
+    serializer_class._remove_unsets(fields_values)
+    return serializer_class._validate(
+        fields_values, model_class, by_alias, by_name, trusted
+    )
@@ -0,0 +1,226 @@
+import bisect
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import StrEnum
+from time import perf_counter
+from typing import Any, Awaitable, Sequence
+
+from tortoise_serializer.types import T
+
+# upper bounds (in seconds) of the histogram buckets, from 10µs to 10s
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MetricEvent(StrEnum):
+    """What a measure is about
+
+    Attributes:
+        FROM_TORTOISE_ORM: serialization of one instance (or one row of a
+            flat serializer), nested serializers included
+        RESOLVER: call of a resolver, the target being its field
+        BATCH_RESOLVER: call of a batch resolver for `count` instances
+        MODEL_VALIDATE: pydantic validation (or trusted construction)
+        FETCH_RELATED: query loading the relation `target` of `count`
+            instances that were not prefetched
+    """
+
+    FROM_TORTOISE_ORM = "from_tortoise_orm"
+    RESOLVER = "resolver"
+    BATCH_RESOLVER = "batch_resolver"
+    MODEL_VALIDATE = "model_validate"
+    FETCH_RELATED = "fetch_related"
+
+
+class MetricsRecorder(ABC):
+    """Receive the measures of the serializers having `metrics` set, see
+    `Serializer.metrics`.
+
+    `record` is called inline by the serialization: implementations must
+    be fast and must not do any I/O.
+    """
+
+    @abstractmethod
+    def record(
+        self,
+        serializer: type,
+        event: MetricEvent,
+        duration: float,
+        target: str | None = None,
+        count: int = 1,
+    ) -> None:
+        """Record a measure
+
+        Args:
+            serializer: the serializer class being measured
+            event: what was measured
+            duration: wall time in seconds
+            target: the field (resolver, relation...) concerned, if any
+            count: how many instances the measure covers
+        """
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Distribution of durations
+
+    Attributes:
+        bounds: upper bounds of the buckets, the last bucket holds anything
+            above the last bound
+        buckets: how many measures fell in each bucket
+        calls: how many measures were recorded
+        count: how many instances they covered
+        total: sum of the durations
+    """
+
+    bounds: tuple[float, ...]
+    buckets: list[int] = field(default_factory=list)
+    calls: int = 0
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.buckets:
+            self.buckets = [0] * (len(self.bounds) + 1)
+
+    def observe(self, duration: float, count: int = 1) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, duration)] += 1
+        self.calls += 1
+        self.count += count
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding the given
+        percentile, `max` for the last bucket"""
+        if not self.calls:
+            return 0.0
+        rank = self.calls * percent / 100
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "min": self.min if self.calls else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(
+                zip(
+                    [*map(str, self.bounds), "+inf"],
+                    self.buckets,
+                )
+            ),
+        }
+
+
+def _get_serializer_name(serializer: type) -> str:
+    """Qualified name of `serializer`: the serializers with the same name in
+    different modules are measured apart"""
+    return f"{serializer.__module__}.{serializer.__qualname__}"
+
+
+class InMemoryMetrics(MetricsRecorder):
+    """Keep an histogram per serializer, event and target in memory
+
+    Args:
+        buckets: upper bounds of the histograms buckets, in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: dict[tuple[str, str, str | None], Histogram] = {}
+
+    def record(
+        self,
+        serializer: type,
+        event: MetricEvent,
+        duration: float,
+        target: str | None = None,
+        count: int = 1,
+    ) -> None:
+        key = (_get_serializer_name(serializer), event, target)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(self.buckets)
+        histogram.observe(duration, count)
+
+    def get(
+        self,
+        serializer: type,
+        event: MetricEvent,
+        target: str | None = None,
+    ) -> Histogram | None:
+        """Return the histogram of the given measure, if recorded"""
+        return self._histograms.get(
+            (_get_serializer_name(serializer), event, target)
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the histograms as dictionaries keyed by
+        `"<module>.<serializer>.<event>"` or
+        `"<module>.<serializer>.<event>:<target>"`, slowest total first"""
+        histograms = sorted(
+            self._histograms.items(),
+            key=lambda item: item[1].total,
+            reverse=True,
+        )
+        return {
+            f"{serializer}.{event}"
+            + (f":{target}" if target is not None else ""): histogram.as_dict()
+            for (serializer, event, target), histogram in histograms
+        }
+
+    def reset(self) -> None:
+        self._histograms.clear()
+
+
+async def measure(
+    awaitable: Awaitable[T],
+    recorder: MetricsRecorder,
+    serializer: type,
+    event: MetricEvent,
+    target: str | None = None,
+    count: int = 1,
+) -> T:
+    """Await `awaitable` and record its wall time"""
+    start = perf_counter()
+    try:
+        return await awaitable
+    finally:
+        recorder.record(
+            serializer, event, perf_counter() - start, target, count
+        )
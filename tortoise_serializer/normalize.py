@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Any, Sequence, Type
+
+from pydantic import BaseModel
+from tortoise import Model
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise_serializer.serializers import Serializer
+
+# model name -> primary key -> dumped row
+Included = dict[str, dict[Any, dict[str, Any]]]
+
+
+def normalize_serializers(
+    serializers: Sequence["Serializer"],
+    instances: Sequence[Model],
+    *,
+    by_alias: bool = False,
+    exclude_unset: bool = False,
+) -> dict[str, Any]:
+    """Dump `serializers` (built from `instances`, in the same order) as
+    `{"data": [...], "included": {...}}`, see `Serializer.normalize`"""
+    included: Included = {}
+    dump_options = {"by_alias": by_alias, "exclude_unset": exclude_unset}
+    data = [
+        _normalize_serializer(serializer, instance, included, dump_options)
+        for serializer, instance in zip(serializers, instances)
+    ]
+    return {"data": data, "included": included}
+
+
+def _normalize_serializer(
+    serializer: "Serializer",
+    instance: Model | None,
+    included: Included,
+    dump_options: dict[str, Any],
+) -> dict[str, Any]:
+    relations = {
+        nested.field_name: getattr(serializer, nested.field_name, None)
+        for nested in serializer._get_plan().foreign_keys
+        if instance is not None
+    }
+    output = serializer.model_dump(exclude=set(relations), **dump_options)
+    for field_name, value in relations.items():
+        if dump_options["exclude_unset"] and not serializer.has_been_set(
+            field_name
+        ):
+            continue
+        field_info = type(serializer).model_fields[field_name]
+        key = field_name
+        if dump_options["by_alias"]:
+            key = (
+                field_info.serialization_alias
+                or field_info.alias
+                or field_name
+            )
+        output[key] = _normalize_relation(
+            instance, field_name, value, included, dump_options
+        )
+    return output
+
+
+def _normalize_relation(
+    instance: Model,
+    field_name: str,
+    value: Any,
+    included: Included,
+    dump_options: dict[str, Any],
+) -> Any:
+    related = getattr(instance, field_name, None)
+    if isinstance(value, list):
+        related_objects = getattr(related, "related_objects", None)
+        if not isinstance(related_objects, list) or len(
+            related_objects
+        ) != len(value):
+            # not loaded: the relation came from the output cache
+            return [item.model_dump(**dump_options) for item in value]
+        return [
+            _normalize_serializer(
+                item, related_instance, included, dump_options
+            )
+            for item, related_instance in zip(value, related_objects)
+        ]
+    # the values of the nested serializer fields are serializers
+    if not isinstance(value, BaseModel):
+        return value
+
+    field = instance._meta.fields_map[field_name]
+    model_class: Type[Model] = field.related_model
+    if isinstance(related, Model):
+        pk = related.pk
+    else:
+        # not loaded: the relation came from the output cache
+        related = None
+        pk = getattr(instance, getattr(field, "source_field", ""), None)
+        if pk is None:
+            return value.model_dump(**dump_options)
+    table = included.setdefault(model_class.__name__, {})
+    if pk not in table:
+        table[pk] = _normalize_serializer(
+            value, related, included, dump_options
+        )
+    return pk
@@ -0,0 +1,342 @@
+from dataclasses import dataclass
+from inspect import iscoroutinefunction, ismethod
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from frozendict import frozendict
+from tortoise import Model
+from tortoise.fields.data import CharEnumFieldInstance, IntEnumFieldInstance
+from tortoise.fields.relational import RelationalField
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise_serializer.serializers import Serializer
+
+
+@dataclass(frozen=True, slots=True)
+class ResolverPlan:
+    """A resolver bound to the serializer class it has been collected from"""
+
+    field_name: str
+    resolver: Callable[..., Any]
+    is_async: bool
+    row_only: bool = False
+    # "thread" / "process" for the sync resolvers run in a pool
+    executor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class NestedSerializerPlan:
+    """Describe a field of the serializer that holds nested serializer(s)"""
+
+    field_name: str
+    serializers: tuple[Type["Serializer"], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SerializationPlan:
+    """Everything `Serializer.from_tortoise_orm` needs to know about a
+    serializer class, computed once instead of introspecting the class for
+    every serialized instance.
+
+    Attributes:
+        resolvers: field name -> resolver, as returned by `_collect_resolvers`
+        sync_resolvers: resolvers to call inline
+        async_resolvers: resolvers to run as tasks
+        offloaded_resolvers: sync resolvers to run in an executor, see
+            `Serializer._load_offloaded_resolver`
+        batch_resolvers: resolvers declared with `batch_resolver`
+        nested_serializers: every field holding nested serializers
+        foreign_keys: nested serializers fields without a resolver, this is
+            the job of `_resolve_foreignkeys`
+        model_fields: fields to read directly from the instance
+        fetch_fields: fields that may need a `fetch_related` call
+        enum_fields: fields that may hold an `Enum` instance to unpack,
+            `None` when it can't be known in advance (any field may)
+        misconfigured_resolver: name of the first resolver that is not a
+            classmethod, if any
+        trustable: whether the class can be built without validation at all,
+            see `get_trusted_fields`
+        validated_fields: fields with a `field_validator`
+        flat: whether every field is a column of the model or comes from a
+            row only resolver, see `ModelSerializer.from_queryset`
+    """
+
+    resolvers: frozendict[str, Callable[..., Any]]
+    sync_resolvers: tuple[ResolverPlan, ...]
+    async_resolvers: tuple[ResolverPlan, ...]
+    offloaded_resolvers: tuple[ResolverPlan, ...]
+    batch_resolvers: tuple[ResolverPlan, ...]
+    nested_serializers: tuple[NestedSerializerPlan, ...]
+    foreign_keys: tuple[NestedSerializerPlan, ...]
+    model_fields: tuple[str, ...]
+    fetch_fields: tuple[str, ...]
+    enum_fields: frozenset[str] | None = None
+    misconfigured_resolver: str | None = None
+    trustable: bool = False
+    validated_fields: frozenset[str] = frozenset()
+    flat: bool = False
+
+
+def _get_enum_fields(
+    field_names: tuple[str, ...], model_class: Type[Model]
+) -> frozenset[str]:
+    """Return the fields that may hold an enum for the given model:
+    the enum columns, and everything tortoise does not know about (properties
+    and such) since we can't tell what they return.
+    """
+    fields_map = model_class._meta.fields_map
+    return frozenset(
+        field_name
+        for field_name in field_names
+        if field_name not in fields_map
+        or isinstance(
+            fields_map[field_name],
+            (CharEnumFieldInstance, IntEnumFieldInstance),
+        )
+    )
+
+
+def _are_columns(
+    model_class: Type[Model], field_names: tuple[str, ...]
+) -> bool:
+    """Whether all `field_names` are plain columns of `model_class`"""
+    fields_map = model_class._meta.fields_map
+    db_fields = model_class._meta.fields_db_projection
+    return all(
+        field_name in db_fields
+        and not isinstance(fields_map[field_name], RelationalField)
+        for field_name in field_names
+    )
+
+
+# configuration keys that transform values during validation
+_TRANSFORMING_CONFIG_KEYS = (
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+)
+
+
+def _is_trustable(serializer_class: Type["Serializer"]) -> bool:
+    """Return whether the instances of `serializer_class` can be built with
+    `model_construct` and give the same result as `model_validate`.
+    """
+    config = serializer_class.model_config
+    if config.get("extra") not in (None, "ignore") or config.get("frozen"):
+        return False
+    if any(config.get(key) for key in _TRANSFORMING_CONFIG_KEYS):
+        return False
+    if (
+        serializer_class.__pydantic_decorators__.model_validators
+        or serializer_class.__private_attributes__
+        # skipped by the direct construction
+        or serializer_class.__pydantic_post_init__ is not None
+    ):
+        return False
+    return all(
+        field_info.alias is None and field_info.validation_alias is None
+        for field_info in serializer_class.model_fields.values()
+    )
+
+
+def _annotation_matches(
+    annotation: Any, field_type: type, nullable: bool
+) -> bool:
+    """Whether values of `field_type` (or None if `nullable`) are valid for
+    `annotation` as they are"""
+    if annotation is field_type:
+        return not nullable
+    if get_origin(annotation) in (Union, UnionType):
+        return set(get_args(annotation)) == {field_type, NoneType}
+    return False
+
+
+def get_trusted_fields(
+    serializer_class: Type["Serializer"], model_class: Type[Model]
+) -> frozenset[str]:
+    """Return the fields of `serializer_class` that can be read from an
+    instance of `model_class` without validation: the ones where the python
+    type of the tortoise field is exactly the annotation of the field, without
+    any constraint or validator.
+    """
+    plan = serializer_class._get_plan()
+    if not plan.trustable or "*" in plan.validated_fields:
+        return frozenset()
+    fields_map = model_class._meta.fields_map
+    trusted_fields = set()
+    for field_name in plan.model_fields:
+        tortoise_field = fields_map.get(field_name)
+        if (
+            tortoise_field is None
+            or field_name in plan.validated_fields
+            or isinstance(tortoise_field, RelationalField)
+            # enums are unpacked to their value
+            or isinstance(
+                tortoise_field, (CharEnumFieldInstance, IntEnumFieldInstance)
+            )
+            or not isinstance(tortoise_field.field_type, type)
+        ):
+            continue
+        field_info = serializer_class.model_fields[field_name]
+        if field_info.metadata:
+            continue
+        if _annotation_matches(
+            field_info.annotation,
+            tortoise_field.field_type,
+            tortoise_field.null,
+        ):
+            trusted_fields.add(field_name)
+    return frozenset(trusted_fields)
+
+
+def build_plan(
+    serializer_class: Type["Serializer"],
+    model_class: Type[Model] | None = None,
+) -> SerializationPlan:
+    """Compile the `SerializationPlan` of `serializer_class`
+
+    Args:
+        serializer_class: the serializer to compile
+        model_class: the model the serializer is bound to if known, used to
+            restrict enum unpacking to the relevant fields
+    """
+    resolvers = serializer_class._collect_resolvers()
+    sync_resolvers: list[ResolverPlan] = []
+    async_resolvers: list[ResolverPlan] = []
+    offloaded_resolvers: list[ResolverPlan] = []
+    misconfigured_resolver = None
+    for field_name, field_resolver in resolvers.items():
+        if not ismethod(field_resolver):
+            misconfigured_resolver = misconfigured_resolver or field_name
+            continue
+        is_async = iscoroutinefunction(field_resolver)
+        executor = (
+            None
+            if is_async
+            else getattr(
+                field_resolver,
+                "_executor",
+                serializer_class.resolver_executor,
+            )
+        )
+        resolver_plan = ResolverPlan(
+            field_name,
+            field_resolver,
+            is_async,
+            getattr(field_resolver, "_row_only", False),
+            executor if executor != "inline" else None,
+        )
+        if is_async:
+            async_resolvers.append(resolver_plan)
+        elif resolver_plan.executor is not None:
+            offloaded_resolvers.append(resolver_plan)
+        else:
+            sync_resolvers.append(resolver_plan)
+
+    batch_resolvers = tuple(
+        ResolverPlan(
+            field_name, field_resolver, iscoroutinefunction(field_resolver)
+        )
+        for field_name, field_resolver in (
+            serializer_class._collect_batch_resolvers().items()
+        )
+    )
+
+    nested_serializers: list[NestedSerializerPlan] = []
+    for field_name in serializer_class.model_fields.keys():
+        field_serializers = serializer_class._get_nested_serializers_for_field(
+            field_name
+        )
+        if field_serializers:
+            nested_serializers.append(
+                NestedSerializerPlan(field_name, tuple(field_serializers))
+            )
+        elif serializer_class._is_nested_serializer(field_name):
+            nested_serializers.append(
+                NestedSerializerPlan(
+                    field_name,
+                    (serializer_class.model_fields[field_name].annotation,),
+                )
+            )
+
+    # `resolve_*` methods take priority over the instance's attributes
+    # and relations, decorator based resolvers will override whatever value
+    # we read from the instance anyway so we don't bother reading it.
+    method_resolved = {
+        field_name
+        for field_name in serializer_class.model_fields.keys()
+        if hasattr(serializer_class, f"resolve_{field_name}")
+    }
+    resolved = (
+        method_resolved
+        | resolvers.keys()
+        | {resolver_plan.field_name for resolver_plan in batch_resolvers}
+    )
+    nested_field_names = {nested.field_name for nested in nested_serializers}
+    model_fields = tuple(
+        field_name
+        for field_name in serializer_class.model_fields.keys()
+        if field_name not in resolved
+    )
+    # nothing but columns and resolvers reading them: this serializer can
+    # be built from a row without a model instance
+    flat = (
+        model_class is not None
+        and misconfigured_resolver is None
+        and not (
+            async_resolvers
+            or offloaded_resolvers
+            or batch_resolvers
+            or nested_serializers
+        )
+        and all(resolver_plan.row_only for resolver_plan in sync_resolvers)
+        and _are_columns(model_class, model_fields)
+    )
+    return SerializationPlan(
+        resolvers=frozendict(resolvers),
+        sync_resolvers=tuple(sync_resolvers),
+        async_resolvers=tuple(async_resolvers),
+        offloaded_resolvers=tuple(offloaded_resolvers),
+        batch_resolvers=batch_resolvers,
+        nested_serializers=tuple(nested_serializers),
+        foreign_keys=tuple(
+            nested
+            for nested in nested_serializers
+            if nested.field_name not in resolved
+        ),
+        model_fields=tuple(
+            field_name
+            for field_name in model_fields
+            if field_name not in nested_field_names
+        ),
+        fetch_fields=tuple(
+            field_name
+            for field_name in serializer_class.model_fields.keys()
+            if field_name not in method_resolved
+        ),
+        enum_fields=(
+            _get_enum_fields(model_fields, model_class)
+            if model_class is not None
+            else None
+        ),
+        misconfigured_resolver=misconfigured_resolver,
+        trustable=_is_trustable(serializer_class),
+        validated_fields=frozenset(
+            field_name
+            for validator in (
+                serializer_class.__pydantic_decorators__.field_validators.values()
+            )
+            for field_name in validator.info.fields
+        ),
+        flat=flat,
+    )
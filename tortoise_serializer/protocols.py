@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    AsyncGenerator,
     Awaitable,
     Callable,
     Generator,
@@ -38,9 +39,14 @@ class SerializerProtocol(Protocol):
         cls, queryset: QuerySet, *args, **kwargs
     ) -> list[Self]: ...
 
+    @classmethod
+    def stream_queryset(
+        cls, queryset: QuerySet, *, chunk_size: int = 1000, **kwargs
+    ) -> AsyncGenerator[Self | dict[str, Any], None]: ...
+
     def partial_update_tortoise_instance(
         self, model: Model, **kwargs
-    ) -> bool: ...
+    ) -> set[str]: ...
 
     async def create_tortoise_instance(
         self,
@@ -1,12 +1,50 @@
-from typing import Any, Awaitable, Callable
+import asyncio
+import inspect
+from functools import wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Literal,
+    Sequence,
+    get_args,
+)
 
+from tortoise import Model
 
-def resolver(field_name: str):
+from tortoise_serializer.executors import ExecutorKind
+from tortoise_serializer.session import (
+    align_batch_values,
+    get_context_key,
+    get_session,
+)
+from tortoise_serializer.types import ContextType, Unset
+
+MemoizeScope = Literal["context", "instance", "context+instance"]
+
+
+def resolver(
+    field_name: str,
+    row_only: bool = False,
+    executor: ExecutorKind | None = None,
+):
     """Decorator to mark a method as a resolver for one field.
     The decorated method MUST be defined within a Serializer class.
 
     Args:
         field_name: The name of the field this method resolves.
+        row_only: Declare that the resolver only reads the columns of the
+            instance (no relations, no methods): `ModelSerializer.from_queryset`
+            may then call it with a row object holding the fetched columns
+            (and `pk`) instead of a model instance.
+        executor: Where a sync resolver runs: "inline" on the event loop,
+            "thread" or "process" in a pool (see `set_resolver_executor`)
+            for CPU heavy resolvers, the default being the
+            `resolver_executor` of the serializer. The instances serialized
+            together are sent to the pool by chunks of
+            `executor_chunk_size`, the process pool needs picklable
+            instances, context and values.
 
     Example:
     ```python
@@ -15,6 +53,8 @@ def resolver(field_name: str):
             return f"{instance.first_name} {instance.last_name}"
     ```
     """
+    if executor is not None and executor not in get_args(ExecutorKind):
+        raise ValueError(f"Invalid resolver executor: {executor}")
 
     def decorator(
         func: Callable[..., Awaitable[Any]],
@@ -23,9 +63,188 @@ def resolver(field_name: str):
             func._resolver_fields = []
 
         func._resolver_fields.append(field_name)
+        # all the declarations of a resolver must agree to be row only
+        func._row_only = getattr(func, "_row_only", True) and row_only
+        if executor is not None:
+            func._executor = executor
 
         # Apply classmethod decorator effect
         func = classmethod(func)
         return func
 
     return decorator
+
+
+def _filter_batch_resolver(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Turn a batch resolver decorated with `require_condition_or_unset`
+    into a batch resolver that checks the condition for each instance and
+    only passes the allowed ones to the decorated function.
+    """
+    condition_checker = func._condition_checker
+    batch_func = func.__wrapped__
+
+    @wraps(batch_func)
+    async def wrapper(
+        cls, instances: Sequence[Model], context: ContextType
+    ) -> list[Any]:
+        allowed = []
+        for instance in instances:
+            condition_result = condition_checker(instance, context)
+            if inspect.iscoroutine(condition_result):
+                condition_result = await condition_result
+            if condition_result:
+                allowed.append(instance)
+
+        values = {}
+        if allowed:
+            allowed_values = batch_func(cls, allowed, context)
+            if inspect.isawaitable(allowed_values):
+                allowed_values = await allowed_values
+            values = {
+                id(instance): value
+                for instance, value in zip(
+                    allowed, align_batch_values(allowed, allowed_values)
+                )
+            }
+        return [values.get(id(instance), Unset) for instance in instances]
+
+    return wrapper
+
+
+def batch_resolver(field_name: str):
+    """Decorator to mark a method as a batch resolver for one field.
+    The decorated method MUST be defined within a Serializer class.
+
+    Instead of being called once per instance, a batch resolver is called
+    once for all the instances serialized together (including the ones of
+    sibling nested serializers) with the list of instances, it returns
+    either a mapping of primary key -> value or a list of values in the same
+    order as the instances.
+
+    `require_condition_or_unset` can be used under this decorator, the
+    condition is then checked per instance and only the allowed instances
+    are given to the resolver.
+
+    Args:
+        field_name: The name of the field this method resolves.
+
+    Example:
+    ```python
+        @batch_resolver("borrowers_count")
+        async def resolve_borrowers_count(
+            cls, instances: list[Book], context: ContextType
+        ) -> dict[int, int]:
+            rows = await (
+                Book.filter(id__in=[book.id for book in instances])
+                .annotate(count=Count("borrowers"))
+                .values("id", "count")
+            )
+            return {row["id"]: row["count"] for row in rows}
+    ```
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if hasattr(func, "_condition_checker"):
+            func = _filter_batch_resolver(func)
+
+        if not hasattr(func, "_batch_resolver_fields"):
+            func._batch_resolver_fields = []
+
+        func._batch_resolver_fields.append(field_name)
+        return classmethod(func)
+
+    return decorator
+
+
+def _get_instance_key(instance: Any) -> Hashable:
+    pk = getattr(instance, "pk", None)
+    if pk is None:
+        return id(instance)
+    return (type(instance), pk)
+
+
+def memoize(scope: MemoizeScope = "context"):
+    """Cache the value of a resolver for the current serialization call
+    (`from_tortoise_orm`, `from_queryset`...), nested serializers included.
+
+    The decorated function must be the resolver itself: put `memoize` under
+    `resolver` / `classmethod`.
+
+    Args:
+        scope: What the value depends on:
+            - "context": computed once for all the instances
+            - "instance": computed once per instance (by primary key)
+            - "context+instance": both
+
+    Concurrent calls of an async resolver with the same key await the same
+    call instead of running it again. Outside of a serialization call the
+    resolver is called as usual.
+
+    Example:
+    ```python
+        @resolver("currency_rate")
+        @memoize(scope="context")
+        async def resolve_currency_rate(
+            cls, instance: Product, context: ContextType
+        ) -> float:
+            return await get_rate(context["currency"])
+    ```
+    """
+    if scope not in ("context", "instance", "context+instance"):
+        raise ValueError(f"Invalid memoize scope: {scope}")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def get_key(cls, instance: Any, context: ContextType) -> Hashable:
+            if scope == "context":
+                return (func, cls, get_context_key(context))
+            if scope == "instance":
+                return (func, cls, _get_instance_key(instance))
+            return (
+                func,
+                cls,
+                get_context_key(context),
+                _get_instance_key(instance),
+            )
+
+        @wraps(func)
+        def wrapper(cls, instance: Any, context: ContextType) -> Any:
+            session = get_session()
+            if session is None:
+                return func(cls, instance, context)
+            key = get_key(cls, instance, context)
+            if key not in session.memo:
+                session.memo[key] = func(cls, instance, context)
+            return session.memo[key]
+
+        @wraps(func)
+        async def a_wrapper(cls, instance: Any, context: ContextType) -> Any:
+            session = get_session()
+            if session is None:
+                return await func(cls, instance, context)
+            key = get_key(cls, instance, context)
+            future = session.memo.get(key)
+            if future is not None:
+                # a cancelled caller must not cancel the shared call
+                return await asyncio.shield(future)
+
+            future = session.memo[key] = (
+                asyncio.get_running_loop().create_future()
+            )
+            try:
+                value = await func(cls, instance, context)
+            except BaseException as error:
+                # don't keep failures: the next call will try again
+                del session.memo[key]
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+                    # raised here already: don't warn when nobody waits
+                    future.exception()
+                raise
+            future.set_result(value)
+            return value
+
+        return a_wrapper if inspect.iscoroutinefunction(func) else wrapper
+
+    return decorator
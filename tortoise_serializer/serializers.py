@@ -1,14 +1,27 @@
 import asyncio
+import hashlib
 import inspect
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+)
+from dataclasses import replace
 from enum import Enum
-from functools import lru_cache, wraps
+from functools import lru_cache, partial, wraps
 from inspect import iscoroutinefunction
+from time import perf_counter
+from types import SimpleNamespace
 from typing import (
     Any,
+    ClassVar,
     Generator,
     Generic,
+    Literal,
     Self,
     Sequence,
     Type,
@@ -17,31 +30,132 @@ from typing import (
 )
 
 from frozendict import frozendict
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydantic.main import IncEx
 from structlog import get_logger
 from tortoise import Model, fields
 from tortoise.exceptions import DoesNotExist
 from tortoise.fields.relational import (
     BackwardFKRelation,
+    BackwardOneToOneRelation,
     ForeignKeyFieldInstance,
     ManyToManyFieldInstance,
     ManyToManyRelation,
     _NoneAwaitable,
 )
+from tortoise.fields.relational import RelationalField
+from tortoise.query_utils import Prefetch
 from tortoise.queryset import QuerySet, QuerySetSingle
 from typing_extensions import deprecated
 
+from tortoise_serializer.bulk import (
+    BulkCreation,
+    IngestReport,
+    add_to_bulk_creation,
+    create_related,
+    get_auto_now_fields,
+    has_save_listeners,
+    ingest_records,
+    insert_links,
+    partial_update_instances,
+    update_backward_fk,
+    update_forward_relation,
+    update_many_to_many,
+)
+from tortoise_serializer.cache import (
+    CacheBackend,
+    CachedFields,
+    get_instance_tag,
+    get_relation_tag,
+    invalidate_cache,
+    register_cache_invalidation,
+)
 from tortoise_serializer.exceptions import (
     TortoiseSerializerClassMethodException,
     TortoiseSerializerException,
 )
+from tortoise_serializer.executors import (
+    ExecutorKind,
+    call_resolver_chunk,
+    get_resolver_executor,
+)
+from tortoise_serializer.flat import serialize_values
+from tortoise_serializer.metrics import (
+    MetricEvent,
+    MetricsRecorder,
+    measure,
+)
+from tortoise_serializer.normalize import normalize_serializers
+from tortoise_serializer.plan import (
+    ResolverPlan,
+    SerializationPlan,
+    build_plan,
+    get_trusted_fields,
+)
+from tortoise_serializer.strict import StrictMode, report_lazy_fetch
+from tortoise_serializer.session import (
+    SerializationSession,
+    get_context_key,
+    get_session,
+    serialization_session,
+)
 from tortoise_serializer.types import MODEL, ContextType, T, Unset, UnsetType
 
 logger = get_logger()
 log_level = logging.INFO
 logging.getLogger(__name__).setLevel(log_level)
 
+# sentinel for attributes missing from a (partial) model instance
+_MISSING = object()
+
+
+def _freeze_context(
+    context: dict[str, Any] | ContextType | None,
+) -> ContextType:
+    if isinstance(context, frozendict):
+        return context
+    return frozendict(context or {})
+
+
+def _group_by_model(instances: Sequence[Model]) -> dict[Type[Model], list]:
+    groups: dict[Type[Model], list] = {}
+    for instance in instances:
+        groups.setdefault(type(instance), []).append(instance)
+    return groups
+
+
+def _get_related_instances(
+    instances: Sequence[Model], field_name: str
+) -> list[Model]:
+    """Return the (fetched) related objects of `field_name` across all the
+    given instances, each object being returned only once
+    """
+    related: dict[int, Model] = {}
+    for instance in instances:
+        relational_instance = getattr(instance, field_name, None)
+        if isinstance(relational_instance, Model):
+            related.setdefault(id(relational_instance), relational_instance)
+        elif isinstance(
+            relational_instance, (ManyToManyRelation, fields.ReverseRelation)
+        ):
+            if not relational_instance._fetched:
+                continue
+            for related_instance in relational_instance.related_objects:
+                related.setdefault(id(related_instance), related_instance)
+    return list(related.values())
+
+
+def _has_ancestor(session: SerializationSession, instance: Model) -> bool:
+    """Whether the row of `instance` is one of its ancestors in the tree
+    walked by `Serializer._get_tree_level`"""
+    model_class = type(instance)
+    parent = session.tree_parents.get(id(instance))
+    while parent is not None:
+        if type(parent) is model_class and parent.pk == instance.pk:
+            return True
+        parent = session.tree_parents.get(id(parent))
+    return False
+
 
 @deprecated("use require_condition_or_unset instead")
 def require_permission_or_unset(
@@ -79,6 +193,9 @@ def require_permission_or_unset(
                 return Unset
             return await func(cls, instance, context)
 
+        # allows `batch_resolver` to check the condition per instance
+        wrapper._condition_checker = permission_checker
+        a_wrapper._condition_checker = permission_checker
         return wrapper if not iscoroutinefunction(func) else a_wrapper
 
     return decorator
@@ -132,6 +249,9 @@ def require_condition_or_unset(
                 return Unset
             return await func(cls, instance, context)
 
+        # allows `batch_resolver` to check the condition per instance
+        wrapper._condition_checker = condition_checker
+        a_wrapper._condition_checker = condition_checker
         return wrapper if not iscoroutinefunction(func) else a_wrapper
 
     return decorator
@@ -153,6 +273,79 @@ class Serializer(BaseModel):
     computed_fields > foreign keys > model_fields
     """
 
+    # compiled by `__pydantic_init_subclass__`, see `_get_plan`
+    __serialization_plan__: ClassVar[SerializationPlan | None] = None
+
+    # default upper bound of resolvers and queries in flight at the same
+    # time when serializing lists, shared with the nested serializers.
+    # "pool" uses the size of the connection pool.
+    max_concurrency: ClassVar[int | Literal["pool"] | None] = None
+
+    # build the instances with `model_construct` for the fields whose
+    # tortoise type matches the annotation instead of validating everything,
+    # can be overridden per call with `from_tortoise_orm(..., trusted=...)`
+    trusted: ClassVar[bool] = False
+    # debug switch: validate the trusted instances anyway and raise if they
+    # differ from the constructed ones
+    verify_trusted: ClassVar[bool] = False
+
+    # opt-in cache of the serialized output across calls, see
+    # `get_cache_key`
+    cache_backend: ClassVar[CacheBackend | None] = None
+    # column changing on every write (`updated_at`...), part of the cache
+    # key so updated rows are not served from the cache
+    cache_version_field: ClassVar[str | None] = None
+
+    # how many levels of rows are loaded through the relations nesting this
+    # very class (trees like `children: list["NodeSerializer"]`), the rows
+    # of the last level get those relations empty / None. A row met again
+    # under itself (a cycle) is cut the same way.
+    max_depth: ClassVar[int | None] = None
+
+    # opt-in measures of the serialization (see `MetricEvent`), set it on
+    # `Serializer` itself to measure every serializer
+    metrics: ClassVar[MetricsRecorder | None] = None
+
+    # what to do when a list serialization has to fetch relations that were
+    # not prefetched, see `strict_mode`
+    strict: ClassVar[StrictMode | None] = None
+
+    # where the sync resolvers without an `executor` of their own run, see
+    # `resolver`, and how many instances make a job of the executor
+    resolver_executor: ClassVar[ExecutorKind] = "inline"
+    executor_chunk_size: ClassVar[int] = 256
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        if cls.max_depth is not None and cls.max_depth < 1:
+            raise ValueError("max_depth must be greater than 0")
+        if cls.executor_chunk_size < 1:
+            raise ValueError("executor_chunk_size must be greater than 0")
+        # serializers with unresolved forward references will be compiled
+        # on their first use instead
+        if cls._is_plan_final():
+            cls.__serialization_plan__ = cls._build_plan()
+
+    @classmethod
+    def _build_plan(cls) -> SerializationPlan:
+        return build_plan(cls)
+
+    @classmethod
+    def _is_plan_final(cls) -> bool:
+        """Whether `_build_plan` would build the same plan later on"""
+        return cls.__pydantic_complete__
+
+    @classmethod
+    def _get_plan(cls) -> SerializationPlan:
+        """Return the compiled `SerializationPlan` of this class"""
+        plan = cls.__dict__.get("__serialization_plan__")
+        if plan is None:
+            plan = cls._build_plan()
+            if cls._is_plan_final():
+                cls.__serialization_plan__ = plan
+        return plan
+
     @classmethod
     async def from_tortoise_orm(
         cls,
@@ -162,39 +355,99 @@ class Serializer(BaseModel):
         context: dict[str, Any] | ContextType | None = None,
         by_alias: bool | None = None,
         by_name: bool | None = None,
+        trusted: bool | None = None,
     ) -> Self:
-        if computed_fields is None:
-            computed_fields = {}
-        computed_fields |= cls._collect_resolvers()
+        metrics = cls.metrics
+        serialization = cls._from_tortoise_orm(
+            instance, computed_fields, context, by_alias, by_name, trusted
+        )
+        if metrics is None:
+            return await serialization
+        return await measure(
+            serialization, metrics, cls, MetricEvent.FROM_TORTOISE_ORM
+        )
+
+    @classmethod
+    async def _from_tortoise_orm(
+        cls,
+        instance: Model,
+        computed_fields: dict[str, Callable[[Model, Any], Awaitable[Any]]]
+        | None,
+        context: dict[str, Any] | ContextType | None,
+        by_alias: bool | None,
+        by_name: bool | None,
+        trusted: bool | None,
+    ) -> Self:
+        plan = cls._get_plan()
+        if trusted is None:
+            trusted = cls.trusted
+        # resolvers come from the plan unless the caller gave extra ones
+        if computed_fields:
+            computed_fields = computed_fields | plan.resolvers
+        else:
+            computed_fields = None
 
         # using a frozendict to allow caching when context is involved
         # also prevent missuses of the context: it must be considered as
         # read only
-        frozen_context = frozendict(context or {})
-
-        # fetch related fields before calling concurent resolvers
-        # so all of them are guaranteed to have the model populated properly
-        await cls._fetch_related_fields(instance)
-
-        (
-            models_fields,
-            fk_fields,
-            computed_fields_values,
-        ) = await asyncio.gather(
-            cls._resolve_model_fields(instance),
-            cls._resolve_foreignkeys(
-                instance, frozen_context, computed_fields, by_alias, by_name
-            ),
-            cls._resolve_computed_fields(
-                instance, frozen_context, computed_fields
-            ),
-        )
+        frozen_context = _freeze_context(context)
+
+        cache_key = None
+        if cls.cache_backend is not None and computed_fields is None:
+            cache_key = cls.get_cache_key(instance, frozen_context)
+        if cache_key is not None:
+            cached_fields = await cls._get_cached_fields(cache_key)
+            if cached_fields is not None:
+                return cls.model_validate(
+                    cached_fields, by_alias=False, by_name=True
+                )
+
+        with serialization_session():
+            # fetch related fields before calling concurent resolvers
+            # so all of them are guaranteed to have the model populated
+            # properly
+            await cls._fetch_related_fields(instance)
+
+            models_fields = await cls._resolve_model_fields(instance)
+            # only pay for concurrency when both sides have something to
+            # await
+            if plan.foreign_keys and (
+                computed_fields
+                or plan.async_resolvers
+                or plan.offloaded_resolvers
+                or plan.batch_resolvers
+            ):
+                fk_fields, computed_fields_values = await asyncio.gather(
+                    cls._resolve_foreignkeys(
+                        instance,
+                        frozen_context,
+                        computed_fields,
+                        by_alias,
+                        by_name,
+                        trusted,
+                    ),
+                    cls._resolve_computed_fields(
+                        instance, frozen_context, computed_fields
+                    ),
+                )
+            else:
+                fk_fields = await cls._resolve_foreignkeys(
+                    instance,
+                    frozen_context,
+                    computed_fields,
+                    by_alias,
+                    by_name,
+                    trusted,
+                )
+                computed_fields_values = await cls._resolve_computed_fields(
+                    instance, frozen_context, computed_fields
+                )
 
         fields_values = models_fields | fk_fields | computed_fields_values
         cls._remove_unsets(fields_values)
         try:
-            return cls.model_validate(
-                fields_values, by_alias=by_alias, by_name=by_name
+            serializer = cls._validate(
+                fields_values, type(instance), by_alias, by_name, trusted
             )
         except ValidationError:
             logger.error(
@@ -206,16 +459,214 @@ class Serializer(BaseModel):
                 models_fields=models_fields,
                 fk_fields=fk_fields,
                 computed_fields_values=computed_fields_values,
-                computed_fields=computed_fields,
+                computed_fields=computed_fields or plan.resolvers,
                 by_alias=by_alias,
                 by_name=by_name,
+                trusted=trusted,
             )
             raise
+        if cache_key is not None:
+            tags: set[str] = set()
+            cls._collect_cache_tags(instance, cls.cache_backend, tags)
+            await cls.cache_backend.set(
+                cache_key, serializer.model_dump(exclude_unset=True), tags
+            )
+        return serializer
+
+    @classmethod
+    def _collect_cache_tags(
+        cls, instance: Model, backend: CacheBackend, tags: set[str]
+    ) -> None:
+        """Add to `tags` the rows and to-many relations embedded in the
+        serialization of `instance`, following the nested serializers, and
+        make sure writes to their models evict the entries of `backend`.
+        """
+        model_class = type(instance)
+        register_cache_invalidation(model_class, backend)
+        tags.add(get_instance_tag(model_class, instance.pk))
+        fields_map = model_class._meta.fields_map
+        for nested in cls._get_plan().foreign_keys:
+            field = fields_map.get(nested.field_name)
+            # a row added to the relation changes this entry too
+            if isinstance(
+                field, (BackwardFKRelation, ManyToManyFieldInstance)
+            ):
+                register_cache_invalidation(field.related_model, backend)
+                tags.add(
+                    get_relation_tag(
+                        model_class, instance.pk, nested.field_name
+                    )
+                )
+
+            related = getattr(instance, nested.field_name, None)
+            if isinstance(related, Model):
+                related_instances = [related]
+            elif isinstance(related, fields.ReverseRelation) and (
+                related._fetched
+            ):
+                related_instances = related.related_objects
+            else:
+                continue
+            serializer = nested.serializers[0]
+            for related_instance in related_instances:
+                serializer._collect_cache_tags(related_instance, backend, tags)
+
+    @classmethod
+    def get_cache_key(
+        cls, instance: Model, context: ContextType
+    ) -> str | None:
+        """Return the key of the serialized `instance` in `cache_backend`,
+        None to not cache it.
+
+        The key is made of the serializer, the model, the primary key, the
+        value of `cache_version_field` and `get_context_fingerprint`.
+        """
+        if instance.pk is None:
+            return None
+        version = (
+            getattr(instance, cls.cache_version_field, None)
+            if cls.cache_version_field is not None
+            else None
+        )
+        return ":".join(
+            (
+                f"{cls.__module__}.{cls.__qualname__}",
+                type(instance).__name__,
+                str(instance.pk),
+                str(version),
+                cls.get_context_fingerprint(context),
+            )
+        )
+
+    @classmethod
+    def get_context_fingerprint(cls, context: ContextType) -> str:
+        """Return a digest of the context for the cache keys.
+
+        The default one relies on the `repr` of the values: override it
+        when the context holds objects without a stable `repr` (users,
+        database connections...) to keep only what changes the output.
+        """
+        if not context:
+            return ""
+        return hashlib.sha1(
+            repr(sorted(context.items())).encode(), usedforsecurity=False
+        ).hexdigest()
+
+    @classmethod
+    async def _get_cached_fields(cls, cache_key: str) -> CachedFields | None:
+        session = get_session()
+        if session is not None and cache_key in session.cached:
+            # already looked up with the rest of the list
+            return session.cached.pop(cache_key)
+        return await cls.cache_backend.get(cache_key)
+
+    @classmethod
+    def _validate(
+        cls,
+        fields_values: dict[str, Any],
+        model_class: Type[Model],
+        by_alias: bool | None,
+        by_name: bool | None,
+        trusted: bool,
+    ) -> Self:
+        """Build the serializer from the resolved values of an instance"""
+        metrics = cls.metrics
+        if metrics is not None:
+            start = perf_counter()
+        if trusted:
+            serializer = cls._model_construct_trusted(
+                fields_values, model_class, by_alias, by_name
+            )
+        else:
+            serializer = cls.model_validate(
+                fields_values, by_alias=by_alias, by_name=by_name
+            )
+        if metrics is not None:
+            metrics.record(
+                cls, MetricEvent.MODEL_VALIDATE, perf_counter() - start
+            )
+        return serializer
+
+    @classmethod
+    def _model_construct_trusted(
+        cls,
+        fields_values: dict[str, Any],
+        model_class: Type[Model],
+        by_alias: bool | None = None,
+        by_name: bool | None = None,
+    ) -> Self:
+        """Build an instance from values read from `model_class` without
+        validation when every field is one that tortoise already typed exactly
+        as the serializer expects it (see `get_trusted_fields`).
+
+        It's all or nothing: a single resolver or nested serializer field
+        (or mismatching type, default value...) and the whole instance is
+        validated. pydantic-core validates simple values faster than
+        `model_construct` or `validate_assignment` would skip them, nested
+        serializers built in trusted mode are not validated again anyway.
+        """
+        trusted_fields = cls._get_trusted_fields(model_class)
+        if (
+            len(trusted_fields) != len(cls.__pydantic_fields__)
+            or fields_values.keys() != trusted_fields
+        ):
+            return cls.model_validate(
+                fields_values, by_alias=by_alias, by_name=by_name
+            )
+
+        serializer = cls.__new__(cls)
+        object.__setattr__(serializer, "__dict__", fields_values)
+        object.__setattr__(
+            serializer, "__pydantic_fields_set__", set(fields_values)
+        )
+        object.__setattr__(serializer, "__pydantic_extra__", None)
+        object.__setattr__(serializer, "__pydantic_private__", None)
+
+        if cls.verify_trusted:
+            cls._verify_trusted(serializer, fields_values, by_alias, by_name)
+        return serializer
+
+    @classmethod
+    def _get_trusted_fields(cls, model_class: Type[Model]) -> frozenset[str]:
+        # the fields of the model are only known once `Tortoise.init` ran
+        if not model_class._meta._inited:
+            return get_trusted_fields(cls, model_class)
+        return cls._get_cached_trusted_fields(model_class)
+
+    @classmethod
+    @lru_cache()
+    def _get_cached_trusted_fields(
+        cls, model_class: Type[Model]
+    ) -> frozenset[str]:
+        return get_trusted_fields(cls, model_class)
+
+    @classmethod
+    def _verify_trusted(
+        cls,
+        serializer: Self,
+        fields_values: dict[str, Any],
+        by_alias: bool | None,
+        by_name: bool | None,
+    ) -> None:
+        """Ensure `serializer` is the same as a validated one"""
+        validated = cls.model_validate(
+            fields_values, by_alias=by_alias, by_name=by_name
+        )
+        if (
+            serializer.model_dump() != validated.model_dump()
+            or serializer.model_fields_set != validated.model_fields_set
+        ):
+            raise TortoiseSerializerException(
+                f"Trusted construction of {cls.__name__} differs from its "
+                f"validation: {serializer!r} != {validated!r}"
+            )
 
     @classmethod
     async def from_tortoise_instances(
         cls,
         instances: Sequence[Model],
+        *,
+        max_concurrency: int | Literal["pool"] | None = None,
         **kwargs,
     ) -> list[Self]:
         """Return a list of Self (Serializer) for the given sequence of
@@ -223,15 +674,238 @@ class Serializer(BaseModel):
 
         Args:
             instances: Sequence of model instances to serialize
+            max_concurrency: How many resolvers and queries can run at
+                the same time, see `Serializer.max_concurrency`
             **kwargs: Other arguments to pass to `from_tortoise_orm`
         """
-        return await asyncio.gather(
-            *[
-                cls.from_tortoise_orm(instance, **kwargs)
-                for instance in instances
-            ]
+        return await cls._from_tortoise_instances(
+            instances, max_concurrency, (), kwargs
         )
 
+    @classmethod
+    async def _from_tortoise_instances(
+        cls,
+        instances: Sequence[Model],
+        max_concurrency: int | Literal["pool"] | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[Self]:
+        # freeze the context once for the whole batch
+        if kwargs.get("context") is not None:
+            kwargs["context"] = _freeze_context(kwargs["context"])
+        # lazy fetches are N+1 queries when the whole call is a list
+        listing = get_session() is None
+        with serialization_session() as session:
+            if listing:
+                session.listing = True
+            # the outermost serializer with a limit sets it for everyone
+            if session.max_concurrency is None and instances:
+                max_concurrency = cls._get_max_concurrency(
+                    max_concurrency, type(instances[0])
+                )
+                if max_concurrency is not None:
+                    session.set_max_concurrency(max_concurrency)
+
+            to_fetch = instances
+            if (
+                cls.cache_backend is not None
+                and not args
+                and not kwargs.get("computed_fields")
+            ):
+                to_fetch = await cls._get_cached_fields_for_list(
+                    session, instances, kwargs.get("context")
+                )
+
+            # load the missing relations for the whole batch at once so the
+            # per instance path finds everything already populated
+            await cls._fetch_related_fields_for_list(to_fetch)
+            # only the resolvers and queries are bounded by the session
+            # limiter: the rows start together so the batch resolvers and
+            # executor chunks see all of them
+            return await asyncio.gather(
+                *[
+                    cls.from_tortoise_orm(instance, *args, **kwargs)
+                    for instance in instances
+                ]
+            )
+
+    @classmethod
+    async def _get_cached_fields_for_list(
+        cls,
+        session: SerializationSession,
+        instances: Sequence[Model],
+        context: ContextType | None,
+    ) -> list[Model]:
+        """Look up the cache for all the `instances` at once, store the
+        result in the session for `from_tortoise_orm` and return the
+        instances that still have to be serialized."""
+        frozen_context = _freeze_context(context)
+        keys = [
+            cls.get_cache_key(instance, frozen_context)
+            for instance in instances
+        ]
+        cached = await cls.cache_backend.get_many(
+            [key for key in keys if key is not None]
+        )
+        misses = []
+        for instance, key in zip(instances, keys):
+            if key is not None:
+                session.cached[key] = cached.get(key)
+            if key not in cached:
+                misses.append(instance)
+        return misses
+
+    @classmethod
+    def _get_max_concurrency(
+        cls,
+        max_concurrency: int | Literal["pool"] | None,
+        model_class: Type[Model],
+    ) -> int | None:
+        """Return the effective concurrency limit for the given call"""
+        if max_concurrency is None:
+            max_concurrency = cls.max_concurrency
+        if max_concurrency != "pool":
+            return max_concurrency
+        client = model_class._meta.db
+        return (
+            getattr(client, "pool_maxsize", None)
+            or getattr(client, "maxsize", None)
+            # sqlite and such: a single connection
+            or 1
+        )
+
+    @classmethod
+    async def _fetch_related_fields_for_list(
+        cls,
+        instances: Sequence[Model],
+        depth: int = 0,
+        path: str | None = None,
+    ) -> None:
+        """Fetch the relations needed to serialize all `instances`: one query
+        per relation and per nesting level instead of one per instance.
+
+        The nested serializers are then given the freshly fetched related
+        objects of the whole batch so they can do the same for the next
+        level. Relations nesting `cls` itself are loaded level by level
+        (`WHERE parent_id IN (...)`) until `max_depth`, `depth` being the
+        level of `instances` in such a tree.
+
+        `path` is where `cls` sits in the serialized queryset, for the
+        prefetch paths given by `strict_mode`.
+        """
+        if not instances:
+            return
+        session = get_session() or SerializationSession()
+        if path is None:
+            path = session.relation_paths.get(cls, "")
+        else:
+            session.relation_paths.setdefault(cls, path)
+
+        fields_to_fetch: dict[str, list[Model]] = {}
+        for instance in instances:
+            for field_name in cls._get_non_fetched_related_field_names(
+                instance
+            ):
+                fields_to_fetch.setdefault(field_name, []).append(instance)
+
+        # as in `create_tortoise_instance` we don't run those concurrently:
+        # we may be inside a transaction
+        for field_name, field_instances in fields_to_fetch.items():
+            # recursive relations can't be prefetched, see `_get_tree_level`
+            if (
+                session.listing
+                and field_name not in cls._get_recursive_field_names()
+            ):
+                report_lazy_fetch(
+                    cls, (field_name,), path, len(field_instances)
+                )
+            logger.debug(
+                "Fetching related fields, consider using prefetch_related",
+                serializer=cls,
+                field=field_name,
+                instances_count=len(field_instances),
+            )
+            for model_class, model_instances in _group_by_model(
+                field_instances
+            ).items():
+                fetch = model_class.fetch_for_list(model_instances, field_name)
+                if cls.metrics is not None:
+                    fetch = measure(
+                        fetch,
+                        cls.metrics,
+                        cls,
+                        MetricEvent.FETCH_RELATED,
+                        field_name,
+                        len(model_instances),
+                    )
+                await session.run_limited(fetch)
+
+        for nested in cls._get_plan().foreign_keys:
+            if len(nested.serializers) != 1:
+                continue
+            (serializer,) = nested.serializers
+            if serializer is cls:
+                children = cls._get_tree_level(
+                    session, instances, nested.field_name, depth + 1
+                )
+                await cls._fetch_related_fields_for_list(children, depth + 1)
+                continue
+            related_instances = _get_related_instances(
+                instances, nested.field_name
+            )
+            await serializer._fetch_related_fields_for_list(
+                related_instances,
+                path=f"{path}__{nested.field_name}"
+                if path
+                else nested.field_name,
+            )
+
+    @classmethod
+    def _get_recursive_field_names(cls) -> list[str]:
+        """Return the relations nesting `cls` itself"""
+        return [
+            nested.field_name
+            for nested in cls._get_plan().foreign_keys
+            if nested.serializers == (cls,)
+        ]
+
+    @classmethod
+    def _get_tree_level(
+        cls,
+        session: SerializationSession,
+        instances: Sequence[Model],
+        field_name: str,
+        depth: int,
+    ) -> list[Model]:
+        """Return the rows of the recursive relation `field_name` of
+        `instances` that are at `depth` in the tree, marking the ones whose
+        relation must not be loaded: beyond `max_depth` or already present
+        among their ancestors.
+
+        Instances already walked (a nested list of a tree loaded by its
+        parents) are skipped.
+        """
+        recursive_fields = cls._get_recursive_field_names()
+        children = []
+        for instance in instances:
+            walk_key = (id(instance), field_name)
+            if (
+                walk_key in session.tree_walked
+                or walk_key in session.truncated
+            ):
+                continue
+            session.tree_walked.add(walk_key)
+            for child in _get_related_instances((instance,), field_name):
+                session.tree_parents[id(child)] = instance
+                if (
+                    cls.max_depth is not None and depth >= cls.max_depth
+                ) or _has_ancestor(session, child):
+                    session.truncated.update(
+                        (id(child), name) for name in recursive_fields
+                    )
+                children.append(child)
+        return children
+
     @classmethod
     async def _fetch_related_fields(cls, instance: Model) -> None:
         fetch_related_fields = cls._get_non_fetched_related_field_names(
@@ -247,8 +921,29 @@ class Serializer(BaseModel):
             fields=fetch_related_fields,
         )
 
+        session = get_session()
+        if session is not None and session.listing:
+            report_lazy_fetch(
+                cls,
+                fetch_related_fields,
+                session.relation_paths.get(cls, ""),
+                1,
+            )
+
         # Fetch all the related fields
-        await instance.fetch_related(*fetch_related_fields)
+        fetch = instance.fetch_related(*fetch_related_fields)
+        if cls.metrics is not None:
+            fetch = measure(
+                fetch,
+                cls.metrics,
+                cls,
+                MetricEvent.FETCH_RELATED,
+                ",".join(fetch_related_fields),
+            )
+        if session is None:
+            await fetch
+        else:
+            await session.run_limited(fetch)
 
     @staticmethod
     def _remove_unsets(data: dict[str, Any]) -> None:
@@ -263,23 +958,28 @@ class Serializer(BaseModel):
 
     @classmethod
     async def _resolve_model_fields(cls, instance: Model) -> dict[str, Any]:
+        # resolvers and nested serializers are already filtered out by the
+        # plan: they are a job for _resolve_computed_fields and
+        # _resolve_foreignkeys
+        plan = cls._get_plan()
+        enum_fields = plan.enum_fields
         data = {}
-        for field_name in cls.model_fields.keys():
-            if hasattr(instance, field_name):
-                field_value = getattr(instance, field_name)
+        for field_name in plan.model_fields:
+            field_value = getattr(instance, field_name, _MISSING)
+            if field_value is _MISSING:
+                continue
 
-                # ignore this is a job for _resolve_foreignkeys
-                if isinstance(field_value, Model):
-                    continue
-                # ignore, this is a job for _resolve_computed_fields
-                if hasattr(cls, f"resolve_{field_name}"):
-                    continue
+            # ignore this is a job for _resolve_foreignkeys
+            if isinstance(field_value, Model):
+                continue
 
-                # unpack enum values
-                if isinstance(field_value, Enum):
-                    field_value = field_value.value
+            # unpack enum values
+            if (
+                enum_fields is None or field_name in enum_fields
+            ) and isinstance(field_value, Enum):
+                field_value = field_value.value
 
-                data[field_name] = field_value
+            data[field_name] = field_value
         return data
 
     @classmethod
@@ -291,12 +991,13 @@ class Serializer(BaseModel):
         note this won't fetch nested serialziers field names
         """
         fetch_related_fields = []
-        for field_name in cls.model_fields:
-            # if a resolver already exists we use it instead of trying to
-            # resolve it as a foreign key
-            if hasattr(cls, f"resolve_{field_name}"):
+        session = get_session()
+        truncated = session.truncated if session is not None else ()
+        # if a resolver already exists we use it instead of trying to
+        # resolve it as a foreign key: the plan skip those fields
+        for field_name in cls._get_plan().fetch_fields:
+            if (id(instance), field_name) in truncated:
                 continue
-
             relational_instance = getattr(instance, field_name, None)
 
             # if the instance has been already fetched we don't add the field
@@ -329,25 +1030,40 @@ class Serializer(BaseModel):
         computed_fields: dict[str, Callable[[Model, Any], Awaitable[Any]]],
         by_alias: bool | None = None,
         by_name: bool | None = None,
+        trusted: bool | None = None,
     ) -> dict[str, Any]:
         data = {}
-        for field_name, serializers in cls._get_nested_serializers().items():
-            # resolvers have higher priority
-            if hasattr(cls, f"resolve_{field_name}"):
-                continue
-
+        if computed_fields is None:
+            computed_fields = {}
+        session = get_session()
+        # resolvers have higher priority: the plan already skipped them
+        for nested in cls._get_plan().foreign_keys:
+            field_name = nested.field_name
             # for now: we only support one nested serializer
-            if not len(serializers) == 1:
+            if not len(nested.serializers) == 1:
                 raise ValueError(
                     "Cannot use more than one serialzier for each nested relation"
                 )
-            (serializer,) = serializers
+            (serializer,) = nested.serializers
 
             relational_instance = getattr(instance, field_name, None)
 
+            # the tree is cut here: see `_get_tree_level`
+            if (
+                session is not None
+                and (id(instance), field_name) in session.truncated
+            ):
+                value = (
+                    []
+                    if isinstance(
+                        relational_instance,
+                        (ManyToManyRelation, fields.ReverseRelation),
+                    )
+                    else None
+                )
             # if the item is None we output the value as None to see if the
             # serializer can allow it
-            if relational_instance is None or isinstance(
+            elif relational_instance is None or isinstance(
                 relational_instance, _NoneAwaitable
             ):
                 value = None
@@ -358,6 +1074,7 @@ class Serializer(BaseModel):
                     context=context,
                     by_alias=by_alias,
                     by_name=by_name,
+                    trusted=trusted,
                 )
 
             # handle reverse relations
@@ -368,21 +1085,91 @@ class Serializer(BaseModel):
                     context=context,
                     by_alias=by_alias,
                     by_name=by_name,
+                    trusted=trusted,
                 )
 
             # validating the nested relationship with a from_tortoise_orm call
             # to the nested serializer
-            else:
+            # tree rows are serialized per path: the same row may be cut
+            # at one place and not at another
+            elif field_name in computed_fields or (
+                session is not None
+                and id(relational_instance) in session.tree_parents
+            ):
                 value = await serializer.from_tortoise_orm(
                     relational_instance,
                     context=context,
                     computed_fields=computed_fields.get(field_name, None),
                     by_alias=by_alias,
                     by_name=by_name,
+                    trusted=trusted,
+                )
+            else:
+                value = await serializer._from_identity_map(
+                    relational_instance, context, by_alias, by_name, trusted
                 )
             data[field_name] = value
         return data
 
+    @classmethod
+    async def _from_identity_map(
+        cls,
+        instance: Model,
+        context: ContextType,
+        by_alias: bool | None,
+        by_name: bool | None,
+        trusted: bool | None,
+    ) -> Self:
+        """`from_tortoise_orm` for a related row, serialized only once per
+        session: all the parents pointing to the same row (10,000 books on
+        30 shelves) share the same serializer instance.
+        """
+        session = get_session()
+        if session is None or instance.pk is None:
+            return await cls.from_tortoise_orm(
+                instance,
+                context=context,
+                by_alias=by_alias,
+                by_name=by_name,
+                trusted=trusted,
+            )
+        key = (
+            cls,
+            type(instance),
+            instance.pk,
+            get_context_key(context),
+            by_alias,
+            by_name,
+            trusted,
+        )
+        future = session.identity_map.get(key)
+        if future is not None:
+            # a cancelled parent must not cancel the shared serialization
+            return await asyncio.shield(future)
+
+        future = session.identity_map[key] = (
+            asyncio.get_running_loop().create_future()
+        )
+        try:
+            serializer = await cls.from_tortoise_orm(
+                instance,
+                context=context,
+                by_alias=by_alias,
+                by_name=by_name,
+                trusted=trusted,
+            )
+        except BaseException as error:
+            del session.identity_map[key]
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # raised here already: don't warn when nobody waits
+                future.exception()
+            raise
+        future.set_result(serializer)
+        return serializer
+
     @classmethod
     async def _resolve_computed_fields(
         cls,
@@ -393,10 +1180,16 @@ class Serializer(BaseModel):
     ) -> dict[str, Any]:
         """Resolve all values for computed fields
         note that async function will be called in an asyncio.TaskGroup
+
+        when `computed_fields` is None the resolvers of the class plan are
+        used
         """
+        if computed_fields is None:
+            return await cls._resolve_plan_resolvers(instance, context)
         if not computed_fields:
             return {}
         data = {}
+        metrics = cls.metrics
         async with asyncio.TaskGroup() as tg:
             for field_name, field_resolver in computed_fields.items():
                 if not inspect.ismethod(field_resolver):
@@ -413,13 +1206,31 @@ class Serializer(BaseModel):
 
                 # add tasks to the taskgroup
                 elif iscoroutinefunction(field_resolver):
+                    coroutine = field_resolver(instance, context)
+                    if metrics is not None:
+                        coroutine = measure(
+                            coroutine,
+                            metrics,
+                            cls,
+                            MetricEvent.RESOLVER,
+                            field_name,
+                        )
                     data[field_name] = tg.create_task(
-                        field_resolver(instance, context)
+                        get_session().run_limited(coroutine)
                     )
 
                 # get the values output values of sync resolvers
                 elif callable(field_resolver):
+                    if metrics is not None:
+                        start = perf_counter()
                     data[field_name] = field_resolver(instance, context)
+                    if metrics is not None:
+                        metrics.record(
+                            cls,
+                            MetricEvent.RESOLVER,
+                            perf_counter() - start,
+                            field_name,
+                        )
 
                 # copy raw values
                 else:
@@ -430,8 +1241,213 @@ class Serializer(BaseModel):
             if isinstance(field_value, asyncio.Task):
                 data[field_name] = field_value.result()
 
+        batch_resolvers = cls._get_plan().batch_resolvers
+        if batch_resolvers:
+            batch_values = await asyncio.gather(
+                *[
+                    cls._load_batch_resolver(resolver_plan, instance, context)
+                    for resolver_plan in batch_resolvers
+                ]
+            )
+            for resolver_plan, value in zip(batch_resolvers, batch_values):
+                data[resolver_plan.field_name] = value
+
+        return data
+
+    @classmethod
+    async def _resolve_plan_resolvers(
+        cls, instance: Model, context: ContextType
+    ) -> dict[str, Any]:
+        """Same as `_resolve_computed_fields` but driven by the class plan"""
+        plan = cls._get_plan()
+        if plan.misconfigured_resolver:
+            raise TortoiseSerializerClassMethodException(
+                cls, plan.misconfigured_resolver
+            )
+        data = {}
+        cls._call_sync_resolvers(plan.sync_resolvers, instance, context, data)
+        if not (
+            plan.async_resolvers
+            or plan.offloaded_resolvers
+            or plan.batch_resolvers
+        ):
+            return data
+
+        run_limited = get_session().run_limited
+        metrics = cls.metrics
+        pending = [
+            (
+                resolver_plan.field_name,
+                run_limited(
+                    resolver_plan.resolver(instance, context)
+                    if metrics is None
+                    else measure(
+                        resolver_plan.resolver(instance, context),
+                        metrics,
+                        cls,
+                        MetricEvent.RESOLVER,
+                        resolver_plan.field_name,
+                    )
+                ),
+            )
+            for resolver_plan in plan.async_resolvers
+        ]
+        pending.extend(
+            (
+                resolver_plan.field_name,
+                cls._load_offloaded_resolver(resolver_plan, instance, context),
+            )
+            for resolver_plan in plan.offloaded_resolvers
+        )
+        pending.extend(
+            (
+                resolver_plan.field_name,
+                cls._load_batch_resolver(resolver_plan, instance, context),
+            )
+            for resolver_plan in plan.batch_resolvers
+        )
+        # a lonely async resolver does not need a TaskGroup
+        if len(pending) == 1:
+            ((field_name, coroutine),) = pending
+            data[field_name] = await coroutine
+            return data
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                field_name: tg.create_task(coroutine)
+                for field_name, coroutine in pending
+            }
+        for field_name, task in tasks.items():
+            data[field_name] = task.result()
         return data
 
+    @classmethod
+    def _call_sync_resolvers(
+        cls,
+        resolvers: Sequence[ResolverPlan],
+        instance: Model | SimpleNamespace,
+        context: ContextType,
+        data: dict[str, Any],
+    ) -> None:
+        """Store the values of the given sync resolvers in `data`"""
+        metrics = cls.metrics
+        if metrics is None:
+            for resolver_plan in resolvers:
+                data[resolver_plan.field_name] = resolver_plan.resolver(
+                    instance, context
+                )
+            return
+        for resolver_plan in resolvers:
+            start = perf_counter()
+            data[resolver_plan.field_name] = resolver_plan.resolver(
+                instance, context
+            )
+            metrics.record(
+                cls,
+                MetricEvent.RESOLVER,
+                perf_counter() - start,
+                resolver_plan.field_name,
+            )
+
+    @classmethod
+    async def _load_batch_resolver(
+        cls,
+        resolver_plan: ResolverPlan,
+        instance: Model,
+        context: ContextType,
+    ) -> Any:
+        """Return the value of a batch resolver for `instance`, the call to
+        the resolver itself being shared with every instance serialized at
+        the same time with the same context.
+        """
+        loader = get_session().get_loader(
+            (cls, resolver_plan.field_name, get_context_key(context)),
+            partial(cls._call_batch_resolver, resolver_plan, context),
+        )
+        return await loader.load(instance)
+
+    @classmethod
+    async def _load_offloaded_resolver(
+        cls,
+        resolver_plan: ResolverPlan,
+        instance: Model,
+        context: ContextType,
+    ) -> Any:
+        """Return the value of a sync resolver run in an executor for
+        `instance`: like the batch resolvers, the instances serialized at the
+        same time are collected to send them to the executor by chunks
+        instead of one job per instance.
+        """
+        loader = get_session().get_loader(
+            (cls, resolver_plan.field_name, get_context_key(context)),
+            partial(cls._call_offloaded_resolver, resolver_plan, context),
+        )
+        return await loader.load(instance)
+
+    @classmethod
+    async def _call_offloaded_resolver(
+        cls,
+        resolver_plan: ResolverPlan,
+        context: ContextType,
+        instances: list[Model],
+    ) -> list[Any]:
+        loop = asyncio.get_running_loop()
+        executor = get_resolver_executor(resolver_plan.executor)
+        session = get_session()
+        metrics = cls.metrics
+        chunk_size = cls.executor_chunk_size
+
+        async def run_chunk(chunk: list[Model]) -> list[Any]:
+            job = loop.run_in_executor(
+                executor,
+                call_resolver_chunk,
+                resolver_plan.resolver,
+                chunk,
+                context,
+            )
+            if metrics is not None:
+                job = measure(
+                    job,
+                    metrics,
+                    cls,
+                    MetricEvent.RESOLVER,
+                    resolver_plan.field_name,
+                    len(chunk),
+                )
+            return await session.run_limited(job)
+
+        chunks = await asyncio.gather(
+            *[
+                run_chunk(instances[index : index + chunk_size])
+                for index in range(0, len(instances), chunk_size)
+            ]
+        )
+        return [value for chunk in chunks for value in chunk]
+
+    @classmethod
+    async def _call_batch_resolver(
+        cls,
+        resolver_plan: ResolverPlan,
+        context: ContextType,
+        instances: list[Model],
+    ) -> Mapping[Any, Any] | Sequence[Any]:
+        metrics = cls.metrics
+        if metrics is not None:
+            start = perf_counter()
+        values = resolver_plan.resolver(instances, context)
+        if resolver_plan.is_async or inspect.isawaitable(values):
+            values = await get_session().run_limited(values)
+        if metrics is not None:
+            metrics.record(
+                cls,
+                MetricEvent.BATCH_RESOLVER,
+                perf_counter() - start,
+                resolver_plan.field_name,
+                len(instances),
+            )
+        # aligned with `instances` by the loader
+        return values
+
     @classmethod
     def _is_nested_serializer(cls, field_name: str) -> bool:
         """
@@ -498,24 +1514,19 @@ class Serializer(BaseModel):
         return []
 
     @classmethod
-    @lru_cache()
     def _get_nested_serializers(cls) -> dict[str, list["Serializer"]]:
-        serializers = {}
-        for field_name in cls.model_fields.keys():
-            field_serializers = cls._get_nested_serializers_for_field(
-                field_name
-            )
-            if field_serializers:
-                serializers[field_name] = field_serializers
-            elif cls._is_nested_serializer(field_name):
-                serializers[field_name] = [
-                    cls.model_fields[field_name].annotation
-                ]
-        return serializers
+        return {
+            nested.field_name: list(nested.serializers)
+            for nested in cls._get_plan().nested_serializers
+        }
 
     @classmethod
     async def from_queryset(
-        cls, queryset: QuerySet, *args, **kwargs
+        cls,
+        queryset: QuerySet,
+        *args,
+        max_concurrency: int | Literal["pool"] | None = None,
+        **kwargs,
     ) -> list[Self]:
         """
         Return a list of Self (Serializer) from the given queryset
@@ -523,14 +1534,108 @@ class Serializer(BaseModel):
 
         Parameters:
         - `queryset`: The QuerySet instance to serialize from
+        - `max_concurrency`: How many instances and resolvers can run at the
+          same time, see `Serializer.max_concurrency`
         any *args, *kwargs will be passed to `from_tortoise_orm` method.
         """
 
-        tasks = [
-            cls.from_tortoise_orm(instance, *args, **kwargs)
-            async for instance in queryset
-        ]
-        return await asyncio.gather(*tasks)
+        instances = await queryset
+        return await cls._from_tortoise_instances(
+            instances, max_concurrency, args, kwargs
+        )
+
+    @classmethod
+    async def stream_queryset(
+        cls,
+        queryset: QuerySet,
+        *,
+        chunk_size: int = 1000,
+        as_dict: bool = False,
+        **kwargs,
+    ) -> AsyncGenerator[Self | dict[str, Any], None]:
+        """
+        Serialize the given queryset chunk by chunk, yielding each serialized
+        instance (or its `model_dump()` if `as_dict` is True).
+
+        Rows are fetched by primary key order with keyset pagination
+        (`pk > last seen pk`) and each chunk is released before the next
+        one gets fetched, so the memory usage depends on `chunk_size`
+        instead of the size of the queryset.
+
+        Parameters:
+        - `queryset`: The QuerySet instance to serialize from, its ordering
+          is replaced by the primary key and it must not be limited
+        - `chunk_size`: How many rows to fetch and serialize at once
+        - `as_dict`: yield dictionaries instead of serializer instances
+        any **kwargs will be passed to `from_tortoise_instances` method.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        if queryset._limit is not None or queryset._offset is not None:
+            raise ValueError(
+                "Cannot stream a queryset with a limit or an offset"
+            )
+
+        pk_attr = queryset.model._meta.pk_attr
+        queryset = queryset.order_by(pk_attr).limit(chunk_size)
+        chunk_queryset = queryset
+        while True:
+            instances = await chunk_queryset
+            if not instances:
+                return
+            chunk = await cls.from_tortoise_instances(instances, **kwargs)
+            for serializer in chunk:
+                yield serializer.model_dump() if as_dict else serializer
+            if len(instances) < chunk_size:
+                return
+            chunk_queryset = queryset.filter(
+                **{f"{pk_attr}__gt": instances[-1].pk}
+            )
+            # release the current chunk before fetching the next one
+            del instances, chunk
+
+    @classmethod
+    async def from_queryset_normalized(
+        cls,
+        queryset: QuerySet,
+        *args,
+        max_concurrency: int | Literal["pool"] | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Same as `from_queryset` but return the normalized output of
+        `normalize`, any *args, **kwargs will be passed to
+        `from_tortoise_orm` method."""
+        instances = await queryset
+        serializers = await cls._from_tortoise_instances(
+            instances, max_concurrency, args, kwargs
+        )
+        return cls.normalize(serializers, instances)
+
+    @classmethod
+    def normalize(
+        cls,
+        serializers: Sequence[Self],
+        instances: Sequence[Model],
+        *,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+    ) -> dict[str, Any]:
+        """Dump `serializers` (built from `instances`, in the same order) as
+        `{"data": [...], "included": {"BookShelf": {pk: {...}}}}`: the
+        nested to-one relations are replaced by their primary key and dumped
+        once in `included`, grouped by model name. To-many relations stay
+        inline but their own to-one relations are normalized too.
+
+        The relations must be loaded on `instances`, which is the case once
+        serialized, except for the rows served from the output cache: their
+        relations are dumped inline.
+        """
+        return normalize_serializers(
+            serializers,
+            instances,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+        )
 
     @classmethod
     def _collect_resolvers(
@@ -541,8 +1646,10 @@ class Serializer(BaseModel):
 
         # Collect method-based resolvers (starting with resolve_)
         for method in dir(cls):
-            if method.startswith("resolve_") and callable(
-                getattr(cls, method)
+            if (
+                method.startswith("resolve_")
+                and callable(getattr(cls, method))
+                and not hasattr(getattr(cls, method), "_batch_resolver_fields")
             ):
                 fields[method.removeprefix("resolve_")] = getattr(cls, method)
 
@@ -555,17 +1662,36 @@ class Serializer(BaseModel):
 
         return fields
 
-    def partial_update_tortoise_instance(self, model: Model, **kwargs) -> bool:
+    @classmethod
+    def _collect_batch_resolvers(
+        cls,
+    ) -> dict[str, Callable[[list[Model], Any], Any]]:
+        """Collect all the resolvers declared with `batch_resolver`"""
+        fields = {}
+        for attr_name in dir(cls):
+            attr = getattr(cls, attr_name)
+            if callable(attr) and hasattr(attr, "_batch_resolver_fields"):
+                for field_name in attr._batch_resolver_fields:
+                    fields[field_name] = attr
+        return fields
+
+    def partial_update_tortoise_instance(
+        self, model: Model, **kwargs
+    ) -> set[str]:
         """Update instance of `model` with the current serializer instance fields
-        return `True` if the instance had been changed, `False` otherwise
+        return the set of the changed fields, empty if the instance is
+        unchanged: give it to `model.save(update_fields=...)` to only write
+        them. A changed relation is reported by its column (`shelf_id`),
+        changed attributes that are not columns are not reported.
         """
         updater = self.model_dump(exclude_unset=True, **kwargs)
         if not updater:
             logger.debug(
                 "No fields to update", model=model, fields_to_update=updater
             )
-            return False
-        values_changed: bool = False
+            return set()
+        meta = model._meta
+        changed_fields: set[str] = set()
         for field, value in updater.items():
             if hasattr(model, field):
                 if getattr(model, field) == value:
@@ -577,8 +1703,31 @@ class Serializer(BaseModel):
                     logger.debug(
                         "Updated Field", model=model, field_name=field
                     )
-                    values_changed = True
-        return values_changed
+                    if field in meta.fk_fields or field in meta.o2o_fields:
+                        field = meta.fields_map[field].source_field
+                    if field in meta.fields_db_projection:
+                        changed_fields.add(field)
+        return changed_fields
+
+    @staticmethod
+    async def bulk_partial_update_tortoise_instances(
+        updates: Iterable[tuple["Serializer", Model]],
+        *,
+        batch_size: int | None = None,
+        **kwargs,
+    ) -> list[set[str]]:
+        """Apply `partial_update_tortoise_instance` to each (serializer,
+        instance) pair and write the changes with `bulk_update`: one query
+        per model, set of changed fields and batch, the unchanged instances
+        are not written at all. The `auto_now` fields of the changed
+        instances are written too. `bulk_update` sends no signal: the
+        output cache entries of the changed instances are evicted here.
+
+        Returns the changed fields of each pair, in order.
+        """
+        return await partial_update_instances(
+            updates, batch_size=batch_size, **kwargs
+        )
 
     async def create_tortoise_instance(
         self,
@@ -623,8 +1772,11 @@ class Serializer(BaseModel):
             # Field is a nested serializer
             yield prefix + field_name
 
-            # Recursively get prefetch fields from nested serializers
+            # Recursively get prefetch fields from nested serializers, the
+            # recursive relations are loaded level by level instead
             for nested_serializer in field_serializers:
+                if nested_serializer is cls:
+                    continue
                 yield from nested_serializer.get_prefetch_fields(
                     prefix + field_name
                 )
@@ -647,6 +1799,48 @@ class Serializer(BaseModel):
 
 
 class ModelSerializer(Serializer, Generic[MODEL]):
+    @override
+    @classmethod
+    def _build_plan(cls) -> SerializationPlan:
+        try:
+            model_class = cls.get_model_class()
+        except TortoiseSerializerException:
+            # the generic `ModelSerializer` itself is not bound to a model
+            return build_plan(cls)
+        if not model_class._meta._inited:
+            # serializers are usually declared before `Tortoise.init`, until
+            # then the columns of the model (like the `*_id` of its foreign
+            # keys) are unknown: don't rely on them, see `_is_plan_final`
+            return build_plan(cls)
+        plan = build_plan(cls, model_class)
+        if plan.flat and cls._overrides_instance_hooks():
+            # rows of the values() fast path would skip the overrides
+            plan = replace(plan, flat=False)
+        return plan
+
+    @classmethod
+    def _overrides_instance_hooks(cls) -> bool:
+        """Whether a serialization hook of a model instance is customized"""
+        return any(
+            getattr(cls, hook_name).__func__
+            is not getattr(Serializer, hook_name).__func__
+            for hook_name in (
+                "from_tortoise_orm",
+                "_from_tortoise_orm",
+                "_validate",
+            )
+        )
+
+    @classmethod
+    def _is_plan_final(cls) -> bool:
+        if not super()._is_plan_final():
+            return False
+        try:
+            model_class = cls.get_model_class()
+        except TortoiseSerializerException:
+            return True
+        return model_class._meta._inited
+
     @classmethod
     @lru_cache()
     def get_model_class(cls) -> Type[MODEL]:
@@ -705,36 +1899,27 @@ class ModelSerializer(Serializer, Generic[MODEL]):
             if serialized_value is None:
                 continue
 
-            serializer_class = serializers[0]
-            if not issubclass(serializer_class, ModelSerializer):
-                raise TortoiseSerializerException(
-                    f"Bad configuration for field {field_name}:"
-                    " this must inherit from ModelSerializer"
-                )
+            serializer_class = self._get_nested_model_serializer(
+                field_name, serializers
+            )
             relation = model_class._meta.fields_map[field_name]
             if isinstance(relation, ManyToManyFieldInstance):
-                for serializer in [
-                    serializer_class.model_validate(item)
-                    for item in serialized_value
-                ]:
-                    instance = await serializer.create_tortoise_instance(
-                        **kwargs.get(field_name, {}),
-                        _context=_context,
-                    )
-                    many_to_manys[field_name] = many_to_manys.get(
-                        field_name, []
-                    ) + [instance]
-                    exclude.add(field_name)
+                many_to_manys[field_name] = await create_related(
+                    [
+                        serializer_class.model_validate(item)
+                        for item in serialized_value
+                    ],
+                    _context,
+                    kwargs.get(field_name, {}),
+                )
+                exclude.add(field_name)
 
             # backward foreign keys
             elif isinstance(relation, BackwardFKRelation):
-                for serializer in [
+                backward_fks[field_name] = [
                     serializer_class.model_validate(item)
                     for item in serialized_value
-                ]:
-                    backward_fks[field_name] = backward_fks.get(
-                        field_name, []
-                    ) + [serializer]
+                ]
                 exclude.add(field_name)
 
             elif isinstance(relation, ForeignKeyFieldInstance):
@@ -760,14 +1945,77 @@ class ModelSerializer(Serializer, Generic[MODEL]):
             _context=_context,
             **merged_kwargs,
         )
+        # the instance is new: no need to look for the existing links like
+        # `add` does
         for field_name, instances in many_to_manys.items():
-            await getattr(instance, field_name).add(*instances)
+            await insert_links(
+                model_class._meta.fields_map[field_name],
+                [(instance, related) for related in instances],
+            )
 
         await self._create_backward_fks(
             model_class, instance, backward_fks, _context, _exclude or set()
         )
         return instance
 
+    @classmethod
+    async def create_tortoise_instances(
+        cls,
+        serializers: Sequence[Self],
+        *,
+        batch_size: int | None = None,
+        **kwargs,
+    ) -> list[MODEL]:
+        """Create the tortoise instances of `serializers` and their nested
+        relations with a number of queries depending on the models and the
+        depth of the nesting instead of the number of rows: the rows are
+        grouped by model and inserted with `bulk_create`, the foreign keys
+        targets first, then the many to many links with one insert per
+        relation. `kwargs` are given to every top level instance.
+
+        The instances are returned with their primary keys. Overrides of
+        `create_tortoise_instance` are not called, and it's highly
+        recommended to use this inside a `transaction` context.
+        """
+        creation = BulkCreation()
+        pendings = [
+            add_to_bulk_creation(serializer, creation, kwargs)
+            for serializer in serializers
+        ]
+        await creation.execute(batch_size)
+        return [pending.instance for pending in pendings]
+
+    @classmethod
+    async def ingest(
+        cls,
+        records: AsyncIterable[Any] | Iterable[Any],
+        *,
+        batch_size: int = 1000,
+        transaction_per_batch: bool = True,
+        **kwargs,
+    ) -> IngestReport:
+        """Create the instances of a stream of records (dicts or
+        serializers) and their nested relations, `batch_size` records at a
+        time: each batch is validated at once then created with
+        `create_tortoise_instances`, in its own transaction unless
+        `transaction_per_batch` is False. Only one batch is held in memory.
+
+        A batch failing validation or creation is reported and skipped, the
+        following ones are still created. `kwargs` are given to every
+        instance.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        return await ingest_records(
+            cls, records, batch_size, transaction_per_batch, kwargs
+        )
+
+    @classmethod
+    @lru_cache()
+    def _get_list_adapter(cls) -> TypeAdapter[list[Self]]:
+        """Validator of a list of this serializer, built once per class"""
+        return TypeAdapter(list[cls])
+
     async def _create_backward_fks(
         self,
         serializer_model_class: Type[Model],
@@ -784,12 +2032,135 @@ class ModelSerializer(Serializer, Generic[MODEL]):
             field: fields.ReverseRelation = (
                 serializer_model_class._meta.fields_map[field_name]
             )
-            backward_key = field.relation_field
-            for serializer in serializers:
-                await serializer.create_tortoise_instance(
-                    _context=_context,
-                    **{backward_key: instance.id},
+            await create_related(
+                serializers, _context, {field.relation_field: instance.id}
+            )
+
+    @staticmethod
+    def _get_nested_model_serializer(
+        field_name: str, serializers: Sequence[Type[Serializer]]
+    ) -> Type["ModelSerializer"]:
+        """Return the serializer to create / update the relation
+        `field_name` with"""
+        serializer_class = serializers[0]
+        if not issubclass(serializer_class, ModelSerializer):
+            raise TortoiseSerializerException(
+                f"Bad configuration for field {field_name}:"
+                " this must inherit from ModelSerializer"
+            )
+        return serializer_class
+
+    def _can_bulk_create(self) -> bool:
+        """Whether this serializer's instance can be inserted along with its
+        siblings: no nested relation to create, no custom
+        `create_tortoise_instance` and no save signal listener on the
+        model"""
+        if (
+            type(self).create_tortoise_instance
+            is not ModelSerializer.create_tortoise_instance
+            or has_save_listeners(self.get_model_class())
+        ):
+            return False
+        return not any(
+            getattr(self, nested.field_name)
+            for nested in self._get_plan().nested_serializers
+        )
+
+    async def update_tortoise_instance(
+        self,
+        instance: MODEL,
+        *,
+        _context: ContextType | None = None,
+        batch_size: int | None = None,
+    ) -> MODEL:
+        """Update `instance` and its nested relations to match this
+        serializer, only the fields that have been set are considered.
+        it's highly recommended to use this inside a `transaction` context
+
+        The nested serializers are matched to the current rows by primary
+        key, the ones without primary key are created. For the backward
+        foreign keys the current children are loaded once, then the new
+        ones are inserted in bulk, the changed ones written with
+        `bulk_update` and the missing ones removed with a single `DELETE`.
+        For the many to many relations only the links are added and
+        removed, the related rows are kept.
+
+        Raises:
+            TortoiseSerializerException: a nested primary key doesn't
+                belong to the relation (backward foreign keys) or doesn't
+                exist (many to many)
+        """
+        model_class = self.get_model_class()
+        nested_serializers = self._get_nested_serializers()
+        changed_fields = self.partial_update_tortoise_instance(
+            instance, exclude=set(nested_serializers)
+        )
+        to_many: list[tuple[RelationalField, list[ModelSerializer]]] = []
+        for field_name, serializers in nested_serializers.items():
+            if field_name not in self.model_fields_set:
+                continue
+            serializer_class = self._get_nested_model_serializer(
+                field_name, serializers
+            )
+            serialized_value = getattr(self, field_name)
+            relation = model_class._meta.fields_map[field_name]
+            if isinstance(relation, ForeignKeyFieldInstance):
+                if await update_forward_relation(
+                    instance, relation, serialized_value, _context
+                ):
+                    changed_fields.add(relation.source_field)
+                continue
+            if serialized_value is None:
+                serialized_value = []
+            elif not isinstance(serialized_value, list):
+                serialized_value = [serialized_value]
+            to_many.append(
+                (
+                    relation,
+                    [
+                        serializer_class.model_validate(item)
+                        for item in serialized_value
+                    ],
+                )
+            )
+
+        if changed_fields:
+            await instance.save(
+                update_fields=changed_fields | get_auto_now_fields(model_class)
+            )
+        for relation, items in to_many:
+            if isinstance(relation, ManyToManyFieldInstance):
+                await update_many_to_many(
+                    instance, relation, items, _context, batch_size
                 )
+            elif isinstance(relation, BackwardFKRelation):
+                await update_backward_fk(
+                    instance, relation, items, _context, batch_size
+                )
+        if to_many:
+            await invalidate_cache(
+                instance,
+                [relation.model_field_name for relation, _ in to_many],
+            )
+        return instance
+
+    def _can_bulk_update(self) -> bool:
+        """Whether this serializer's instance can be written along with its
+        siblings: no nested relation set and no custom
+        `update_tortoise_instance`"""
+        if (
+            type(self).update_tortoise_instance
+            is not ModelSerializer.update_tortoise_instance
+        ):
+            return False
+        return not any(
+            nested.field_name in self.model_fields_set
+            for nested in self._get_plan().nested_serializers
+        )
+
+    def _get_primary_key(self) -> Any:
+        """Return the primary key given to this serializer, None if unset"""
+        return getattr(self, self.get_model_class()._meta.pk_attr, None)
 
     @classmethod
     @lru_cache()
@@ -847,6 +2218,143 @@ class ModelSerializer(Serializer, Generic[MODEL]):
         # requests
         return field_name in cls.get_model_fields()
 
+    @classmethod
+    def _get_relations(
+        cls,
+    ) -> Generator[
+        tuple[str, RelationalField, Type["ModelSerializer"]], None, None
+    ]:
+        """Yield the relations of the model that have a nested serializer:
+        (field name, tortoise field, nested serializer class)
+
+        The relations nesting `cls` itself are left to the level by level
+        loading of `_fetch_related_fields_for_list`.
+        """
+        fields_map = cls.get_model_class()._meta.fields_map
+        for nested in cls._get_plan().nested_serializers:
+            if nested.serializers[0] is cls:
+                continue
+            if not cls._filter_nested_serializer(
+                nested.field_name, nested.serializers
+            ):
+                continue
+            yield (
+                nested.field_name,
+                fields_map[nested.field_name],
+                nested.serializers[0],
+            )
+
+    @classmethod
+    def _get_recursive_relation_columns(cls, field_name: str) -> list[str]:
+        """Return the columns needed to load the relation `field_name`
+        nesting `cls` itself level by level"""
+        model_class = cls.get_model_class()
+        columns = [model_class._meta.pk_attr]
+        relation = model_class._meta.fields_map[field_name]
+        if isinstance(relation, ForeignKeyFieldInstance):
+            columns.append(relation.source_field)
+        return columns
+
+    @classmethod
+    def get_select_related_fields(cls, prefix: str = "") -> list[str]:
+        """
+        Return the forward ForeignKey and OneToOne relations of the nested
+        serializers, following the chains of them: all of those can be
+        loaded with JOINs in the same query as the model itself.
+        """
+        if prefix:
+            prefix = prefix + "__"
+        select_related_fields = []
+        for field_name, relation, serializer in cls._get_relations():
+            # OneToOneFieldInstance inherits from ForeignKeyFieldInstance
+            if isinstance(relation, ForeignKeyFieldInstance):
+                select_related_fields.append(prefix + field_name)
+                select_related_fields.extend(
+                    serializer.get_select_related_fields(prefix + field_name)
+                )
+        return select_related_fields
+
+    @classmethod
+    def _get_joined_only_fields(
+        cls, prefix: str = "", select_only: bool = False
+    ) -> list[str]:
+        """
+        Return the `.only()` fields loading the model and the relations of
+        `get_select_related_fields` with all their columns: resolvers and
+        model properties may read any of them.
+
+        With `select_only` every level, the model included, only loads the
+        columns of its serializer and its primary key.
+        """
+        model_class = cls.get_model_class()
+        db_fields = model_class._meta.fields_db_projection
+        plan = cls._get_plan()
+        if not select_only:
+            columns = list(db_fields)
+        else:
+            columns = [
+                field_name
+                for field_name in cls.model_fields.keys()
+                if field_name in db_fields
+            ]
+            # needed to load whatever relation sits under this one
+            if model_class._meta.pk_attr not in columns:
+                columns.append(model_class._meta.pk_attr)
+            for nested in plan.nested_serializers:
+                if nested.serializers[0] is not cls:
+                    continue
+                for column in cls._get_recursive_relation_columns(
+                    nested.field_name
+                ):
+                    if column not in columns:
+                        columns.append(column)
+
+        only_fields = [prefix + column for column in columns]
+        for field_name, relation, serializer in cls._get_relations():
+            if isinstance(relation, ForeignKeyFieldInstance):
+                only_fields.extend(
+                    serializer._get_joined_only_fields(
+                        prefix + field_name + "__", select_only
+                    )
+                )
+        return only_fields
+
+    @classmethod
+    def _get_to_many_prefetches(
+        cls, select_only: bool = False
+    ) -> list[str | Prefetch]:
+        """
+        Return what to give to `prefetch_related` to load the reverse
+        ForeignKey and ManyToMany relations of the model.
+
+        The instances of a reverse ForeignKey are queried like the model
+        itself: with JOINs for their own to-one relations and, with
+        `select_only`, the columns of their serializer and the join key.
+        ManyToMany prefetches ignore custom querysets in tortoise, they use
+        the plain prefetch paths. The relations under a to-one relation are not
+        prefetched (tortoise would query the to-one relation again), the
+        serialization loads them in batch.
+        """
+        prefetches: list[str | Prefetch] = []
+        for field_name, relation, serializer in cls._get_relations():
+            if isinstance(relation, ForeignKeyFieldInstance):
+                continue
+            if isinstance(relation, BackwardFKRelation):
+                prefetches.append(
+                    Prefetch(
+                        field_name,
+                        serializer._prefetch_queryset(
+                            serializer.get_model_class().all(),
+                            select_only,
+                            join_key=relation.relation_field,
+                        ),
+                    )
+                )
+            else:
+                prefetches.append(field_name)
+                prefetches.extend(serializer.get_prefetch_fields(field_name))
+        return prefetches
+
     @classmethod
     def get_only_fetch_fields(cls, path: str | None = None) -> list[str]:
         """
@@ -875,7 +2383,21 @@ class ModelSerializer(Serializer, Generic[MODEL]):
             if field_name not in model._meta.fields_map.keys():
                 continue
 
-            if cls._is_nested_serializer(field_name):
+            relation = model._meta.fields_map[field_name]
+            if cls in cls._get_nested_serializers_for_field(field_name):
+                for column in cls._get_recursive_relation_columns(field_name):
+                    if f"{path or ''}{column}" not in fields:
+                        fields.append(f"{path or ''}{column}")
+            elif isinstance(
+                relation, (BackwardFKRelation, ManyToManyFieldInstance)
+            ) and not isinstance(relation, BackwardOneToOneRelation):
+                # `.only()` would join the to-many relations: one row per
+                # related object. They are fetched in batch afterwards from
+                # the primary key.
+                pk_path = f"{path or ''}{model._meta.pk_attr}"
+                if pk_path not in fields:
+                    fields.append(pk_path)
+            elif cls._is_nested_serializer(field_name):
                 args = get_args(cls.__annotations__[field_name])
                 serializers = list(
                     [
@@ -912,21 +2434,142 @@ class ModelSerializer(Serializer, Generic[MODEL]):
 
         Parameters:
         - `queryset`: The QuerySet instance to serialize from
-        - `prefetch`: If True, prefetch the related fields
+        - `prefetch`: If True, load the related fields: JOINs for the
+                      forward ForeignKey / OneToOne relations, prefetch
+                      queries for the other ones
         - `select_only`: If True, only fetch the fields that are needed to serialize the model
                          Note that only the fields defined in the serializer
                          and its nested serializers are considered, be careful
                          with the resolvers needs
-        any *args, *kwargs will be passed to `Serializer.from_queryset` method."""
-        assert not (
-            prefetch and select_only
-        ), "prefetch and select_only cannot be true at the same time"
+                         With `prefetch` the relations are loaded with the
+                         same column pruning plus the join keys
+        any *args, *kwargs will be passed to `Serializer.from_queryset` method.
+
+        Flat serializers (only columns and `row_only` resolvers) are built
+        from `queryset.values()` rows without instantiating the models.
+        """
+        if (
+            not args
+            and not kwargs.get("computed_fields")
+            and not queryset._fields_for_select
+            and cls.cache_backend is None
+            and cls._get_plan().flat
+        ):
+            return await cls._from_values_queryset(queryset, **kwargs)
+        queryset = cls._prepare_queryset(queryset, prefetch, select_only)
+        return await super().from_queryset(queryset, *args, **kwargs)
+
+    @classmethod
+    async def _from_values_queryset(
+        cls,
+        queryset: QuerySet,
+        context: dict[str, Any] | ContextType | None = None,
+        by_alias: bool | None = None,
+        by_name: bool | None = None,
+        trusted: bool | None = None,
+        max_concurrency: int | Literal["pool"] | None = None,
+    ) -> list[Self]:
+        """Serialize the rows of `queryset` for a flat serializer, there is
+        nothing to await per row so `max_concurrency` is irrelevant here.
+        """
+        if trusted is None:
+            trusted = cls.trusted
+        return await serialize_values(
+            cls, queryset, _freeze_context(context), by_alias, by_name, trusted
+        )
+
+    @classmethod
+    def _prepare_queryset(
+        cls,
+        queryset: QuerySet,
+        prefetch: bool = False,
+        select_only: bool = False,
+        include_pk: bool = False,
+    ) -> QuerySet:
+        """Apply the `prefetch` / `select_only` options of `from_queryset`
+        to the given queryset.
+
+        `include_pk` ensures the primary key is fetched with `select_only`
+        alone, it always is when `prefetch` is set too.
+        """
         if prefetch:
-            queryset = queryset.prefetch_related(*cls.get_prefetch_fields())
+            queryset = cls._prefetch_queryset(queryset, select_only)
         elif select_only:
-            queryset = queryset.only(*cls.get_only_fetch_fields())
+            only_fields = cls.get_only_fetch_fields()
+            pk_attr = queryset.model._meta.pk_attr
+            if include_pk and pk_attr not in only_fields:
+                only_fields.append(pk_attr)
+            queryset = queryset.only(*only_fields)
+        return queryset
 
-        return await super().from_queryset(queryset, *args, **kwargs)
+    @classmethod
+    def _prefetch_queryset(
+        cls,
+        queryset: QuerySet,
+        select_only: bool = False,
+        join_key: str | None = None,
+    ) -> QuerySet:
+        """Load the to-one relations of `queryset` with JOINs and prefetch
+        the to-many ones, see `_get_joined_only_fields` for `select_only`.
+
+        `join_key` is the column linking the instances to their parent when
+        `queryset` is the one of a `Prefetch`.
+        """
+        if queryset._fields_for_select:
+            # the caller already chose the columns, we can't JOIN the
+            # relations without replacing them
+            return queryset.prefetch_related(*cls.get_prefetch_fields())
+        if select_only or cls.get_select_related_fields():
+            only_fields = cls._get_joined_only_fields(select_only=select_only)
+            if join_key is not None and join_key not in only_fields:
+                only_fields.append(join_key)
+            queryset = queryset.only(*only_fields)
+        prefetches = cls._get_to_many_prefetches(select_only)
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+    @override
+    @classmethod
+    async def stream_queryset(
+        cls,
+        queryset: QuerySet,
+        *,
+        chunk_size: int = 1000,
+        as_dict: bool = False,
+        prefetch: bool = False,
+        select_only: bool = False,
+        **kwargs,
+    ) -> AsyncGenerator[Self | dict[str, Any], None]:
+        """Same as `Serializer.stream_queryset`, `prefetch` and
+        `select_only` behave like in `from_queryset` and apply to each
+        chunk."""
+        queryset = cls._prepare_queryset(
+            queryset, prefetch, select_only, include_pk=True
+        )
+        async for item in super().stream_queryset(
+            queryset, chunk_size=chunk_size, as_dict=as_dict, **kwargs
+        ):
+            yield item
+
+    @override
+    @classmethod
+    async def from_queryset_normalized(
+        cls,
+        queryset: QuerySet,
+        *args,
+        prefetch: bool = False,
+        select_only: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Same as `Serializer.from_queryset_normalized`, `prefetch` and
+        `select_only` behave like in `from_queryset`."""
+        queryset = cls._prepare_queryset(
+            queryset, prefetch, select_only, include_pk=True
+        )
+        return await super().from_queryset_normalized(
+            queryset, *args, **kwargs
+        )
 
     @classmethod
     async def from_single_queryset(
@@ -941,7 +2584,7 @@ class ModelSerializer(Serializer, Generic[MODEL]):
         exception if the queryset is empty
         """
         if prefetch:
-            queryset = queryset.prefetch_related(*cls.get_prefetch_fields())
+            queryset = cls._prefetch_queryset(queryset)
         instance: MODEL = await queryset
         return await cls.from_tortoise_orm(instance, *args, **kwargs)
 
@@ -0,0 +1,220 @@
+import asyncio
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Generator, Hashable, Sequence
+
+from tortoise import Model
+
+from tortoise_serializer.exceptions import TortoiseSerializerException
+from tortoise_serializer.types import ContextType, T, Unset
+
+BatchFunction = Callable[
+    [list[Model]], Awaitable[Mapping[Any, Any] | Sequence[Any]]
+]
+
+
+def align_batch_values(
+    instances: Sequence[Model], values: Mapping[Any, Any] | Sequence[Any]
+) -> list[Any]:
+    """Return the output of a batch resolver as a list aligned with
+    `instances`.
+
+    A mapping is looked up by primary key, missing instances are `Unset`.
+    """
+    if isinstance(values, Mapping):
+        return [values.get(instance.pk, Unset) for instance in instances]
+    values = list(values)
+    if len(values) != len(instances):
+        raise TortoiseSerializerException(
+            f"Batch resolver returned {len(values)} values "
+            f"for {len(instances)} instances"
+        )
+    return values
+
+
+class BatchLoader:
+    """Coalesce the `load` calls made by concurrent serializations into a
+    single call of `batch_fn`.
+
+    The calls are collected until the event loop went through a full
+    iteration without any new `load`, which is the case for all the sibling
+    instances of a `from_tortoise_instances` call, even when they come from
+    different parents at the same nesting level.
+    """
+
+    __slots__ = ("_batch_fn", "_queue", "_futures", "_queue_size", "_tasks")
+
+    def __init__(self, batch_fn: BatchFunction) -> None:
+        self._batch_fn = batch_fn
+        self._queue: list[Model] = []
+        # instance id -> (instance, future), the instance is kept to make
+        # sure its id won't be reused while the loader is alive
+        self._futures: dict[int, tuple[Model, asyncio.Future]] = {}
+        self._queue_size = 0
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, instance: Model) -> asyncio.Future:
+        """Return a future of the value for the given instance"""
+        if (cached := self._futures.get(id(instance))) is not None:
+            return cached[1]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[id(instance)] = (instance, future)
+        if not self._queue:
+            self._queue_size = 0
+            loop.call_soon(self._wait_for_queue)
+        self._queue.append(instance)
+        return future
+
+    def _wait_for_queue(self) -> None:
+        # while the queue keep growing we give a chance to the remaining
+        # siblings to join the batch
+        if len(self._queue) != self._queue_size:
+            self._queue_size = len(self._queue)
+            asyncio.get_running_loop().call_soon(self._wait_for_queue)
+            return
+        instances, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._dispatch(instances))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, instances: list[Model]) -> None:
+        futures = [self._futures[id(instance)][1] for instance in instances]
+        try:
+            values = align_batch_values(
+                instances, await self._batch_fn(instances)
+            )
+        except BaseException as error:
+            # nobody else would ever resolve the futures of this batch
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+            return
+        for future, value in zip(futures, values):
+            if not future.done():
+                future.set_result(value)
+
+
+# set while a coroutine holds a permit of the session limiter: anything it
+# awaits (nested serializers, resolvers...) must not wait for another permit
+# or we could end up with all the permits held by coroutines waiting for a
+# permit.
+_holding_permit: ContextVar[bool] = ContextVar(
+    "tortoise_serializer_holding_permit", default=False
+)
+
+
+class SerializationSession:
+    """State shared by every serializer involved in the same serialization
+    call, nested serializers included.
+    """
+
+    __slots__ = (
+        "loaders",
+        "max_concurrency",
+        "limiter",
+        "memo",
+        "cached",
+        "identity_map",
+        "tree_parents",
+        "tree_walked",
+        "truncated",
+        "listing",
+        "relation_paths",
+    )
+
+    def __init__(self) -> None:
+        self.loaders: dict[Hashable, BatchLoader] = {}
+        # `memoize` cache: values of sync resolvers, futures of async ones
+        self.memo: dict[Hashable, Any] = {}
+        # output cache lookups already made for a whole list: cache key ->
+        # cached fields, None for the misses
+        self.cached: dict[str, dict[str, Any] | None] = {}
+        # related rows serialized so far: see `Serializer._from_identity_map`
+        self.identity_map: dict[Hashable, asyncio.Future] = {}
+        # recursive relations loaded level by level, see
+        # `Serializer._get_tree_level`: instance id -> parent instance,
+        # (instance id, field name) already walked and the ones not to load
+        self.tree_parents: dict[int, Model] = {}
+        self.tree_walked: set[tuple[int, str]] = set()
+        self.truncated: set[tuple[int, str]] = set()
+        # whether the session serializes a list (lazy fetches are N+1
+        # queries then) and the path of the nested serializers in the queryset, see
+        # `strict_mode`
+        self.listing = False
+        self.relation_paths: dict[type, str] = {}
+        self.max_concurrency: int | None = None
+        self.limiter: asyncio.Semaphore | None = None
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """Bound how many resolvers and queries are in flight at the same
+        time for the whole session. The rows themselves all start at once:
+        bounding them would split the batches of the `BatchLoader`s."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        self.max_concurrency = max_concurrency
+        self.limiter = asyncio.Semaphore(max_concurrency)
+
+    async def run_limited(self, awaitable: Awaitable[T]) -> T:
+        """Await `awaitable` once a permit of the limiter is available"""
+        if self.limiter is None or _holding_permit.get():
+            return await awaitable
+        async with self.limiter:
+            token = _holding_permit.set(True)
+            try:
+                return await awaitable
+            finally:
+                _holding_permit.reset(token)
+
+    def get_loader(
+        self, key: Hashable, batch_fn: BatchFunction
+    ) -> BatchLoader:
+        """Return the loader registered for `key`, creates it with `batch_fn`
+        if needed"""
+        loader = self.loaders.get(key)
+        if loader is None:
+            loader = self.loaders[key] = BatchLoader(batch_fn)
+        return loader
+
+
+def get_context_key(context: ContextType) -> Hashable:
+    """Return a key identifying `context` in the session caches"""
+    try:
+        hash(context)
+    except TypeError:
+        # unhashable values in the context: it's the same object for the
+        # whole serialization anyway
+        return id(context)
+    return context
+
+
+_current_session: ContextVar[SerializationSession | None] = ContextVar(
+    "tortoise_serializer_session", default=None
+)
+
+
+def get_session() -> SerializationSession | None:
+    """Return the session of the current serialization, if any"""
+    return _current_session.get()
+
+
+@contextmanager
+def serialization_session() -> Generator[SerializationSession, None, None]:
+    """Enter the current serialization session or start a new one"""
+    session = _current_session.get()
+    if session is not None:
+        yield session
+        return
+    session = SerializationSession()
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
@@ -0,0 +1,136 @@
+import os
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Generator, Literal, Sequence, get_args
+
+from tortoise_serializer.exceptions import (
+    TortoiseSerializerLazyFetchException,
+)
+
+StrictMode = Literal["warn", "raise", "record"]
+
+# default mode of the whole process, `strict_mode` and `Serializer.strict`
+# take precedence
+STRICT_MODE_ENV = "TORTOISE_SERIALIZER_STRICT"
+
+
+class LazyFetchWarning(UserWarning):
+    """A relation was fetched lazily while `strict_mode` is "warn" """
+
+
+@dataclass(frozen=True, slots=True)
+class LazyFetch:
+    """A query made by the serialization to load relations that were not
+    prefetched
+
+    Attributes:
+        serializer: the serializer that needed the relations
+        relations: names of the relations on the serializer's model
+        prefetch_paths: what to give to `prefetch_related` on the serialized
+            queryset to avoid the query
+        instances_count: how many instances the query loaded them for
+    """
+
+    serializer: type
+    relations: tuple[str, ...]
+    prefetch_paths: tuple[str, ...]
+    instances_count: int
+
+    def describe(self) -> str:
+        paths = ", ".join(repr(path) for path in self.prefetch_paths)
+        return (
+            f"{self.serializer.__qualname__} fetched {', '.join(self.relations)}"
+            f" lazily for {self.instances_count} instance(s), prefetch it "
+            f"with prefetch_related({paths}) or from_queryset(..., "
+            "prefetch=True)"
+        )
+
+
+@dataclass(slots=True)
+class LazyFetchReport:
+    """Lazy fetches seen by a `strict_mode` block (or the whole process
+    when enabled by the environment or a class flag)"""
+
+    fetches: list[LazyFetch] = field(default_factory=list)
+    # (serializer, relation) already warned about
+    warned: set[tuple[type, str]] = field(default_factory=set)
+
+    @property
+    def prefetch_paths(self) -> list[str]:
+        """All the prefetch paths that would have avoided the fetches"""
+        return sorted(
+            {path for fetch in self.fetches for path in fetch.prefetch_paths}
+        )
+
+
+_strict_mode: ContextVar[tuple[StrictMode, LazyFetchReport] | None] = (
+    ContextVar("tortoise_serializer_strict_mode", default=None)
+)
+_process_report = LazyFetchReport()
+
+
+@contextmanager
+def strict_mode(
+    mode: StrictMode = "raise",
+) -> Generator[LazyFetchReport, None, None]:
+    """Flag the relations fetched lazily while serializing lists
+    (`from_queryset`, `from_tortoise_instances`) in this block: warn once
+    per serializer and relation, raise a
+    `TortoiseSerializerLazyFetchException` or only record them in the
+    yielded report.
+    """
+    if mode not in get_args(StrictMode):
+        raise ValueError(f"Invalid strict mode: {mode}")
+    report = LazyFetchReport()
+    token = _strict_mode.set((mode, report))
+    try:
+        yield report
+    finally:
+        _strict_mode.reset(token)
+
+
+def get_lazy_fetch_report() -> LazyFetchReport:
+    """Return the report of the lazy fetches recorded outside of any
+    `strict_mode` block"""
+    return _process_report
+
+
+def report_lazy_fetch(
+    serializer: type,
+    relations: Sequence[str],
+    path: str,
+    instances_count: int,
+) -> None:
+    """Apply the strict mode in effect for `serializer` to a lazy fetch of
+    `relations`, `path` being where the serializer sits in the serialized
+    queryset (`""` for the root)"""
+    current = _strict_mode.get()
+    if current is not None:
+        mode, report = current
+    else:
+        mode = getattr(serializer, "strict", None) or os.environ.get(
+            STRICT_MODE_ENV
+        )
+        report = _process_report
+    if mode not in get_args(StrictMode):
+        return
+
+    prefix = f"{path}__" if path else ""
+    fetch = LazyFetch(
+        serializer=serializer,
+        relations=tuple(relations),
+        prefetch_paths=tuple(prefix + relation for relation in relations),
+        instances_count=instances_count,
+    )
+    if mode == "raise":
+        raise TortoiseSerializerLazyFetchException(fetch)
+    if mode == "record":
+        report.fetches.append(fetch)
+        return
+    keys = {(serializer, relation) for relation in relations}
+    if keys <= report.warned:
+        return
+    report.warned.update(keys)
+    warnings.warn(fetch.describe(), LazyFetchWarning, stacklevel=2)
@@ -0,0 +1,190 @@
+"""Helpers to assert how many queries a serialization runs
+
+from tortoise_serializer.testing import assert_max_queries
+
+async def test_list_books():
+    with assert_max_queries(2):
+        await BookSerializer.from_queryset(Book.all(), prefetch=True)
+"""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Generator
+
+from tortoise import connections
+
+# every method a tortoise client runs SQL through
+QUERY_METHODS = (
+    "execute_query",
+    "execute_query_dict",
+    "execute_insert",
+    "execute_many",
+    "execute_script",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedQuery:
+    """A query run while capturing
+
+    Attributes:
+        sql: the query
+        values: its parameters (a list of them for `execute_many`)
+        method: the client method that ran it (`execute_query`...)
+    """
+
+    sql: str
+    values: Any
+    method: str
+
+    def __str__(self) -> str:
+        return self.sql
+
+
+@dataclass(slots=True)
+class QueryCapture:
+    """Queries run through a connection inside a `capture_queries` block"""
+
+    connection_name: str
+    queries: list[CapturedQuery] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def __iter__(self):
+        return iter(self.queries)
+
+    def __getitem__(self, index: int) -> CapturedQuery:
+        return self.queries[index]
+
+    @property
+    def sql(self) -> list[str]:
+        return [query.sql for query in self.queries]
+
+    def clear(self) -> None:
+        self.queries.clear()
+
+    def describe(self) -> str:
+        return "\n".join(
+            f"{index}. {query.sql}"
+            for index, query in enumerate(self.queries, start=1)
+        )
+
+
+# captures of the current context: queries run by other tasks (another
+# test, a background job...) are not attributed to the block
+_captures: ContextVar[tuple[QueryCapture, ...]] = ContextVar(
+    "tortoise_serializer_query_captures", default=()
+)
+# set while a captured method runs: a client method calling another one must
+# count as a single query
+_capturing: ContextVar[bool] = ContextVar(
+    "tortoise_serializer_capturing_query", default=False
+)
+# (client class, method name) -> original method, with how many blocks use
+# the patch
+_patched: dict[tuple[type, str], Callable[..., Awaitable[Any]]] = {}
+_patch_users = 0
+
+
+def _capturing_method(
+    method_name: str, method: Callable[..., Awaitable[Any]]
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(method)
+    async def wrapper(client, query: str, *args: Any, **kwargs: Any) -> Any:
+        captures = _captures.get()
+        if not captures or _capturing.get():
+            return await method(client, query, *args, **kwargs)
+        values = args[0] if args else kwargs.get("values")
+        for capture in captures:
+            if capture.connection_name == client.connection_name:
+                capture.queries.append(
+                    CapturedQuery(sql=query, values=values, method=method_name)
+                )
+        token = _capturing.set(True)
+        try:
+            return await method(client, query, *args, **kwargs)
+        finally:
+            _capturing.reset(token)
+
+    return wrapper
+
+
+def _get_client_classes(client_class: type) -> list[type]:
+    """Return `client_class` and its subclasses: the transaction wrappers
+    are clients of their own"""
+    classes = [client_class]
+    for subclass in client_class.__subclasses__():
+        classes.extend(_get_client_classes(subclass))
+    return classes
+
+
+def _patch(client_class: type) -> None:
+    for cls in _get_client_classes(client_class):
+        for method_name in QUERY_METHODS:
+            method = cls.__dict__.get(method_name)
+            if method is None or (cls, method_name) in _patched:
+                continue
+            _patched[(cls, method_name)] = method
+            setattr(cls, method_name, _capturing_method(method_name, method))
+
+
+def _unpatch() -> None:
+    for (cls, method_name), method in _patched.items():
+        setattr(cls, method_name, method)
+    _patched.clear()
+
+
+@contextmanager
+def capture_queries(
+    connection_name: str = "default",
+) -> Generator[QueryCapture, None, None]:
+    """Capture the queries run through the connection `connection_name`
+    (transactions on it included) by the current task and the tasks it
+    starts inside the block.
+    """
+    global _patch_users
+
+    capture = QueryCapture(connection_name)
+    _patch(type(connections.get(connection_name)))
+    _patch_users += 1
+    token = _captures.set((*_captures.get(), capture))
+    try:
+        yield capture
+    finally:
+        _captures.reset(token)
+        _patch_users -= 1
+        if not _patch_users:
+            _unpatch()
+
+
+@contextmanager
+def assert_max_queries(
+    count: int, connection_name: str = "default"
+) -> Generator[QueryCapture, None, None]:
+    """Fail with an `AssertionError` listing the queries if the block runs
+    more than `count` queries"""
+    with capture_queries(connection_name) as capture:
+        yield capture
+    if len(capture) > count:
+        raise AssertionError(
+            f"{len(capture)} queries executed, {count} expected at most:\n"
+            + capture.describe()
+        )
+
+
+@contextmanager
+def assert_num_queries(
+    count: int, connection_name: str = "default"
+) -> Generator[QueryCapture, None, None]:
+    """Fail with an `AssertionError` listing the queries if the block does
+    not run exactly `count` queries"""
+    with capture_queries(connection_name) as capture:
+        yield capture
+    if len(capture) != count:
+        raise AssertionError(
+            f"{len(capture)} queries executed, {count} expected:\n"
+            + capture.describe()
+        )
@@ -5,6 +5,8 @@ from structlog import get_logger
 from tortoise.queryset import QuerySet
 
 from tortoise_serializer.serializers import Serializer
+from tortoise_serializer.session import get_session
+from tortoise_serializer.strict import report_lazy_fetch
 from tortoise_serializer.types import MODEL, T
 
 logger = get_logger()
@@ -56,6 +58,14 @@ def ensure_fetched_fields(
                 if _should_fetch_field(instance, field_name)
             ]
             if fields_to_fetch:
+                session = get_session()
+                if session is not None and session.listing:
+                    report_lazy_fetch(
+                        cls,
+                        fields_to_fetch,
+                        session.relation_paths.get(cls, ""),
+                        1,
+                    )
                 logger.debug(
                     "Fetching related fields",
                     serializer_class=cls,